@@ -0,0 +1,76 @@
+# ai-interview-coach-backend/agents/conversation_context.py
+# Bounded context for next-question generation. The last CONTEXT_WINDOW_TURNS question/answer
+# turns are replayed verbatim; older turns are folded into a rolling summary stored on the
+# interview (context_summary / context_summarized_turns), so the prompt stays roughly the same
+# size however long the interview runs. CONTEXT_WINDOW_TURNS=0 replays the full history.
+import os
+
+CONTEXT_WINDOW_TURNS = int(os.getenv("CONTEXT_WINDOW_TURNS", "4"))
+SUMMARY_MAX_CHARS = int(os.getenv("CONTEXT_SUMMARY_MAX_CHARS", "1500"))
+
+SUMMARY_PREFIX = "Summary of the earlier part of this interview:\n"
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text; good enough for budgeting and logging
+    return (len(text) + 3) // 4
+
+
+def history_tokens(history: list[dict]) -> int:
+    return sum(estimate_tokens(part.get("text", "")) for turn in history for part in turn.get("parts", []))
+
+
+def build_bounded_history(interview_data: dict, latest_answer: str) -> tuple[list[dict], int]:
+    """
+    Chat history for the next question: rolling summary, then the unsummarized turns verbatim,
+    then the current question and the latest answer. Returns (history, verbatim turn count).
+    The questions/answers arrays may start at turn `turn_offset` (only recent turns loaded).
+    """
+    questions = interview_data.get('questions', [])
+    answers = interview_data.get('answers', [])
+    offset = interview_data.get('turn_offset', 0)
+    summary = interview_data.get('context_summary', "")
+    summarized = interview_data.get('context_summarized_turns', 0) if CONTEXT_WINDOW_TURNS > 0 else 0
+    start = max(summarized - offset, 0)
+
+    conversation_history = []
+    if summary and summarized > 0:
+        conversation_history.append({"role": "user", "parts": [{"text": SUMMARY_PREFIX + summary}]})
+    for i in range(start, len(questions)):
+        conversation_history.append({"role": "model", "parts": [{"text": questions[i].get("text", "")}]})
+        if i < len(answers):
+            conversation_history.append({"role": "user", "parts": [{"text": answers[i].get("text", "")}]})
+    conversation_history.append({"role": "user", "parts": [{"text": latest_answer}]})
+    return conversation_history, len(questions) - start
+
+
+def turns_to_fold(interview_data: dict) -> list[tuple[str, str]]:
+    """
+    Answered turns that fall out of the verbatim window once the current answer is saved.
+    Normally one per answer; more if the window was just enabled on a running interview.
+    """
+    if CONTEXT_WINDOW_TURNS <= 0:
+        return []
+    questions = interview_data.get('questions', [])
+    answers = interview_data.get('answers', [])
+    offset = interview_data.get('turn_offset', 0)
+    start = interview_data.get('context_summarized_turns', 0) - offset
+    end = len(answers) + 1 - CONTEXT_WINDOW_TURNS
+    return [
+        (questions[i].get("text", ""), answers[i].get("text", ""))
+        for i in range(max(start, 0), min(end, len(answers), len(questions)))
+    ]
+
+
+def extractive_summary(summary: str, turns: list[tuple[str, str]]) -> str:
+    """Fallback when the summarization call fails: clipped turns appended, oldest text dropped first."""
+    lines = [summary] if summary else []
+    for question, answer in turns:
+        lines.append(f"- Asked: {question[:160]} | Answer: {answer[:240]}")
+    return clip_summary("\n".join(lines))
+
+
+def clip_summary(summary: str) -> str:
+    if len(summary) <= SUMMARY_MAX_CHARS:
+        return summary
+    return "…" + summary[-(SUMMARY_MAX_CHARS - 1):]
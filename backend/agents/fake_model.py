@@ -0,0 +1,130 @@
+# ai-interview-coach-backend/agents/fake_model.py
+# Deterministic stand-in for google.generativeai.GenerativeModel.
+# Selected with LLM_BACKEND=fake; implements the subset of the SDK surface the agent uses,
+# including stream=True responses, so the app can run and be tested without Gemini.
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+
+_TOPICS = [
+    "designing a REST API for a high-traffic service",
+    "debugging a memory leak in production",
+    "choosing between SQL and NoSQL storage",
+    "structuring automated tests for a large codebase",
+    "handling concurrency and race conditions",
+    "optimizing a slow database query",
+    "rolling out a breaking change safely",
+    "caching strategies and cache invalidation",
+]
+
+
+def _digest(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _fake_evaluation(answer: str) -> dict:
+    words = len(answer.split())
+    score = min(10, words // 8)
+    return {
+        "score": score,
+        "reason": f"Fake evaluation based on an answer of {words} words.",
+        "confidence": "Low" if score < 4 else "Medium",
+        "red_flag": "" if words >= 10 else "Answer is very short."
+    }
+
+
+def _fake_text(prompt: str) -> str:
+    if "OUTPUT (valid JSON array only" in prompt:
+        match = re.search(r"ANSWERS \(JSON list\):\n(.*)\n\nOUTPUT", prompt, re.S)
+        items = json.loads(match.group(1)) if match else []
+        return json.dumps([{"index": item["index"], **_fake_evaluation(item["answer"])} for item in items])
+    if "OUTPUT (valid JSON only" in prompt:
+        match = re.search(r"- Candidate's Answer: (.*)\n\nOUTPUT", prompt, re.S)
+        return json.dumps(_fake_evaluation(match.group(1) if match else ""))
+    topic = _TOPICS[_digest(prompt) % len(_TOPICS)]
+    if "Updated summary:" in prompt:
+        return f"Topics covered so far include {topic}; the candidate gave answers of varying depth."
+    if "What is the next question?" in prompt:
+        return f"Can you walk me through your approach to {topic}?"
+    if "First question:" in prompt:
+        return f"Tell me about your experience with {topic}."
+    if "INTERVIEW CONTEXT" in prompt:
+        return (
+            "**Summary of Your Interview Performance**\n"
+            "You completed the interview and engaged with every question.\n\n"
+            "**Your Strengths**\n- Clear communication\n\n"
+            "**Areas You Can Improve**\n- Add concrete examples\n\n"
+            f"**What to Study Next**\n- {topic.capitalize()}\n"
+        )
+    return f"Fake response about {topic}."
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = [self]
+
+
+class FakeStreamingResponse:
+    """Async-iterable response, like the SDK's AsyncGenerateContentResponse with stream=True."""
+
+    def __init__(self, text: str, chunk_words: int, chunk_delay: float):
+        self.text = text
+        self.parts = [self]
+        words = re.findall(r"\S+\s*|\s+", text)
+        self._chunks = ["".join(words[i:i + chunk_words]) for i in range(0, len(words), chunk_words)]
+        self._chunk_delay = chunk_delay
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            if self._chunk_delay:
+                await asyncio.sleep(self._chunk_delay)
+            yield FakeResponse(chunk)
+
+    async def resolve(self):
+        pass
+
+
+class FakeChatSession:
+    def __init__(self, model: "FakeGenerativeModel", history: list[dict] | None):
+        self.model = model
+        self.history = list(history or [])
+
+    def _prompt(self, content: str) -> str:
+        turns = [part.get("text", "") for turn in self.history for part in turn.get("parts", [])]
+        return "\n".join(turns + [content])
+
+    async def send_message_async(self, content: str, stream: bool = False):
+        return await self.model.generate_content_async(self._prompt(content), stream=stream)
+
+
+class FakeGenerativeModel:
+    def __init__(self, latency_ms: float | None = None, chunk_words: int = 3, chunk_delay_ms: float | None = None,
+                 system_instruction: str | None = None):
+        # Kept for parity with the SDK; responses only depend on the per-call prompt
+        self.system_instruction = system_instruction
+        self.latency = (latency_ms if latency_ms is not None else float(os.getenv("FAKE_LLM_LATENCY_MS", "0"))) / 1000
+        self.chunk_delay = (chunk_delay_ms if chunk_delay_ms is not None else float(os.getenv("FAKE_LLM_CHUNK_DELAY_MS", "0"))) / 1000
+        self.chunk_words = chunk_words
+        self.calls = 0
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return FakeResponse(_fake_text(prompt))
+
+    async def generate_content_async(self, prompt: str, stream: bool = False):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        text = _fake_text(prompt)
+        if stream:
+            return FakeStreamingResponse(text, self.chunk_words, self.chunk_delay)
+        return FakeResponse(text)
+
+    def start_chat(self, history: list[dict] | None = None) -> FakeChatSession:
+        return FakeChatSession(self, history)
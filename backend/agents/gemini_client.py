@@ -0,0 +1,215 @@
+# ai-interview-coach-backend/agents/gemini_client.py
+import asyncio
+import contextlib
+import os
+import random
+import time
+
+from google.api_core import exceptions as google_exceptions
+
+from services.metrics import LLM_IN_FLIGHT
+
+
+class GeminiError(Exception):
+    """Base class for Gemini failures that routes turn into HTTP errors."""
+    status_code = 502
+    retry_after: int | None = None
+
+
+class GeminiQuotaExceededError(GeminiError):
+    """Raised when Gemini API quota is exceeded."""
+    status_code = 429
+    retry_after = 30
+
+
+class GeminiUnavailableError(GeminiError):
+    """Raised when Gemini keeps failing with 5xx errors, or the circuit breaker is open."""
+    status_code = 503
+    retry_after = 30
+
+
+class GeminiTimeoutError(GeminiError):
+    """Raised when a Gemini call misses its deadline on every attempt."""
+    status_code = 504
+
+
+class GeminiResponseError(GeminiError):
+    """Raised when Gemini answers but the response has no usable text."""
+    status_code = 502
+
+
+_QUOTA_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+_SERVER_ERRORS = (
+    google_exceptions.InternalServerError,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.BadGateway,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded,
+)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failed calls (retries exhausted) and fails fast until
+    `reset_timeout` has passed; then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "open":
+            raise GeminiUnavailableError("Gemini is temporarily unavailable (circuit open).")
+        if state == "half_open":
+            if self._trial_in_flight:
+                raise GeminiUnavailableError("Gemini is temporarily unavailable (circuit half-open).")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        # A non-retryable error says nothing about API health
+        self._trial_in_flight = False
+
+
+class ResilientGeminiClient:
+    """
+    Single entry point for Gemini calls: a global concurrency cap, a deadline per attempt,
+    jittered exponential backoff on 429/5xx/timeouts and a circuit breaker. Failures surface
+    as GeminiError subclasses instead of being swallowed.
+    """
+
+    def __init__(self, max_concurrency: int = 16, timeout: float = 30, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 8, breaker: CircuitBreaker | None = None):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @staticmethod
+    def _classify(e: Exception) -> GeminiError | None:
+        if isinstance(e, _QUOTA_ERRORS):
+            return GeminiQuotaExceededError(f"Gemini quota exceeded: {e}")
+        if isinstance(e, _SERVER_ERRORS):
+            return GeminiUnavailableError(f"Gemini server error: {e}")
+        if isinstance(e, asyncio.TimeoutError):
+            return GeminiTimeoutError("Gemini call timed out.")
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @contextlib.asynccontextmanager
+    async def _slot(self):
+        async with self._semaphore:
+            with LLM_IN_FLIGHT.track_inprogress():
+                yield
+
+    async def _call(self, fn, timeout: float | None, acquire: bool = True):
+        timeout = timeout or self.timeout
+        # The breaker sees one outcome per logical call, after retries: a single failing request
+        # counts once, and a half-open trial stays the only call in flight while it retries
+        self.breaker.before_call()
+        outcome = None
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    async with (self._slot() if acquire else contextlib.nullcontext()):
+                        result = await asyncio.wait_for(fn(), timeout)
+                except Exception as e:
+                    error = self._classify(e)
+                    if error is None:
+                        raise
+                    if attempt == self.max_retries:
+                        outcome = "failure"
+                        raise error from e
+                    print(f"[WARN] Gemini call failed ({type(e).__name__}), retry {attempt + 1}/{self.max_retries}")
+                    await asyncio.sleep(self._backoff(attempt))
+                else:
+                    outcome = "success"
+                    return result
+        finally:
+            if outcome == "success":
+                self.breaker.record_success()
+            elif outcome == "failure":
+                self.breaker.record_failure()
+            else:
+                # Non-retryable error or cancellation (client disconnect, task.cancel()): says
+                # nothing about API health, but must not leave a half-open trial marked in flight
+                self.breaker.release_trial()
+
+    async def generate(self, model, prompt, timeout: float | None = None):
+        return await self._call(lambda: model.generate_content_async(prompt), timeout)
+
+    async def send_message(self, model, history: list[dict], message, timeout: float | None = None):
+        return await self._call(
+            lambda: model.start_chat(history=history).send_message_async(message), timeout
+        )
+
+    async def stream(self, start_stream, timeout: float | None = None):
+        """
+        Streams text chunks from `start_stream()` (a coroutine returning a streaming response).
+        Retries apply until the stream has started; the deadline applies to every chunk.
+        """
+        timeout = timeout or self.timeout
+        async with self._slot():
+            response = await self._call(start_stream, timeout, acquire=False)
+            iterator = response.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+                except StopAsyncIteration:
+                    return
+                except Exception as e:
+                    error = self._classify(e)
+                    if error is None:
+                        raise
+                    self.breaker.record_failure()
+                    raise error from e
+                yield chunk
+
+
+_client: ResilientGeminiClient | None = None
+
+
+def get_gemini_client() -> ResilientGeminiClient:
+    """Process-wide client, so the concurrency cap and the breaker cover every Gemini call."""
+    global _client
+    if _client is None:
+        _client = ResilientGeminiClient(
+            max_concurrency=int(os.getenv("GEMINI_MAX_CONCURRENCY", "16")),
+            timeout=float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30")),
+            max_retries=int(os.getenv("GEMINI_MAX_RETRIES", "3")),
+            backoff_base=float(os.getenv("GEMINI_BACKOFF_BASE_SECONDS", "0.5")),
+            backoff_max=float(os.getenv("GEMINI_BACKOFF_MAX_SECONDS", "8")),
+            breaker=CircuitBreaker(
+                failure_threshold=int(os.getenv("GEMINI_BREAKER_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("GEMINI_BREAKER_RESET_SECONDS", "30")),
+            ),
+        )
+    return _client
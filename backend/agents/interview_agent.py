@@ -1,20 +1,91 @@
+import asyncio
 import os
-from dotenv import load_dotenv
-import google.generativeai as genai
 import json
 import re
+import hashlib
+from services.eval_cache import get_eval_cache
+from agents.prescorer import prescore_answer
+from services.metrics import EVAL_PARSE_FAILURES, observe_llm_call, observe_llm_stream, record_llm_io
+from services.tracing import set_span_attrs, traced
+from agents.prompts import (
+    BATCH_EVALUATION,
+    CONTEXT_SUMMARY,
+    EVALUATION,
+    FIRST_QUESTION,
+    NEXT_QUESTION,
+    OVERALL_FEEDBACK,
+    SCORING_RUBRIC_V1,
+    TEMPLATES,
+    PromptTemplate
+)
+from agents.conversation_context import (
+    SUMMARY_MAX_CHARS,
+    clip_summary,
+    estimate_tokens,
+    extractive_summary,
+    turns_to_fold
+)
+from agents.gemini_client import (
+    get_gemini_client,
+    GeminiError,
+    GeminiResponseError
+)
+
+MODEL_NAME = "gemini-2.0-flash"
+
+USE_FAKE_MODEL = os.getenv("LLM_BACKEND", "gemini") == "fake"
+
+_genai = None
+
+
+def _get_genai():
+    # google.generativeai is slow to import; it is loaded and configured on first use
+    # (normally by the startup warm-up in services/lifecycle.py, off the request path)
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        _genai = genai
+    return _genai
+
+
+# One model per prompt template, with the template's static instructions set once as the
+# system instruction; each call only sends the rendered per-call fields.
+_models: dict[str, object] = {}
 
-load_dotenv()
 
-# Load API key properly
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+def get_model(template: PromptTemplate):
+    model = _models.get(template.name)
+    if model is None:
+        if USE_FAKE_MODEL:
+            # Deterministic stand-in for local runs and tests
+            from agents.fake_model import FakeGenerativeModel
+            model = FakeGenerativeModel(system_instruction=template.system)
+        else:
+            model = _get_genai().GenerativeModel(MODEL_NAME, system_instruction=template.system)
+        _models[template.name] = model
+    return model
+
+
+def warm_models() -> None:
+    """Build every per-template model ahead of the first request; blocking, run it in a thread."""
+    for template in TEMPLATES.values():
+        get_model(template)
+
+
+NEXT_QUESTION_FALLBACK = "Failed to generate the next question. Please try again later."
 
-# Instantiate the model correctly
-model = genai.GenerativeModel("gemini-2.0-flash")
 
-class GeminiQuotaExceededError(Exception):
-    """Raised when Gemini API quota is exceeded."""
-    pass
+def evaluation_failure(e: Exception) -> dict:
+    return {
+        "score": 0,
+        "reason": f"Evaluation failed: {e}",
+        "confidence": "Low",
+        "red_flag": "Internal error occurred."
+    }
+
+
+EXTRACT_FAILED_TEXT = "Failed to extract valid response text from Gemini."
 
 
 # Extract text helper
@@ -26,44 +97,115 @@ def extract_text_from_response(response) -> str:
             return response.parts[0].text.strip()
     except Exception as e:
         print(f"[ERROR] extract_text_from_response failed: {e}")
-    return "Failed to extract valid response text from Gemini."
+    return EXTRACT_FAILED_TEXT
 
 
 #Generate first question
+@traced("llm.generate_first_question")
+@observe_llm_call("generate_first_question")
 async def generate_first_question(role: str, experience: str) -> str:
-    prompt = (
-        f"You are an AI Interview Coach specializing in {role} roles. "
-        f"The candidate has {experience} of experience. "
-        "Start the interview by asking a relevant first question. "
-        "Keep the question concise and professional. Do not include any greetings or conversational fillers, just the question itself. "
-        "Example: Tell me about your experience with Python development. "
-        f"Candidate: {role}, Experience: {experience}. "
-        "First question:"
-    )
+    prompt = FIRST_QUESTION.render(role=role, experience=experience)
     try:
-        response = await model.generate_content_async(prompt)
-        return extract_text_from_response(response)
+        response = await get_gemini_client().generate(get_model(FIRST_QUESTION), prompt)
+        text = extract_text_from_response(response)
+        record_llm_io("generate_first_question", len(FIRST_QUESTION.system) + len(prompt), text)
+        return text
+    except GeminiError:
+        raise
     except Exception as e:
         print(f"[ERROR] generate_first_question failed: {e}")
         return "Failed to generate the first question. Please try again later."
 
 
 # Generate next question
+def _next_question_message(role: str, experience: str) -> str:
+    return NEXT_QUESTION.render(role=role, experience=experience)
+
+
+def _history_chars(conversation_history: list[dict]) -> int:
+    return sum(len(part.get("text", "")) for turn in conversation_history for part in turn.get("parts", []))
+
+
+@traced("llm.generate_next_question")
+@observe_llm_call("generate_next_question")
 async def generate_next_question(role: str, experience: str, conversation_history: list[dict]) -> str:
-    instruction = (
-        f"You are an AI Interview Coach specializing in {role} roles. "
-        f"The candidate has {experience} of experience. "
-        "Based on the conversation so far, ask a relevant and challenging next question. "
-        "Do not greet the candidate or provide any feedback on their previous answer. "
-        "Just ask the next question directly. If the interview seems complete, ask a concluding question or suggest ending."
-    )
+    message = _next_question_message(role, experience)
     try:
-        chat = model.start_chat(history=conversation_history)
-        response = await chat.send_message_async(instruction + "\n\nWhat is the next question?")
-        return extract_text_from_response(response)
+        response = await get_gemini_client().send_message(get_model(NEXT_QUESTION), conversation_history, message)
+        text = extract_text_from_response(response)
+        record_llm_io("generate_next_question", len(NEXT_QUESTION.system) + _history_chars(conversation_history) + len(message), text)
+        return text
+    except GeminiError:
+        raise
     except Exception as e:
         print(f"[ERROR] generate_next_question failed: {e}")
-        return "Failed to generate the next question. Please try again later."
+        return NEXT_QUESTION_FALLBACK
+
+
+async def _stream_text(response):
+    async for chunk in response:
+        try:
+            text = chunk.text
+        except Exception:
+            # Chunks without text parts (e.g. safety metadata only)
+            continue
+        if text:
+            yield text
+
+
+# Streaming variant: yields text chunks as Gemini produces them.
+# Joining the chunks and stripping gives the same text as generate_next_question.
+@observe_llm_stream("stream_next_question")
+async def stream_next_question(role: str, experience: str, conversation_history: list[dict]):
+    message = _next_question_message(role, experience)
+    record_llm_io("stream_next_question", len(NEXT_QUESTION.system) + _history_chars(conversation_history) + len(message))
+    response = get_gemini_client().stream(
+        lambda: get_model(NEXT_QUESTION).start_chat(history=conversation_history).send_message_async(message, stream=True)
+    )
+    async for text in _stream_text(response):
+        yield text
+
+
+# Rolling summary of the turns that leave the verbatim context window
+def _summary_prompt(role: str, experience: str, summary: str, turns: list[tuple[str, str]]) -> str:
+    exchanges = "\n".join(f"Q: {question}\nA: {answer}" for question, answer in turns)
+    return CONTEXT_SUMMARY.render(
+        role=role,
+        experience=experience,
+        max_words=SUMMARY_MAX_CHARS // 6,
+        summary=summary or "(none)",
+        exchanges=exchanges
+    )
+
+
+@traced("llm.update_context_summary")
+@observe_llm_call("update_context_summary")
+async def update_context_summary(role: str, experience: str, interview_data: dict) -> dict:
+    """
+    Folds turns leaving the context window into the stored summary. Returns the interview
+    updates to save with the turn, or {} when nothing needs folding. Never raises: the
+    summary is only context, so failures fall back to a clipped extractive summary.
+    """
+    turns = turns_to_fold(interview_data)
+    if not turns:
+        return {}
+    summary = interview_data.get('context_summary', "")
+    prompt = _summary_prompt(role, experience, summary, turns)
+    set_span_attrs(prompt_tokens_estimated=estimate_tokens(CONTEXT_SUMMARY.system + prompt), folded_turns=len(turns))
+    try:
+        response = await get_gemini_client().generate(get_model(CONTEXT_SUMMARY), prompt)
+        text = extract_text_from_response(response)
+        record_llm_io("update_context_summary", len(CONTEXT_SUMMARY.system) + len(prompt), text)
+        if text == EXTRACT_FAILED_TEXT:
+            raise ValueError("empty summary response")
+        new_summary = clip_summary(text)
+    except Exception as e:
+        print(f"[WARN] update_context_summary failed, using extractive summary: {e}")
+        new_summary = extractive_summary(summary, turns)
+    return {
+        "context_summary": new_summary,
+        "context_summarized_turns": interview_data.get('context_summarized_turns', 0) + len(turns)
+    }
 
 
 # ✅ Evaluate candidate's answer
@@ -73,109 +215,172 @@ def clean_json_block(text: str) -> str:
         text = text.replace("```", "").strip()
     return text
 
-# === SCORING RUBRIC (for versioning and future A/B testing) ===
-SCORING_RUBRIC_V1 = {
-    0: "Invalid / Copy-paste / Gibberish / Off-topic",
-    1: "Extremely poor understanding or no structure",
-    2: "Extremely poor understanding or no structure",
-    3: "Extremely poor understanding or no structure",
-    4: "Some relevance, lacks depth, major missing points",
-    5: "Some relevance, lacks depth, major missing points",
-    6: "Mostly correct with minor gaps or shallow explanations",
-    7: "Mostly correct with minor gaps or shallow explanations",
-    8: "Strong, clear answer with good structure, few small misses",
-    9: "Strong, clear answer with good structure, few small misses",
-    10: "Perfect, complete, well-structured and insightful answer"
-}
-
-# === SYSTEM PROMPT FOR STRICT, GUARDED EVALUATION (UPDATED WITH CONFIDENCE & ANTI-HALLUCINATION RULES) ===
-STRICT_SYSTEM_PROMPT = (
-    "You are an AI Interview Evaluator. Your job is to score technical answers (0–10 scale) using a strict, standardized rubric. "
-    "You must provide accurate, fair, and explainable feedback.\n\n"
-    "Your evaluation must avoid hallucination, be grounded only in the content of the answer, and must follow the definitions below.\n\n"
-    "---\n\n"
-    "Scoring Rubric Definitions:\n"
-    "- 0 – Invalid / Irrelevant: Copied from question, Gibberish, Off-topic, Very short (under 10 words), No attempt to solve or address the question\n"
-    "- 1 to 3 – Poor Answer: Lacks technical accuracy or understanding, Vague/generic, Missing key concepts, Just buzzwords\n"
-    "- 4 to 5 – Shallow / Basic: Correct ideas but little detail, Misses edge cases, Poor structure, Uses terms but no explanation\n"
-    "- 6 to 7 – Mostly Correct: Technically correct, Minor inaccuracies, Lacks depth/examples, Not fully structured\n"
-    "- 8 to 9 – Strong: Technically sound, Good depth/clarity, Well-structured, Uses examples, Minor polish issues\n"
-    "- 10 – Excellent/Expert: Complete, deep, clearly structured, Anticipates trade-offs, Demonstrates expertise, Explains with examples\n\n"
-    "---\n\n"
-    "Validation Rules:\n"
-    "- If the answer is 80%+ similar to the question → score = 0\n"
-    "- If irrelevant or off-topic → score = 0\n"
-    "- If answer is too short (e.g., 'This is useful in frontend') → score = 1\n\n"
-    "---\n\n"
-    "Confidence Level Rules:\n"
-    "- High: Answer is clearly relevant, technically correct, and well structured. AI detects 2 or more specific technical concepts used correctly. The structure is logical and shows applied understanding.\n"
-    "- Medium: Answer is mostly relevant and partially correct. May lack full depth or structure. At least 1 valid concept or keyword is used correctly.\n"
-    "- Low: Answer is vague, generic, off-topic, copied, or very short. AI cannot verify if the user truly understands the concept. No clear examples or reasoning are given.\n"
-    "Never output 'High Confidence' if the answer is under 15 words or too generic.\n\n"
-    "---\n\n"
-    "ANTI-HALLUCINATION RULES:\n"
-    "- Only evaluate based on the user's actual answer text.\n"
-    "- Do not assume intent or infer unstated details.\n"
-    "- If uncertain, lower the confidence or score accordingly.\n"
-    "- Do not fabricate technologies, tools, projects, or explanations not explicitly mentioned.\n"
-    "- Avoid over-praising or making assumptions about user expertise.\n"
-    "- Never guess what the user *meant* — only respond to what they *said*.\n\n"
-    "---\n\n"
-    "Required Output:\n"
-    "1. Score (0–10): Strictly follow rubric\n"
-    "2. Reason for Score: Explain in ≤ 120 words\n"
-    "3. Confidence Level: Low | Medium | High\n"
-    "4. Red Flag Note (if any): Note if user copied question, gave generic buzzwords, or was off-topic\n\n"
-    "You must be consistent across all responses. Do not guess user intent. Do not reward fluff. Focus on clarity, correctness, and completeness."
-)
+# === RUBRIC VERSION: changes whenever the rubric, an evaluation template or the model changes ===
+# Single and batch evaluations share the evaluation cache, so both templates are part of it
+RUBRIC_VERSION = "v1-" + hashlib.sha256(
+    (json.dumps(SCORING_RUBRIC_V1, sort_keys=True) + EVALUATION.version + BATCH_EVALUATION.version + MODEL_NAME).encode("utf-8")
+).hexdigest()[:12]
+
+def _prescore(question: str, answer: str) -> dict | None:
+    if os.getenv("PRESCORER_ENABLED", "true").lower() == "false":
+        return None
+    return prescore_answer(question, answer)
+
 
 # === MAIN EVALUATION FUNCTION WITH STRICT RUBRIC AND GUARDRAILS (UPDATED) ===
+@traced("llm.evaluate_answer")
+@observe_llm_call("evaluate_answer")
 async def evaluate_answer(role: str, experience: str, question: str, answer: str) -> dict:
-    prompt = f"""
-{STRICT_SYSTEM_PROMPT}
-
-INPUT:
-- Role: {role}
-- Experience: {experience}
-- Question: {question}
-- Candidate's Answer: {answer}
-
-OUTPUT (valid JSON only, no markdown):
-{{
-  "score": <integer 0-10>,
-  "reason": "<≤120 words explanation for the score>",
-  "confidence": "Low|Medium|High",
-  "red_flag": "<note if copied, generic, or off-topic, else empty>"
-}}
-"""
+    # Empty, copied, gibberish and too-short answers are scored locally by the same rubric rules
+    prescored = _prescore(question, answer)
+    if prescored is not None:
+        return prescored
+
+    # Byte-identical inputs under the same rubric get the same evaluation without a Gemini call
+    eval_cache = get_eval_cache(RUBRIC_VERSION)
+    cache_key = None
+    if eval_cache is not None:
+        cache_key = eval_cache.make_key(role, experience, question, answer)
+        cached = await eval_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    prompt = EVALUATION.render(role=role, experience=experience, question=question, answer=answer)
+    text = ""
     try:
-        response = await model.generate_content_async(prompt)
+        response = await get_gemini_client().generate(get_model(EVALUATION), prompt)
         text = extract_text_from_response(response)
+        record_llm_io("evaluate_answer", len(EVALUATION.system) + len(prompt), text)
         cleaned_text = clean_json_block(text)
         feedback_dict = json.loads(cleaned_text)
         feedback_dict['score'] = int(feedback_dict.get('score', 0))
+        # Only well-formed model evaluations are cached, never the error fallbacks below
+        if cache_key is not None:
+            await eval_cache.put(cache_key, feedback_dict)
         return feedback_dict
     except json.JSONDecodeError as jde:
         print(f"[ERROR] JSON parsing failed: {jde} | Response: {text}")
+        EVAL_PARSE_FAILURES.inc()
         return {
             "score": 0,
             "reason": "Invalid response format from Gemini.",
             "confidence": "Low",
             "red_flag": "Invalid response format."
         }
+    except GeminiError:
+        raise
     except Exception as e:
         print(f"[ERROR] evaluate_answer failed: {e}")
-        return {
-            "score": 0,
-            "reason": f"Evaluation failed: {e}",
-            "confidence": "Low",
-            "red_flag": "Internal error occurred."
-        }
+        return evaluation_failure(e)
 
-def generate_overall_feedback(interview_data: dict) -> str:
-    if not interview_data.get("questions"):
-        return "No questions were answered during this interview."
+# === BATCH EVALUATION (deferred evaluation mode) ===
+# Limits per batch call; larger transcripts are split into several calls that run concurrently
+BATCH_EVAL_MAX_ITEMS = int(os.getenv("BATCH_EVAL_MAX_ITEMS", "10"))
+BATCH_EVAL_MAX_CHARS = int(os.getenv("BATCH_EVAL_MAX_CHARS", "24000"))
+
+
+def _batch_chunks(items: list[dict]) -> list[list[dict]]:
+    chunks, current, size = [], [], 0
+    for item in items:
+        item_size = len(item["question"]) + len(item["answer"])
+        if current and (len(current) >= BATCH_EVAL_MAX_ITEMS or size + item_size > BATCH_EVAL_MAX_CHARS):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += item_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _parse_batch_evaluations(text: str, indexes: set[int]) -> dict[int, dict]:
+    """Well-formed evaluations by input index; malformed or unknown entries are dropped."""
+    parsed = json.loads(clean_json_block(text))
+    if not isinstance(parsed, list):
+        raise json.JSONDecodeError("expected a JSON array", text, 0)
+    evaluations = {}
+    for entry in parsed:
+        try:
+            index = int(entry["index"])
+            evaluation = {
+                "score": int(entry.get("score", 0)),
+                "reason": entry.get("reason", ""),
+                "confidence": entry.get("confidence", "Low"),
+                "red_flag": entry.get("red_flag", "")
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+        if index in indexes:
+            evaluations[index] = evaluation
+    return evaluations
+
+
+@traced("llm.evaluate_answers_batch")
+@observe_llm_call("evaluate_answers_batch")
+async def _evaluate_chunk(role: str, experience: str, chunk: list[dict]) -> dict[int, dict]:
+    prompt = BATCH_EVALUATION.render(
+        role=role,
+        experience=experience,
+        answers=json.dumps(chunk, ensure_ascii=False, indent=1)
+    )
+    response = await get_gemini_client().generate(get_model(BATCH_EVALUATION), prompt)
+    text = extract_text_from_response(response)
+    record_llm_io("evaluate_answers_batch", len(BATCH_EVALUATION.system) + len(prompt), text)
+    try:
+        return _parse_batch_evaluations(text, {item["index"] for item in chunk})
+    except json.JSONDecodeError as jde:
+        print(f"[ERROR] Batch JSON parsing failed: {jde} | Response: {text}")
+        EVAL_PARSE_FAILURES.inc()
+        return {}
+
+
+async def evaluate_answers_batch(role: str, experience: str, answers: list[tuple[str, str]]) -> list[dict]:
+    """
+    Evaluations for (question, answer) pairs, in order, using as few Gemini calls as possible:
+    prescored and cached answers are resolved locally, the rest are scored in chunked batch
+    calls. Answers a batch response leaves out fall back to evaluate_answer one by one.
+    """
+    results: list[dict | None] = [None] * len(answers)
+    eval_cache = get_eval_cache(RUBRIC_VERSION)
+    cache_keys: dict[int, str] = {}
+    pending = []
+    for i, (question, answer) in enumerate(answers):
+        results[i] = _prescore(question, answer)
+        if results[i] is not None:
+            continue
+        if eval_cache is not None:
+            cache_keys[i] = eval_cache.make_key(role, experience, question, answer)
+            results[i] = await eval_cache.get(cache_keys[i])
+            if results[i] is not None:
+                continue
+        pending.append({"index": i, "question": question, "answer": answer})
+
+    if pending:
+        chunks = _batch_chunks(pending)
+        # Answers left for Gemini after prescoring and the cache, and the batch calls they took
+        set_span_attrs(llm_answers=len(pending), llm_calls=len(chunks))
+        for evaluations in await asyncio.gather(*(_evaluate_chunk(role, experience, chunk) for chunk in chunks)):
+            for i, evaluation in evaluations.items():
+                results[i] = evaluation
+                if i in cache_keys:
+                    await eval_cache.put(cache_keys[i], evaluation)
 
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        print(f"[WARN] Batch evaluation returned no result for {len(missing)} answer(s); evaluating them one by one")
+        fallbacks = await asyncio.gather(*(evaluate_answer(role, experience, *answers[i]) for i in missing))
+        for i, evaluation in zip(missing, fallbacks):
+            results[i] = evaluation
+    return results
+
+
+# The long markdown report needs a longer deadline than the other calls
+FEEDBACK_TIMEOUT = float(os.getenv("GEMINI_FEEDBACK_TIMEOUT_SECONDS", "90"))
+
+NO_ANSWERS_FEEDBACK = "No questions were answered during this interview."
+
+
+def build_overall_feedback_prompt(interview_data: dict) -> str:
     # Build a transcript for the AI to reference
     transcript = []
     per_question_scores_md = []
@@ -198,43 +403,49 @@ def generate_overall_feedback(interview_data: dict) -> str:
     scores = [qa.get('score') for qa in interview_data.get('questions', []) if qa.get('score') is not None]
     avg_score = round(sum(scores) / len(scores), 1) if scores else 0.0
 
-    prompt = f"""
-You are an AI Interview Coach. Your job is to help candidates learn and grow after a technical interview. Your feedback should be supportive, educational, and motivating—like a mentor or coach, not a hiring manager.
-
-Strictly base your feedback only on the actual answers and feedback provided below. Do not make assumptions or hallucinate details. If an answer was blank or invalid, mention it supportively and encourage the candidate to answer fully next time.
-
----
-
-INTERVIEW CONTEXT:
-Role: {interview_data.get('role', 'N/A')}
-Experience: {interview_data.get('experience', 'N/A')}
-
-TRANSCRIPT:
-{chr(10).join(transcript)}
-
----
-
-Please provide a markdown-formatted summary with the following sections:
+    return OVERALL_FEEDBACK.render(
+        role=interview_data.get('role', 'N/A'),
+        experience=interview_data.get('experience', 'N/A'),
+        transcript=chr(10).join(transcript),
+        avg_score=avg_score,
+        per_question_scores=chr(10).join(per_question_scores_md)
+    )
 
-**Summary of Your Interview Performance** (brief, encouraging tone)
-**Your Strengths**
-**Areas You Can Improve**
-**What to Study Next**
-**Final Score: {avg_score}/10** (based on accuracy, depth, clarity)
-**Confidence in Feedback: High / Medium / Low**
-**Recommended Next Steps** (study topics, practice tips)
 
-**Per-Question Scores:**
-{chr(10).join(per_question_scores_md)}
+@traced("llm.generate_overall_feedback")
+@observe_llm_call("generate_overall_feedback")
+async def generate_overall_feedback(interview_data: dict) -> str:
+    if not interview_data.get("questions"):
+        return NO_ANSWERS_FEEDBACK
 
-- Do NOT use language about hiring, rejection, or job decisions.
-- Do NOT invent strengths/weaknesses not present in the answers.
-- If the first answer was blank or invalid, say: "The first answer didn't provide enough information to assess your understanding. Make sure to write clearly and completely."
-- Be positive, actionable, and focused on learning.
-"""
+    prompt = build_overall_feedback_prompt(interview_data)
     try:
-        response = model.generate_content(prompt)
-        return extract_text_from_response(response)
+        response = await get_gemini_client().generate(get_model(OVERALL_FEEDBACK), prompt, timeout=FEEDBACK_TIMEOUT)
+        text = extract_text_from_response(response)
+        record_llm_io("generate_overall_feedback", len(OVERALL_FEEDBACK.system) + len(prompt), text)
+    except GeminiError:
+        raise
     except Exception as e:
         print(f"[ERROR] generate_overall_feedback failed: {e}")
-        return "Failed to generate overall feedback due to an internal error."
+        raise GeminiResponseError("Failed to generate overall feedback.") from e
+    # Raised rather than returned: feedback is stored with its transcript hash and served from
+    # then on, so a failure text would replace the real report for good
+    if text == EXTRACT_FAILED_TEXT:
+        raise GeminiResponseError("Gemini returned no overall feedback text.")
+    return text
+
+
+# Streaming variant of generate_overall_feedback
+@observe_llm_stream("stream_overall_feedback")
+async def stream_overall_feedback(interview_data: dict):
+    if not interview_data.get("questions"):
+        yield NO_ANSWERS_FEEDBACK
+        return
+
+    prompt = build_overall_feedback_prompt(interview_data)
+    record_llm_io("stream_overall_feedback", len(OVERALL_FEEDBACK.system) + len(prompt))
+    response = get_gemini_client().stream(
+        lambda: get_model(OVERALL_FEEDBACK).generate_content_async(prompt, stream=True), timeout=FEEDBACK_TIMEOUT
+    )
+    async for text in _stream_text(response):
+        yield text
@@ -0,0 +1,96 @@
+# ai-interview-coach-backend/agents/prescorer.py
+# Local pre-scoring for answers the strict rubric scores without any judgement:
+# empty / "n/a", copied from the question, gibberish and too short.
+# Everything else returns None and goes to Gemini.
+import math
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+
+NON_ANSWERS = {
+    "", "n/a", "na", "none", "nil", "null", "-", "--", ".", "?", "skip", "pass",
+    "idk", "i dont know", "i don't know", "no idea", "not sure", "no answer", "nothing",
+}
+COPY_SIMILARITY = 0.8
+MIN_WORDS = 10
+# Gibberish thresholds are deliberately conservative: a false positive costs a real score
+MIN_LETTERS_FOR_GIBBERISH = 20
+MIN_ENTROPY_BITS = 2.6
+MIN_VOWEL_RATIO = 0.15
+MAX_VOWEL_RATIO = 0.75
+MIN_ALPHA_RATIO = 0.4
+# The letter heuristics (vowels, entropy, word count) only hold for Latin-script English;
+# answers in other scripts always go to the model
+MIN_ASCII_LETTER_RATIO = 0.9
+
+_WORD_RE = re.compile(r"[\w']+", re.UNICODE)
+_VOWELS = set("aeiouy")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def char_entropy(text: str) -> float:
+    """Shannon entropy (bits per character) of the letters in `text`."""
+    letters = [c for c in text.lower() if c.isalpha()]
+    if not letters:
+        return 0.0
+    total = len(letters)
+    return -sum((n / total) * math.log2(n / total) for n in Counter(letters).values())
+
+
+def _result(score: int, reason: str, red_flag: str) -> dict:
+    return {"score": score, "reason": reason, "confidence": "Low", "red_flag": red_flag, "prescored": True}
+
+
+def is_mostly_ascii_letters(answer: str) -> bool:
+    letters = [c for c in answer if c.isalpha()]
+    return bool(letters) and sum(c.isascii() for c in letters) / len(letters) >= MIN_ASCII_LETTER_RATIO
+
+
+def is_gibberish(answer: str) -> bool:
+    compact = "".join(answer.split())
+    if compact and not any(c.isalnum() for c in compact):
+        return True  # punctuation / symbols only
+    letters = [c for c in compact.lower() if c.isalpha()]
+    if len(letters) < MIN_LETTERS_FOR_GIBBERISH or not is_mostly_ascii_letters(compact):
+        return False
+    if len(letters) / len(compact) < MIN_ALPHA_RATIO:
+        return True
+    vowel_ratio = sum(c in _VOWELS for c in letters) / len(letters)
+    if vowel_ratio < MIN_VOWEL_RATIO or vowel_ratio > MAX_VOWEL_RATIO:
+        return True
+    return char_entropy(answer) < MIN_ENTROPY_BITS
+
+
+def prescore_answer(question: str, answer: str) -> dict | None:
+    """Rubric-conformant evaluation for trivially invalid answers, or None if the model is needed."""
+    normalized_answer = _normalize(answer or "")
+    if normalized_answer in NON_ANSWERS or (answer or "").strip().lower() in NON_ANSWERS:
+        return _result(0, "No answer was provided for this question.", "No answer provided.")
+
+    normalized_question = _normalize(question or "")
+    if normalized_question:
+        matcher = SequenceMatcher(None, normalized_question, normalized_answer, autojunk=False)
+        # quick_ratio() is a cheap upper bound; only pay for ratio() when it could pass the threshold
+        similarity = matcher.ratio() if matcher.quick_ratio() >= COPY_SIMILARITY else 0.0
+        if similarity >= COPY_SIMILARITY:
+            return _result(
+                0,
+                f"The answer is {round(similarity * 100)}% similar to the question, so it does not address it.",
+                "Answer copied from the question."
+            )
+
+    if is_gibberish(answer):
+        return _result(0, "The answer does not contain meaningful text.", "Gibberish answer.")
+
+    word_count = len(answer.split())
+    # Scripts written without spaces (CJK) would always count as one word
+    if word_count < MIN_WORDS and is_mostly_ascii_letters(answer):
+        return _result(
+            1,
+            f"The answer is too short ({word_count} words) to demonstrate understanding of the question.",
+            "Answer is too short."
+        )
+    return None
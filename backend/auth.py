@@ -1,14 +1,14 @@
 # ai-interview-coach-backend/auth.py
-import firebase_admin
-from firebase_admin import auth, credentials, firestore
 from fastapi import HTTPException, status, Depends, APIRouter
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import asyncio
 import os
-from dotenv import load_dotenv
 from pydantic import BaseModel
-
-# Load environment variables
-load_dotenv()
+from services.token_cache import get_token_cache
+from services.token_verifier import get_token_verifier
+from services.repository import get_repository
+from services.firebase_app import ensure_firebase_app
+from services.tracing import span
 
 # Define the auth router
 auth_router = APIRouter(
@@ -16,35 +16,30 @@ auth_router = APIRouter(
     tags=["Authentication"]
 )
 
-# ✅ Firebase Initialization (only once)
-if not firebase_admin._apps:
-    service_account_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY_PATH")
-    if not service_account_path or not os.path.exists(service_account_path):
-        raise FileNotFoundError(
-            f"Firebase service account key file not found at {service_account_path}. "
-            "Please ensure FIREBASE_SERVICE_ACCOUNT_KEY_PATH is set correctly in your .env file."
-        )
-    cred = credentials.Certificate(service_account_path)
-    firebase_admin.initialize_app(cred)
-    print("✅ Firebase Admin SDK initialized successfully.")
-
-# Get Firestore client
-db = firestore.client()
-
 #HTTPBearer
 bearer_scheme = HTTPBearer()
 
 # Extract and verify Firebase token from Bearer
 async def get_current_user_data(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
     token = credentials.credentials
-    try:
-        decoded_token = auth.verify_id_token(token)
-        return decoded_token
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Invalid or expired authentication token. Error: {e}"
-        )
+    token_cache = get_token_cache()
+    # Cache lookup plus, on a miss, signature verification; token_cache_hit tells them apart in traces
+    with span("auth") as auth_span:
+        cached_token = token_cache.get(token)
+        if auth_span is not None:
+            auth_span.attrs["token_cache_hit"] = cached_token is not None
+        if cached_token is not None:
+            return cached_token
+        try:
+            decoded_token = await get_token_verifier().verify(token)
+            # Cache until the token's own expiry so later calls in the session skip re-verification
+            token_cache.put(token, decoded_token)
+            return decoded_token
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Invalid or expired authentication token. Error: {e}"
+            )
 
 #Used in frontend to verify token after Firebase login
 class Token(BaseModel):
@@ -53,21 +48,15 @@ class Token(BaseModel):
 @auth_router.post("/verify-token")
 async def verify_token(token: Token):
     try:
-        decoded_token = auth.verify_id_token(token.idToken)
+        decoded_token = await get_token_verifier().verify(token.idToken)
+        get_token_cache().put(token.idToken, decoded_token)
         uid = decoded_token['uid']
         email = decoded_token.get('email')
 
         # Check or create user profile
-        user_ref = db.collection('users').document(uid)
-        user_doc = user_ref.get()
-
-        if not user_doc.exists:
-            user_ref.set({
-                "uid": uid,
-                "email": email,
-                "display_name": decoded_token.get('name'),
-                "created_at": firestore.SERVER_TIMESTAMP
-            })
+        repo = get_repository()
+        if await repo.get_user(uid) is None:
+            await repo.create_user(uid, email, decoded_token.get('name'))
             print(f"✅ New user profile created for UID: {uid}")
 
         return {"uid": uid, "email": email, "message": "Token verified successfully"}
@@ -85,19 +74,15 @@ class UserCreate(BaseModel):
 @auth_router.post("/signup")
 async def signup_user(user_data: UserCreate):
     try:
-        user = auth.create_user(email=user_data.email, password=user_data.password)
+        ensure_firebase_app()
+        from firebase_admin import auth
+        user = await asyncio.to_thread(auth.create_user, email=user_data.email, password=user_data.password)
         uid = user.uid
         email = user.email
         display_name = user_data.display_name or None
 
         # Create Firestore profile
-        user_ref = db.collection('users').document(uid)
-        user_ref.set({
-            "uid": uid,
-            "email": email,
-            "display_name": display_name,
-            "created_at": firestore.SERVER_TIMESTAMP
-        })
+        await get_repository().create_user(uid, email, display_name)
 
         return {"uid": uid, "email": email, "message": "User created successfully"}
     except Exception as e:
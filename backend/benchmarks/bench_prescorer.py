@@ -0,0 +1,50 @@
+# ai-interview-coach-backend/benchmarks/bench_prescorer.py
+# Checks the local pre-scorer against the labelled regression set and measures per-answer cost.
+#
+#   python -m benchmarks.bench_prescorer [--iterations 2000]
+#
+# "expected" in tests/prescorer_cases.json is the score the strict rubric (and the model) gives,
+# or null for answers that must be left to the model. Exits non-zero on any disagreement.
+import argparse
+import json
+import os
+import sys
+import time
+
+from agents.prescorer import prescore_answer
+
+CASES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "prescorer_cases.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-scorer regression check and benchmark.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(CASES_PATH, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+
+    failures = 0
+    for case in cases:
+        result = prescore_answer(case["question"], case["answer"])
+        got = result["score"] if result is not None else None
+        if got != case["expected"]:
+            failures += 1
+            print(f"[MISMATCH] expected={case['expected']} got={got} answer={case['answer'][:60]!r}")
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        for case in cases:
+            prescore_answer(case["question"], case["answer"])
+    elapsed = time.perf_counter() - start
+    per_answer_us = elapsed / (args.iterations * len(cases)) * 1e6
+
+    claimed = sum(1 for c in cases if c["expected"] is not None)
+    print(f"cases: {len(cases)} ({claimed} short-circuited, {len(cases) - claimed} sent to the model)")
+    print(f"agreement: {len(cases) - failures}/{len(cases)}")
+    print(f"per-answer cost: {per_answer_us:.1f} µs")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# ai-interview-coach-backend/benchmarks/cold_start.py
+# Cold-start timings, each measured in a fresh interpreter:
+#
+#   import        time to `import main`
+#   first 200     process spawn -> first 200 from GET / under uvicorn
+#   first api 200 process spawn -> first 200 from an authenticated API route
+#
+#   python -m benchmarks.cold_start [--runs 5] [--top-imports 15] [--configured]
+#
+# By default the in-memory, fake-LLM and local-auth backends are used so the numbers are
+# about this process, not Firebase or Gemini; --configured keeps the environment (.env) as is.
+# --top-imports lists the slowest modules from `python -X importtime`.
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCAL_ENV = {"STORAGE_BACKEND": "memory", "LLM_BACKEND": "fake", "AUTH_BACKEND": "local", "TRACE_EXPORTER": "none"}
+API_PATH = "/user/dashboard/cold-start-user"
+API_HEADERS = {"Authorization": "Bearer cold-start-user:cold@local.test"}
+
+
+def _env(configured: bool) -> dict:
+    env = dict(os.environ)
+    if not configured:
+        env.update(LOCAL_ENV)
+    return env
+
+
+def measure_import(env: dict) -> float:
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1]) * 1000
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_200(url: str, start: float, headers: dict | None = None, timeout: float = 60) -> float:
+    while time.perf_counter() - start < timeout:
+        try:
+            if httpx.get(url, headers=headers, timeout=5).status_code == 200:
+                return (time.perf_counter() - start) * 1000
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"No 200 from {url} within {timeout}s")
+
+
+def measure_first_200(env: dict) -> tuple[float, float]:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        first = _wait_for_200(base + "/", start)
+        first_api = _wait_for_200(base + API_PATH, start, headers=API_HEADERS)
+        return first, first_api
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def top_imports(env: dict, n: int) -> list[tuple[float, str]]:
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                         cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]) / 1000, parts[2].rstrip()))
+    # Modules imported directly by main and its siblings; deeper imports are indented further
+    direct = [(ms, name.strip()) for ms, name in rows if len(name) - len(name.lstrip()) == 3]
+    return sorted(direct, reverse=True)[:n]
+
+
+def _summary(values: list[float]) -> str:
+    return f"median {statistics.median(values):8.1f}  min {min(values):8.1f}  max {max(values):8.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time and time to first 200 of a fresh process.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top-imports", type=int, default=0)
+    parser.add_argument("--configured", action="store_true", help="use the configured backends instead of the local ones")
+    args = parser.parse_args()
+    env = _env(args.configured)
+
+    imports, firsts, first_apis = [], [], []
+    for _ in range(args.runs):
+        imports.append(measure_import(env))
+        first, first_api = measure_first_200(env)
+        firsts.append(first)
+        first_apis.append(first_api)
+
+    print(f"{args.runs} runs, {'configured' if args.configured else 'local'} backends  (ms)")
+    print(f"{'import main':<16}{_summary(imports)}")
+    print(f"{'first 200':<16}{_summary(firsts)}")
+    print(f"{'first api 200':<16}{_summary(first_apis)}")
+    if args.top_imports:
+        print("\nSlowest top-level imports (cumulative ms):")
+        for ms, name in top_imports(env, args.top_imports):
+            print(f"{ms:10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# ai-interview-coach-backend/benchmarks/local_flow.py
+# Drives full interview sessions (start -> answer x N -> end -> overall-feedback -> dashboard)
+# through the real app with the in-memory backends, so the request path itself can be
+# measured and profiled without Firebase or Gemini.
+#
+#   python -m benchmarks.local_flow [--sessions 200] [--concurrency 20] [--questions 5]
+#                                   [--evaluation-mode per_answer|deferred]
+#
+# FAKE_LLM_LATENCY_MS and MEMORY_STORAGE_LATENCY_MS add simulated round-trip time.
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ["STORAGE_BACKEND"] = "memory"
+os.environ["LLM_BACKEND"] = "fake"
+os.environ["AUTH_BACKEND"] = "local"
+
+import httpx  # noqa: E402
+
+from agents import interview_agent  # noqa: E402
+from main import app  # noqa: E402
+
+ANSWER = (
+    "I would start by profiling the slow path, then add an index on the filtered columns, "
+    "cache the hot reads with a short TTL and measure p95 latency before and after the change."
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_session(client: httpx.AsyncClient, n: int, questions: int, evaluation_mode: str, latencies: dict) -> None:
+    headers = {"Authorization": f"Bearer bench-user-{n}:bench{n}@local.test"}
+
+    async def call(name: str, path: str, payload: dict | None = None, method: str = "POST"):
+        start = time.perf_counter()
+        response = await client.request(method, path, json=payload, headers=headers)
+        latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        return response.json()
+
+    started = await call("start", "/start", {
+        "role": "Backend Developer", "experience": "Mid", "num_questions": questions, "evaluation_mode": evaluation_mode
+    })
+    interview_id = started["interview_id"]
+    question = started["first_question"]
+    for _ in range(questions):
+        result = await call("answer", "/answer", {
+            "interview_id": interview_id, "question_text": question, "answer_text": ANSWER
+        })
+        question = result.get("next_question")
+        if not question:
+            break
+    await call("end", "/end", {"interview_id": interview_id})
+    await call("overall_feedback", "/overall-feedback", {"interview_id": interview_id})
+    await call("dashboard", f"/user/dashboard/bench-user-{n}", method="GET")
+
+
+async def run(sessions: int, concurrency: int, questions: int, evaluation_mode: str) -> None:
+    latencies: dict[str, list[float]] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def bounded(n: int):
+        nonlocal failures
+        async with semaphore:
+            try:
+                await run_session(client, n, questions, evaluation_mode, latencies)
+            except Exception as e:
+                failures += 1
+                print(f"[ERROR] session {n}: {e}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(bounded(n) for n in range(sessions)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{sessions} sessions ({failures} failed), concurrency {concurrency}, {questions} questions each, {evaluation_mode} evaluation")
+    print(f"elapsed {elapsed:.2f}s  ->  {sessions / elapsed:.1f} sessions/s")
+    llm_calls = {name: model.calls for name, model in interview_agent._models.items()}
+    print(f"LLM calls: {sum(llm_calls.values())} ({sum(llm_calls.values()) / sessions:.1f} per session) {llm_calls}")
+    print(f"{'endpoint':<18}{'count':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for name, values in latencies.items():
+        print(
+            f"{name:<18}{len(values):>7}{statistics.fmean(values):>9.2f}"
+            f"{percentile(values, 50):>9.2f}{percentile(values, 95):>9.2f}{percentile(values, 99):>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end interview flow against in-memory backends.")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--evaluation-mode", choices=["per_answer", "deferred"], default="per_answer")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.concurrency, args.questions, args.evaluation_mode))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# ai-interview-coach-backend/benchmarks/prompt_size_report.py
+# Offline prompt-size report: renders every prompt template for one simulated interview and
+# splits each call into the static system instruction (set once on the per-purpose model) and
+# the dynamic per-call content. No model is called.
+#
+#   python -m benchmarks.prompt_size_report [--questions 5] [--answer-words 80]
+#
+# "static" is what moved out of the per-call prompt. The API still sends the system instruction
+# with each request, so it is only billed less where the provider caches that prefix; what
+# always goes away is rebuilding it per call. Conversation history for the next-question call
+# is the same under both layouts and is not counted.
+import argparse
+import os
+
+os.environ.setdefault("LLM_BACKEND", "fake")
+
+from agents.conversation_context import CONTEXT_WINDOW_TURNS, estimate_tokens  # noqa: E402
+from agents.interview_agent import (  # noqa: E402
+    _next_question_message,
+    _summary_prompt,
+    build_overall_feedback_prompt
+)
+from agents.prompts import (  # noqa: E402
+    CONTEXT_SUMMARY,
+    EVALUATION,
+    FIRST_QUESTION,
+    NEXT_QUESTION,
+    OVERALL_FEEDBACK,
+    TEMPLATE_VERSIONS
+)
+
+ROLE = "Backend Engineer"
+EXPERIENCE = "3 years"
+
+
+def simulated_calls(questions: int, answer_words: int) -> list[tuple[object, str]]:
+    """(template, rendered user prompt) for every model call of one interview."""
+    answer = " ".join(["word"] * answer_words)
+    question = "Can you walk me through your approach to caching strategies and cache invalidation?"
+    calls = [(FIRST_QUESTION, FIRST_QUESTION.render(role=ROLE, experience=EXPERIENCE))]
+    folded = 0
+    for i in range(questions):
+        calls.append((EVALUATION, EVALUATION.render(role=ROLE, experience=EXPERIENCE, question=question, answer=answer)))
+        if i == questions - 1:
+            break
+        calls.append((NEXT_QUESTION, _next_question_message(ROLE, EXPERIENCE)))
+        answered = i + 1
+        if CONTEXT_WINDOW_TURNS and answered > CONTEXT_WINDOW_TURNS:
+            turns = [(question, answer)] * (answered - CONTEXT_WINDOW_TURNS - folded)
+            folded = answered - CONTEXT_WINDOW_TURNS
+            calls.append((CONTEXT_SUMMARY, _summary_prompt(ROLE, EXPERIENCE, "Topics covered so far.", turns)))
+    interview = {
+        "role": ROLE,
+        "experience": EXPERIENCE,
+        "questions": [
+            {"question": question, "user_answer": answer, "score": 6, "score_reason": "Mostly correct."}
+        ] * questions
+    }
+    calls.append((OVERALL_FEEDBACK, build_overall_feedback_prompt(interview)))
+    return calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prompt sizes per simulated interview")
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--answer-words", type=int, default=80)
+    args = parser.parse_args()
+
+    rows: dict[str, dict] = {}
+    for template, prompt in simulated_calls(args.questions, args.answer_words):
+        row = rows.setdefault(template.name, {"calls": 0, "static": 0, "dynamic": 0, "static_tokens": 0, "dynamic_tokens": 0})
+        row["calls"] += 1
+        row["static"] += len(template.system.encode("utf-8"))
+        row["dynamic"] += len(prompt.encode("utf-8"))
+        row["static_tokens"] += estimate_tokens(template.system)
+        row["dynamic_tokens"] += estimate_tokens(prompt)
+
+    print(f"Interview with {args.questions} questions, {args.answer_words}-word answers\n")
+    print(f"{'template':<18}{'version':<14}{'calls':>6}{'static B':>11}{'dynamic B':>11}{'~static tok':>13}{'~dynamic tok':>14}")
+    for name, row in rows.items():
+        print(
+            f"{name:<18}{TEMPLATE_VERSIONS[name]:<14}{row['calls']:>6}{row['static']:>11}{row['dynamic']:>11}"
+            f"{row['static_tokens']:>13}{row['dynamic_tokens']:>14}"
+        )
+    totals = {key: sum(row[key] for row in rows.values()) for key in ("static", "dynamic", "static_tokens", "dynamic_tokens")}
+    total = totals["static"] + totals["dynamic"]
+    print(
+        f"\nPer interview: {total} B (~{totals['static_tokens'] + totals['dynamic_tokens']} tokens), of which "
+        f"{totals['static']} B (~{totals['static_tokens']} tokens, {totals['static'] / total:.0%}) is static "
+        f"system instruction that is no longer rebuilt into each per-call prompt."
+    )
+
+
+if __name__ == "__main__":
+    main()
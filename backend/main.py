@@ -1,19 +1,42 @@
-from fastapi import FastAPI
+
+# Environment first: modules read their settings from it when they are imported
+from dotenv import load_dotenv, find_dotenv
+load_dotenv(find_dotenv(".env"))
+
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
 from routes.user import router as user_router
 from routes.interview import router as interview_router
 from fastapi.middleware.cors import CORSMiddleware
 from auth import auth_router  # Corrected
-from dotenv import load_dotenv, find_dotenv
 from routes.dashboard import router as dashboard_router
 from routes.recent_interviews import router as recent_interviews_router
+from agents.gemini_client import GeminiError
+from services.compression import CompressionMiddleware
+from services.lifecycle import shutdown, startup
+from services.session_cache import SessionWriteError
+from services.metrics import HTTP_IN_FLIGHT, HTTP_LATENCY, HTTP_REQUESTS, render_metrics
+from services.tracing import export_trace, finish_trace, start_trace
 import os
+import time
 
 # ✅ ADDED for Swagger Customization
 from fastapi.openapi.utils import get_openapi
 
-load_dotenv(find_dotenv(".env"))
+# Heavy clients (Firestore, Firebase auth, Gemini) are created lazily; startup only schedules
+# their warm-up in the background, so the server accepts connections right away
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup_task = await startup()
+    yield
+    await shutdown(warmup_task)
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+# Innermost middleware: compresses complete JSON bodies (gzip, or brotli when installed);
+# streaming responses pass through untouched
+app.add_middleware(CompressionMiddleware)
 
 FRONT_END_API = os.getenv("FRONT_END_API")
 FRONT_END_LOCAL = os.getenv("FRONT_END_LOCAL")
@@ -29,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Idempotent-Replayed", "ETag"],
 )
 
 #ADDED: Custom OpenAPI for Bearer token in Swagger UI
@@ -55,6 +79,65 @@ def custom_openapi():
     return app.openapi_schema
 
 app.openapi = custom_openapi  #HOOK custom Swagger
+
+# Gemini quota / outage / timeout errors map to 429 / 503 / 504 instead of a generic 500
+@app.exception_handler(GeminiError)
+async def gemini_error_handler(request: Request, exc: GeminiError):
+    headers = {"Retry-After": str(exc.retry_after)} if exc.retry_after else None
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)}, headers=headers)
+
+# Turns a write-behind write couldn't save yet: retryable, the next attempt writes them again
+@app.exception_handler(SessionWriteError)
+async def session_write_error_handler(request: Request, exc: SessionWriteError):
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)},
+                        headers={"Retry-After": str(exc.retry_after)})
+
+# Per-route request metrics, labelled by route template (not raw path) to bound cardinality
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    status_code = 500
+    with HTTP_IN_FLIGHT.labels(request.method).track_inprogress():
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            HTTP_LATENCY.labels(request.method, route_path).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(request.method, route_path, str(status_code)).inc()
+
+# Per-request trace: nested spans from auth, Firestore and Gemini become a Server-Timing
+# header (visible in browser devtools) and a structured trace for the configured exporter
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    trace, token = start_trace(request.method, request.url.path)
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        finish_trace(trace, token)
+        route = request.scope.get("route")
+        if route is not None:
+            trace.root.name = f"{request.method} {route.path}"
+        trace.root.attrs["http.status_code"] = status_code
+        export_trace(trace)
+    existing = response.headers.get("Server-Timing")
+    timing = trace.server_timing()
+    response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+    # Cross-origin pages only see Server-Timing when the origin is allowed to
+    origin = request.headers.get("origin")
+    if origin and origin in origins:
+        response.headers["Timing-Allow-Origin"] = origin
+    return response
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
 #Include routers
 app.include_router(auth_router)
 app.include_router(user_router, prefix="/user")
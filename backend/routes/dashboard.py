@@ -1,179 +1,102 @@
-from fastapi import APIRouter, HTTPException
-from firebase_admin import firestore  # Using firebase_admin since your code uses it
+from fastapi import APIRouter, HTTPException, Query
+from services.dashboard_stats import format_percentiles, format_stats
+from services.repository import InvalidCursorError, get_repository
 
 router = APIRouter()
-db = firestore.client()
+
+
+def format_date(created_at) -> str:
+    # Format date properly
+    if created_at:
+        if hasattr(created_at, 'isoformat'):
+            # Firestore timestamp
+            return created_at.isoformat()
+        elif isinstance(created_at, str):
+            # Already a string
+            return created_at
+        return str(created_at)
+    return "Unknown"
+
 
 @router.get("/dashboard/{uid}")
-async def get_dashboard_data(uid: str):
+async def get_dashboard_data(uid: str, limit: int = Query(20, ge=1, le=100), cursor: str | None = None):
     try:
+        repo = get_repository()
         # Fetch user document
-        user_ref = db.collection("users").document(uid)
-        user_doc = user_ref.get()
-        if not user_doc.exists:
+        user_data = await repo.get_user(uid)
+        if user_data is None:
             raise HTTPException(status_code=404, detail="User not found")
 
-        user_data = user_doc.to_dict()
         name = user_data.get("display_name", "User")
 
-        # Fetch completed interview documents for this user
-        # First get all interviews for the user, then filter and sort in Python to avoid index requirements
-        interviews_query = db.collection("interviews").where("user_uid", "==", uid)
-        interviews = interviews_query.stream()
+        # Totals come from the incrementally maintained stats document (one read).
+        # Read it first: building a missing record also backfills each interview's score_summary.
+        raw_stats = await repo.get_user_stats(uid)
+        stats = format_stats(raw_stats)
+        # Rank against the published population snapshot (cached in-process, no per-request aggregation)
+        percentiles = format_percentiles(raw_stats, await repo.get_score_snapshot())
 
-        interview_list = []
-        total_score = 0
-        total_max_score = 0
-        best_percentage = 0.0
-        count = 0
-
-        for interview in interviews:
-            i = interview.to_dict()
-            
-            # Only process completed interviews (is_active == False)
-            if i.get("is_active", True):
-                continue
-            
-            # Calculate score from evaluation data
-            evaluations = i.get("evaluation", [])
-            interview_score = 0
-            interview_max = len(evaluations) * 10
-            for eval_item in evaluations:
-                score_val = eval_item.get("score")
-                if isinstance(score_val, (int, float)):
-                    interview_score += score_val
-                else:
-                    try:
-                        interview_score += int(score_val)
-                    except (ValueError, TypeError):
-                        continue
-            
-            # Avoid division by zero
-            interview_percentage = (interview_score / interview_max * 100) if interview_max > 0 else 0.0
-            if interview_percentage > best_percentage:
-                best_percentage = interview_percentage
-            total_score += interview_score
-            total_max_score += interview_max
-            
-            # Get interview details
-            num_questions = len(i.get("questions", []))
-            num_answers = len(i.get("answers", []))
-            
-            # Format date properly
+        # Completed interviews, newest first, filtered/ordered/paged by Firestore
+        interviews, next_cursor = await repo.list_completed_interviews(uid, limit, cursor)
+
+        recent_interviews = []
+        for i in interviews:
+            summary = i.get("score_summary") or {}
+            interview_score = summary.get("total_score", 0)
+            interview_max = summary.get("max_score", 0)
             created_at = i.get("created_at")
-            if created_at:
-                if hasattr(created_at, 'isoformat'):
-                    # Firestore timestamp
-                    date_str = created_at.isoformat()
-                elif isinstance(created_at, str):
-                    # Already a string
-                    date_str = created_at
-                else:
-                    date_str = str(created_at)
-            else:
-                date_str = "Unknown"
-            
-            interview_data = {
-                "id": interview.id,
+
+            recent_interviews.append({
+                "id": i["id"],
                 "title": i.get("role", "Developer"),
-                "date": date_str,
+                "date": format_date(created_at),
                 "progress": f"{interview_score}/{interview_max}",
                 "score": interview_score,
                 "role": i.get("role", "Developer"),
                 "experience": i.get("experience", ""),
                 "ended_at": i.get("ended_at", ""),
-                "created_at": created_at  # Keep for sorting
-            }
-            
-            interview_list.append(interview_data)
-            count += 1
-            print(f"total_interviews: {count}")
-
-        # Sort by creation date (newest first) and get all interviews
-        interview_list.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        recent_interviews = interview_list  # Return all, not just first 3
-
-        average_percentage = round((total_score / total_max_score * 100), 1) if total_max_score > 0 else 0.0
-        best_percentage = round(best_percentage, 1)
+                "created_at": created_at
+            })
 
         return {
             "name": name,
-            "total_interviews": count,
-            "average_score": average_percentage,
-            "best_score": best_percentage,
-            "recent_interviews": recent_interviews
+            **stats,
+            "percentiles": percentiles,
+            "recent_interviews": recent_interviews,
+            "next_cursor": next_cursor
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error in dashboard endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/all-interviews/{uid}")
-async def get_all_interviews(uid: str):
+async def get_all_interviews(uid: str, limit: int = Query(20, ge=1, le=100), cursor: str | None = None):
     try:
-        # Fetch all interviews for the user, then filter and sort in Python
-        interviews_query = db.collection("interviews").where("user_uid", "==", uid)
-        interviews = interviews_query.stream()
-        
+        interviews, next_cursor = await get_repository().list_completed_interviews(uid, limit, cursor)
+
         interview_list = []
-        for interview in interviews:
-            i = interview.to_dict()
-            
-            # Only process completed interviews (is_active == False)
-            if i.get("is_active", True):
-                continue
-            
-            # Calculate score from evaluation data
-            evaluations = i.get("evaluation", [])
-            if evaluations:
-                scores = []
-                for eval_item in evaluations:
-                    feedback = eval_item.get("feedback", {})
-                    if isinstance(feedback, dict) and "score" in feedback:
-                        try:
-                            score_val = int(feedback["score"])
-                            scores.append(score_val)
-                        except (ValueError, TypeError):
-                            continue
-                
-                if scores:
-                    score = int(sum(scores) / len(scores))
-                else:
-                    score = 0
-            else:
-                score = 0
-            
-            num_questions = len(i.get("questions", []))
-            num_answers = len(i.get("answers", []))
-            
-            # Format date properly
+        for i in interviews:
+            summary = i.get("score_summary") or {}
             created_at = i.get("created_at")
-            if created_at:
-                if hasattr(created_at, 'isoformat'):
-                    date_str = created_at.isoformat()
-                elif isinstance(created_at, str):
-                    date_str = created_at
-                else:
-                    date_str = str(created_at)
-            else:
-                date_str = "Unknown"
-            
+
             interview_list.append({
-                "id": interview.id,
+                "id": i["id"],
                 "title": i.get("role", "Developer"),
-                "date": date_str,
-                "progress": f"{num_answers}/{num_questions} questions completed",
-                "score": score,
+                "date": format_date(created_at),
+                "progress": f"{summary.get('answer_count', 0)}/{summary.get('question_count', 0)} questions completed",
+                "score": int(summary.get("average_score", 0)),
                 "role": i.get("role", "Developer"),
                 "experience": i.get("experience", ""),
                 "ended_at": i.get("ended_at", ""),
-                "created_at": created_at  # Keep for sorting
+                "created_at": created_at
             })
-        
-        # Sort by creation date (newest first)
-        interview_list.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        return {"all_interviews": interview_list}
+
+        return {"all_interviews": interview_list, "next_cursor": next_cursor}
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error in all-interviews endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,167 +1,549 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Literal
 from agents.interview_agent import (
     generate_first_question,
     generate_next_question,
+    stream_next_question,
     evaluate_answer,
+    evaluate_answers_batch,
     generate_overall_feedback,
-    GeminiQuotaExceededError
+    stream_overall_feedback,
+    evaluation_failure,
+    update_context_summary,
+    NEXT_QUESTION_FALLBACK,
+    EXTRACT_FAILED_TEXT,
+    GeminiError,
+    GeminiResponseError
 )
-from firebase_admin import firestore
+from agents.conversation_context import CONTEXT_WINDOW_TURNS, build_bounded_history, history_tokens
+from services.firebase_app import firestore
 import asyncio
+import hashlib
+import json
+import os
 from auth import get_current_user_data
+from services.repository import InterviewExistsError, get_repository
+from services.interview_turns import (
+    TurnConflictError,
+    assemble_interview,
+    build_turn,
+    header_updates_for_evaluations,
+    header_updates_for_turn,
+    is_deferred,
+    is_turn_schema,
+    new_interview_fields
+)
+from services.dashboard_stats import summarize_interview
+from services.single_flight import SingleFlight
+from services.question_pool import get_first_question_pool
+from services.metrics import record_cache
+from services.idempotency import IdempotencyKeyReusedError, IdempotencyStore, get_idempotency_store
+from services.session_cache import SessionWriteError, get_session_cache
+from services.tracing import set_span_attrs, span
 from datetime import datetime
 import re
 
-db = firestore.client()
 router = APIRouter(prefix="/interview", tags=["Interview Flow"])
 
+# Concurrent overall-feedback requests for the same transcript share one generation
+_feedback_flights = SingleFlight()
+# ...and concurrent scoring of the same interview's deferred evaluations one batch
+_deferred_flights = SingleFlight()
+
+# Upper bounds on interview length and answer size
+MAX_QUESTIONS = int(os.getenv("INTERVIEW_MAX_QUESTIONS", "20"))
+MAX_ANSWER_CHARS = int(os.getenv("INTERVIEW_MAX_ANSWER_CHARS", "5000"))
+
 class InterviewRequest(BaseModel):
     role: str
     experience: str
-    num_questions: int
+    num_questions: int = Field(ge=1, le=MAX_QUESTIONS)
+    # "deferred": answers are not scored one by one; all of them are scored in batch
+    # calls when the overall feedback is requested
+    evaluation_mode: Literal["per_answer", "deferred"] = "per_answer"
 
 class AnswerRequest(BaseModel):
     interview_id: str
     question_text: str
-    answer_text: str
+    answer_text: str = Field(max_length=MAX_ANSWER_CHARS)
+
+async def _idempotent(route: str, idempotency_key: str | None, user_uid: str, payload: dict,
+                      response: Response, fn):
+    """
+    Runs `fn` once per Idempotency-Key: retries get the stored response (marked with
+    Idempotent-Replayed), and retries that arrive mid-flight wait for the first execution.
+    """
+    if not idempotency_key:
+        return await fn()
+    if len(idempotency_key) > 255:
+        raise HTTPException(status_code=400, detail="Idempotency-Key must be at most 255 characters.")
+    try:
+        result, replayed = await get_idempotency_store().run(f"{user_uid}:{route}", idempotency_key, payload, fn)
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
 
 @router.post('/start')
-async def start_interview(data: InterviewRequest, user_data: dict = Depends(get_current_user_data)):
+async def start_interview(data: InterviewRequest, response: Response,
+                          user_data: dict = Depends(get_current_user_data),
+                          idempotency_key: str | None = Header(default=None, alias="Idempotency-Key")):
+    """
+    Starts an interview and ends any interview the user still has open.
+
+    With an `Idempotency-Key` header, a retry with the same key and body gets the original
+    response (marked `Idempotent-Replayed: true`) and does not deactivate the interview the first
+    attempt created. The key is stored with that interview, so this also holds when the retry
+    reaches a different instance.
+    """
+    if idempotency_key and len(idempotency_key) <= 255:
+        replay = await _replay_start(user_data['uid'], idempotency_key, data)
+        if replay is not None:
+            response.headers["Idempotent-Replayed"] = "true"
+            return replay
+    return await _idempotent("start", idempotency_key, user_data['uid'], data.model_dump(), response,
+                             lambda: _start_interview(data, user_data, idempotency_key))
+
+
+def _start_interview_id(user_uid: str, idempotency_key: str) -> str:
+    # Derived from the key: a retry on any instance finds, or collides with, the first attempt's interview
+    return hashlib.sha256(f"{user_uid}\nstart\n{idempotency_key}".encode("utf-8")).hexdigest()[:20]
+
+
+async def _replay_start(user_uid: str, idempotency_key: str, data: InterviewRequest) -> dict | None:
+    repo = get_repository()
+    interview_id = _start_interview_id(user_uid, idempotency_key)
+    interview = await repo.get_interview(interview_id)
+    if interview is None or interview.get('user_uid') != user_uid:
+        return None
+    if interview.get('start_request_fingerprint') != IdempotencyStore.fingerprint(data.model_dump()):
+        raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request.")
+    if interview.get('turn_count', 0) == 0:
+        first_question = interview['current_question']['text']
+    else:
+        first_question = (await repo.get_turns(interview_id))[0]['question']['text']
+    return {
+        "message": "Interview started successfully",
+        "interview_id": interview_id,
+        "first_question": first_question
+    }
+
+
+async def _start_interview(data: InterviewRequest, user_data: dict, idempotency_key: str | None = None) -> dict:
     print(f"[DEBUG] Incoming data: role='{data.role}' experience='{data.experience}' num_questions='{data.num_questions}'")
     user_uid = user_data['uid']
     user_email = user_data['email']
+    repo = get_repository()
+    keyed_id = _start_interview_id(user_uid, idempotency_key) if idempotency_key else None
 
     try:
-        active_query = db.collection('interviews') \
-            .where('user_uid', '==', user_uid) \
-            .where('is_active', '==', True)
-        active_docs = await asyncio.to_thread(active_query.stream)
-        for doc in active_docs:
-            await asyncio.to_thread(doc.reference.update, {"is_active": False, 'ended_at': datetime.utcnow()})
-
-        first_question = await generate_first_question(data.role, data.experience)
+        session_cache = get_session_cache()
+        for active_id in await repo.list_active_interview_ids(user_uid):
+            if active_id == keyed_id:
+                # Created by a concurrent attempt with the same key on another instance
+                continue
+            await session_cache.flush(active_id)
+            session_cache.invalidate(active_id)
+            await repo.update_interview(active_id, {"is_active": False, 'ended_at': datetime.utcnow()})
+            await repo.record_completed_interview(active_id)
+
+        # Served from the warm pool when possible; otherwise a live Gemini call
+        question_pool = get_first_question_pool()
+        first_question = question_pool.take(user_uid, data.role, data.experience)
+        if first_question is None:
+            first_question = await generate_first_question(data.role, data.experience)
+            question_pool.record_served(user_uid, first_question)
         interview_data = {
             "user_uid": user_uid,
             "user_email": user_email,
             "role": data.role,
             "experience": data.experience,
             "num_questions": data.num_questions,
-            "questions": [{
+            "evaluation_mode": data.evaluation_mode,
+            # Turns are appended to the interview's turns subcollection as they are answered
+            **new_interview_fields({
                 "text": first_question,
                 "timestamp": datetime.utcnow().isoformat(),
                 "from_ai": True
-            }],
-            "answers": [],
-            "evaluation": [],
+            }),
             "is_active": True,
             "created_at": firestore.SERVER_TIMESTAMP
         }
 
-        doc_ref = await asyncio.to_thread(lambda: db.collection('interviews').add(interview_data)[1])
+        if keyed_id is None:
+            interview_id = await repo.add_interview(interview_data)
+        else:
+            interview_id = keyed_id
+            interview_data["start_idempotency_key"] = idempotency_key
+            interview_data["start_request_fingerprint"] = IdempotencyStore.fingerprint(data.model_dump())
+            try:
+                await repo.create_interview(interview_id, interview_data)
+            except InterviewExistsError:
+                # A concurrent attempt with the same key won the race: answer with its interview
+                return await _replay_start(user_uid, idempotency_key, data)
         return {
             "message": "Interview started successfully",
-            "interview_id": doc_ref.id,
+            "interview_id": interview_id,
             "first_question": first_question
         }
+    except (HTTPException, GeminiError, SessionWriteError):
+        raise
     except Exception as e:
         print(f"[ERROR] Interview creation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post('/answer')
-async def submit_answer(data: AnswerRequest, user_data: dict = Depends(get_current_user_data)):
-    user_uid = user_data['uid']
-    interview_ref = db.collection('interviews').document(data.interview_id)
+async def _load_active_interview(interview_id: str, user_uid: str) -> dict:
+    interview_data = await get_repository().get_interview(interview_id)
+    if interview_data is None:
+        raise HTTPException(status_code=404, detail="Interview not found.")
+    if interview_data.get('user_uid') != user_uid or not interview_data.get('is_active'):
+        raise HTTPException(status_code=403, detail="Unauthorized or inactive interview.")
+    return interview_data
+
+
+def _context_start(interview_data: dict) -> int:
+    return interview_data.get('context_summarized_turns', 0) if CONTEXT_WINDOW_TURNS > 0 else 0
+
+
+async def _load_answer_context(interview_id: str, user_uid: str, use_cache: bool = True) -> tuple[dict, bool]:
+    """
+    Active interview with the turns the next-question prompt needs: only those not yet
+    folded into the rolling summary (all of them when the context window is disabled).
+    Served from the active-session cache when this process holds the session.
+    Returns (interview, came from cache).
+    """
+    session_cache = get_session_cache()
+    # Turns a failed background write left queued are retried before this one is answered
+    await session_cache.recover(interview_id)
+    if use_cache:
+        cached = session_cache.get(interview_id, user_uid)
+        if cached is not None:
+            return cached, True
+    else:
+        session_cache.invalidate(interview_id)
+
+    repo = get_repository()
+    header = await _load_active_interview(interview_id, user_uid)
+    if not is_turn_schema(header):
+        # Interviews started before turn storage are converted on their next answer
+        await repo.migrate_interview(interview_id)
+        header = await _load_active_interview(interview_id, user_uid)
+    since = _context_start(header)
+    turns = await repo.get_turns(interview_id, since)
+    session_cache.put(interview_id, header, turns, since)
+    return assemble_interview(header, turns, since), False
+
+
+def build_conversation_history(interview_data: dict, latest_answer: str) -> list[dict]:
+    # Prepare conversation history for next question: rolling summary plus the recent turns
+    conversation_history, verbatim_turns = build_bounded_history(interview_data, latest_answer)
+    # Prompt sizes are also in the llm_prompt_tokens_estimated histogram
+    set_span_attrs(**{
+        "context.tokens_estimated": history_tokens(conversation_history),
+        "context.verbatim_turns": verbatim_turns,
+        "context.summary_chars": len(interview_data.get('context_summary', ''))
+    })
+    return conversation_history
 
-    try:
-        interview_doc = await asyncio.to_thread(interview_ref.get)
-        if not interview_doc.exists:
-            raise HTTPException(status_code=404, detail="Interview not found.")
 
-        interview_data = interview_doc.to_dict()
-        if interview_data.get('user_uid') != user_uid or not interview_data.get('is_active'):
-            raise HTTPException(status_code=403, detail="Unauthorized or inactive interview.")
+def _is_last_answer(interview_data: dict) -> bool:
+    return interview_data.get('turn_count', 0) + 1 >= interview_data.get('num_questions', 10)
 
-        questions = interview_data.get('questions', [])
-        answers = interview_data.get('answers', [])
-        evaluations = interview_data.get('evaluation', [])
-        num_questions = interview_data.get('num_questions', 10)
 
-        updated_answers = answers + [{
+async def _save_turn(interview_id: str, interview_data: dict, data: AnswerRequest,
+                     evaluation_feedback: dict, next_question: str | None,
+                     context_updates: dict | None = None, idempotency_key: str | None = None) -> None:
+    # One new turn document plus a few header fields; raises TurnConflictError when a
+    # concurrent submission already answered this turn
+    turn = build_turn(
+        interview_data.get('turn_count', 0),
+        interview_data.get('current_question') or {"text": data.question_text, "from_ai": True},
+        {
             "text": data.answer_text,
             "timestamp": datetime.utcnow().isoformat(),
             "from_ai": False
-        }]
-
-        # Evaluate the answer and store the result
-        evaluation_feedback = await evaluate_answer(
-            interview_data['role'],
-            interview_data['experience'],
-            data.question_text,
-            data.answer_text
-        )
-        updated_evaluations = evaluations + [{
+        },
+        {
             "question": data.question_text,
             "answer": data.answer_text,
             "score": evaluation_feedback.get("score"),
             "reason": evaluation_feedback.get("reason"),
             "confidence": evaluation_feedback.get("confidence"),
             "red_flag": evaluation_feedback.get("red_flag"),
-            "timestamp": datetime.utcnow().isoformat()
-        }]
-
-        # If all questions answered, do not generate next question, just update answers and evaluations
-        if len(updated_answers) >= num_questions:
-            await asyncio.to_thread(interview_ref.update, {
-                "answers": updated_answers,
-                "evaluation": updated_evaluations,
-                "updated_at": firestore.SERVER_TIMESTAMP
-            })
+            "timestamp": datetime.utcnow().isoformat(),
+            **({"deferred": True} if is_deferred(evaluation_feedback) else {})
+        }
+    )
+    next_question_entry = None
+    if next_question is not None:
+        next_question_entry = {
+            "text": next_question,
+            "timestamp": datetime.utcnow().isoformat(),
+            "from_ai": True
+        }
+    updates = header_updates_for_turn(interview_data, turn, next_question_entry)
+    if context_updates:
+        updates.update(context_updates)
+    if idempotency_key:
+        # Lets a retry on any instance recognise, and replay, the turn it already saved
+        turn["idempotency_key"] = idempotency_key
+        turn["request_fingerprint"] = IdempotencyStore.fingerprint(data.model_dump())
+    if idempotency_key or interview_data.get('last_answer_idempotency_key'):
+        updates["last_answer_idempotency_key"] = idempotency_key
+    await get_session_cache().commit_turn(
+        interview_id, turn, updates, _context_start({**interview_data, **updates}),
+        lambda: get_repository().append_turn(interview_id, turn, updates)
+    )
+
+
+_TURN_CONFLICT_DETAIL = "This answer was already submitted by another request."
+
+
+async def _in_span(name: str, coro):
+    # Spans show up in the Server-Timing header set by the tracing middleware
+    with span(name):
+        return await coro
+
+
+def _summarize(interview_data: dict):
+    return update_context_summary(interview_data['role'], interview_data['experience'], interview_data)
+
+
+# Stored in place of the evaluation until the deferred batch scores the answer
+DEFERRED_EVALUATION = {"score": None, "reason": None, "confidence": None, "red_flag": None, "deferred": True}
+
+
+def _is_deferred_mode(interview_data: dict) -> bool:
+    return interview_data.get('evaluation_mode') == "deferred"
+
+
+async def _evaluate(interview_data: dict, data: AnswerRequest) -> dict:
+    if _is_deferred_mode(interview_data):
+        return dict(DEFERRED_EVALUATION)
+    return await evaluate_answer(
+        interview_data['role'],
+        interview_data['experience'],
+        data.question_text,
+        data.answer_text
+    )
+
+
+def _client_evaluation(evaluation_feedback: dict) -> dict | None:
+    # Deferred answers have no evaluation yet; it arrives with the overall feedback
+    return None if is_deferred(evaluation_feedback) else evaluation_feedback
+
+
+@router.post('/answer')
+async def submit_answer(data: AnswerRequest, response: Response,
+                        user_data: dict = Depends(get_current_user_data),
+                        idempotency_key: str | None = Header(default=None, alias="Idempotency-Key")):
+    """
+    With an `Idempotency-Key` header a retry replays the stored turn instead of appending it
+    again. The key is stored with the turn, so this also holds when the retry reaches a
+    different instance.
+    """
+    return await _idempotent("answer", idempotency_key, user_data['uid'], data.model_dump(), response,
+                             lambda: _submit_answer(data, user_data, response, idempotency_key=idempotency_key))
+
+
+async def _replay_answer(interview_data: dict, data: AnswerRequest, idempotency_key: str,
+                         response: Response) -> dict | None:
+    """The response for the turn saved with `idempotency_key`, if it is the interview's last turn."""
+    if interview_data.get('last_answer_idempotency_key') != idempotency_key:
+        return None
+    turn_count = interview_data.get('turn_count', 0)
+    turns = await get_repository().get_turns(data.interview_id, turn_count - 1)
+    if not turns or turns[-1].get('idempotency_key') != idempotency_key:
+        return None
+    turn = turns[-1]
+    if turn.get('request_fingerprint') != IdempotencyStore.fingerprint(data.model_dump()):
+        raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request.")
+    evaluation = {key: turn['evaluation'].get(key) for key in ("score", "reason", "confidence", "red_flag", "deferred")
+                  if key in turn['evaluation']}
+    response.headers["Idempotent-Replayed"] = "true"
+    current_question = interview_data.get('current_question')
+    if current_question is None:
+        return {
+            "message": "Interview completed.",
+            "next_question": None,
+            "evaluation_feedback": _client_evaluation(evaluation)
+        }
+    return {
+        "message": "Answer submitted and next question generated successfully",
+        "next_question": current_question['text'],
+        "evaluation_feedback": _client_evaluation(evaluation)
+    }
+
+
+async def _submit_answer(data: AnswerRequest, user_data: dict, response: Response, use_cache: bool = True,
+                         idempotency_key: str | None = None) -> dict:
+    from_cache = False
+    try:
+        interview_data, from_cache = await _load_answer_context(data.interview_id, user_data['uid'], use_cache)
+        if idempotency_key:
+            # A retry of an answer that another instance (or an earlier process) already saved
+            replay = await _replay_answer(interview_data, data, idempotency_key, response)
+            if replay is not None:
+                return replay
+        is_last_answer = _is_last_answer(interview_data)
+
+        # Evaluation and next-question generation are independent Gemini calls, so run them together
+        calls = [_in_span("evaluate", _evaluate(interview_data, data))]
+        # If all questions answered, do not generate next question
+        if not is_last_answer:
+            conversation_history = build_conversation_history(interview_data, data.answer_text)
+            calls.append(_in_span("next_question", generate_next_question(
+                interview_data['role'],
+                interview_data['experience'],
+                conversation_history
+            )))
+            # Older turns are folded into the rolling summary alongside; it never raises
+            calls.append(_in_span("summarize", _summarize(interview_data)))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        # A failure in one call must not throw away the other's result.
+        # Gemini errors (quota, outage, timeout) are raised to the client unless there is something
+        # to save: a successful evaluation is already in the evaluation cache, so a retry won't redo it.
+        evaluation_feedback, next_question = results[0], (results[1] if len(results) > 1 else None)
+        context_updates = results[2] if len(results) > 2 and isinstance(results[2], dict) else None
+        if isinstance(next_question, GeminiError):
+            raise next_question
+        if isinstance(evaluation_feedback, GeminiError) and is_last_answer:
+            raise evaluation_feedback
+        if isinstance(evaluation_feedback, Exception):
+            print(f"[ERROR] evaluate_answer raised: {evaluation_feedback}")
+            evaluation_feedback = evaluation_failure(evaluation_feedback)
+
+        if is_last_answer:
+            await _save_turn(data.interview_id, interview_data, data, evaluation_feedback, None,
+                             idempotency_key=idempotency_key)
             return {
                 "message": "Interview completed.",
                 "next_question": None,
-                "evaluation_feedback": evaluation_feedback
+                "evaluation_feedback": _client_evaluation(evaluation_feedback)
             }
 
-        # Otherwise, generate next question
-        # Prepare conversation history for next question
-        conversation_history = []
-        for i in range(len(questions)):
-            conversation_history.append({"role": "model", "parts": [{"text": questions[i].get("text", "")}]})
-            if i < len(answers):
-                conversation_history.append({"role": "user", "parts": [{"text": answers[i].get("text", "")}]})
-        conversation_history.append({"role": "user", "parts": [{"text": data.answer_text}]})
-
-        next_question = await generate_next_question(
-            interview_data['role'],
-            interview_data['experience'],
-            conversation_history
-        )
-
-        updated_questions = questions + [{
-            "text": next_question,
-            "timestamp": datetime.utcnow().isoformat(),
-            "from_ai": True
-        }]
-        await asyncio.to_thread(interview_ref.update, {
-            "answers": updated_answers,
-            "evaluation": updated_evaluations,
-            "questions": updated_questions,
-            "updated_at": firestore.SERVER_TIMESTAMP
-        })
+        if isinstance(next_question, Exception):
+            print(f"[ERROR] generate_next_question raised: {next_question}")
+            next_question = NEXT_QUESTION_FALLBACK
 
+        await _save_turn(data.interview_id, interview_data, data, evaluation_feedback, next_question, context_updates,
+                         idempotency_key)
         return {
             "message": "Answer submitted and next question generated successfully",
             "next_question": next_question,
-            "evaluation_feedback": evaluation_feedback
+            "evaluation_feedback": _client_evaluation(evaluation_feedback)
         }
 
+    except (HTTPException, GeminiError, SessionWriteError):
+        raise
+    except TurnConflictError:
+        if from_cache:
+            # Another worker advanced this session after we cached it: redo the turn from storage
+            # (the evaluation comes from the evaluation cache the second time)
+            return await _submit_answer(data, user_data, response, use_cache=False, idempotency_key=idempotency_key)
+        if idempotency_key:
+            # A concurrent attempt with the same key, possibly on another instance, saved the turn first
+            interview_data = await _load_active_interview(data.interview_id, user_data['uid'])
+            replay = await _replay_answer(interview_data, data, idempotency_key, response)
+            if replay is not None:
+                return replay
+        raise HTTPException(status_code=409, detail=_TURN_CONFLICT_DETAIL)
     except Exception as e:
         print(f"[ERROR] Error in /answer: {e}")
         raise HTTPException(status_code=500, detail="Something went wrong.")
 
 
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@router.post('/answer/stream')
+async def submit_answer_stream(data: AnswerRequest, user_data: dict = Depends(get_current_user_data)):
+    """
+    Streaming variant of /answer. Emits `token` events with next-question text as Gemini
+    produces it, then `evaluation`, then `done` once the turn is persisted.
+    """
+    try:
+        interview_data, _ = await _load_answer_context(data.interview_id, user_data['uid'])
+    except TurnConflictError:
+        raise HTTPException(status_code=409, detail=_TURN_CONFLICT_DETAIL)
+    is_last_answer = _is_last_answer(interview_data)
+
+    async def events():
+        # Evaluation runs in the background while the next question streams
+        evaluation_task = asyncio.create_task(_evaluate(interview_data, data))
+        summary_task = asyncio.create_task(_summarize(interview_data)) if not is_last_answer else None
+        next_question = None
+        try:
+            if not is_last_answer:
+                conversation_history = build_conversation_history(interview_data, data.answer_text)
+                chunks = []
+                try:
+                    async for text in stream_next_question(
+                        interview_data['role'], interview_data['experience'], conversation_history
+                    ):
+                        chunks.append(text)
+                        yield _sse("token", text)
+                    next_question = "".join(chunks).strip()
+                    if not next_question:
+                        # Same text generate_next_question saves when the response has none
+                        print("[ERROR] stream_next_question returned no text")
+                        next_question = EXTRACT_FAILED_TEXT
+                except GeminiError as e:
+                    print(f"[ERROR] stream_next_question failed: {e}")
+                    yield _sse("error", {"stage": "next_question", "status": e.status_code, "detail": str(e)})
+                    return
+                except Exception as e:
+                    print(f"[ERROR] stream_next_question failed: {e}")
+                    next_question = NEXT_QUESTION_FALLBACK
+                    yield _sse("error", {"stage": "next_question", "detail": next_question})
+
+            try:
+                evaluation_feedback = await evaluation_task
+            except GeminiError as e:
+                if is_last_answer:
+                    yield _sse("error", {"stage": "evaluation", "status": e.status_code, "detail": str(e)})
+                    return
+                print(f"[ERROR] evaluate_answer raised: {e}")
+                evaluation_feedback = evaluation_failure(e)
+            except Exception as e:
+                print(f"[ERROR] evaluate_answer raised: {e}")
+                evaluation_feedback = evaluation_failure(e)
+            yield _sse("evaluation", _client_evaluation(evaluation_feedback))
+
+            context_updates = await summary_task if summary_task is not None else None
+            await _save_turn(data.interview_id, interview_data, data, evaluation_feedback, next_question, context_updates)
+            yield _sse("done", {
+                "message": "Interview completed." if is_last_answer
+                else "Answer submitted and next question generated successfully",
+                "next_question": next_question
+            })
+        except TurnConflictError:
+            # The cached session may be stale; the client's retry reloads it from storage
+            get_session_cache().invalidate(data.interview_id)
+            yield _sse("error", {"stage": "save", "status": 409, "detail": _TURN_CONFLICT_DETAIL})
+        except SessionWriteError as e:
+            yield _sse("error", {"stage": "save", "status": e.status_code, "detail": str(e)})
+        except Exception as e:
+            print(f"[ERROR] Error in /answer/stream: {e}")
+            yield _sse("error", {"stage": "save", "detail": "Something went wrong."})
+        finally:
+            evaluation_task.cancel()
+            if summary_task is not None:
+                summary_task.cancel()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 @router.post("/next")
 async def get_next_question_safeguarded(request: Request, user_data: dict = Depends(get_current_user_data)):
     # This route should not be used unless for manual testing
@@ -169,20 +551,13 @@ async def get_next_question_safeguarded(request: Request, user_data: dict = Depe
     interview_id = data.get("interview_id")
     user_uid = user_data['uid']
 
-    interview_ref = db.collection('interviews').document(interview_id)
-    interview_doc = await asyncio.to_thread(interview_ref.get)
-    if not interview_doc.exists:
-        raise HTTPException(status_code=404, detail="Interview not found.")
+    interview_data = await _load_active_interview(interview_id, user_uid)
 
-    interview_data = interview_doc.to_dict()
-    if interview_data.get('user_uid') != user_uid or not interview_data.get('is_active'):
-        raise HTTPException(status_code=403, detail="Unauthorized or inactive interview.")
-
-    questions = interview_data.get('questions', [])
-    answers = interview_data.get('answers', [])
+    # Counted from the header; turn documents are not read
+    question_count = summarize_interview(interview_data)["question_count"]
     num_questions = interview_data.get('num_questions', 10)
 
-    if len(questions) >= num_questions:
+    if question_count >= num_questions:
         raise HTTPException(status_code=400, detail="Question limit reached. Interview already completed.")
 
     return {"message": "Manual next route should not be used in normal flow."}
@@ -192,33 +567,67 @@ async def end_interview(request: Request, user_data: dict = Depends(get_current_
     data = await request.json()
     interview_id = data.get("interview_id")
     user_uid = user_data['uid']
-    interview_ref = db.collection('interviews').document(interview_id)
-    interview_doc = await asyncio.to_thread(interview_ref.get)
-    if not interview_doc.exists:
+    repo = get_repository()
+    session_cache = get_session_cache()
+    await session_cache.flush(interview_id)
+    interview_data = await repo.get_interview(interview_id)
+    if interview_data is None:
         raise HTTPException(status_code=404, detail="Interview not found.")
-    interview_data = interview_doc.to_dict()
     if interview_data.get('user_uid') != user_uid:
         raise HTTPException(status_code=403, detail="Not authorized to end this interview.")
-    await asyncio.to_thread(interview_ref.update, {
+    session_cache.invalidate(interview_id)
+    await repo.update_interview(interview_id, {
         'is_active': False,
         'ended_at': datetime.utcnow(),
         'updated_at': firestore.SERVER_TIMESTAMP
     })
+    await repo.record_completed_interview(interview_id)
     return {"message": "Interview marked as completed and inactive."}
 
-@router.post("/overall-feedback")
-async def overall_feedback(request: Request, user_data: dict = Depends(get_current_user_data)):
-    data = await request.json()
-    interview_id = data.get("interview_id")
-    user_uid = user_data['uid']
-    interview_ref = db.collection('interviews').document(interview_id)
-    interview_doc = await asyncio.to_thread(interview_ref.get)
-    if not interview_doc.exists:
+
+async def _load_feedback_interview(interview_id: str, user_uid: str) -> dict:
+    await get_session_cache().flush(interview_id)
+    interview_data = await get_repository().get_interview_with_turns(interview_id)
+    if interview_data is None:
         raise HTTPException(status_code=404, detail="Interview not found.")
-    interview_data = interview_doc.to_dict()
     if interview_data.get('user_uid') != user_uid:
         raise HTTPException(status_code=403, detail="Not authorized to get feedback for this interview.")
+    if any(is_deferred(evaluation) for evaluation in interview_data.get('evaluation', [])):
+        interview_data = await _deferred_flights.do(interview_id, lambda: _score_deferred_answers(interview_id, interview_data))
+    return interview_data
+
 
+async def _score_deferred_answers(interview_id: str, interview_data: dict) -> dict:
+    """Scores every deferred answer in batch calls, persists the evaluations and returns the updated interview."""
+    questions = interview_data.get('questions', [])
+    answers = interview_data.get('answers', [])
+    evaluations = list(interview_data.get('evaluation', []))
+    pending = [i for i, evaluation in enumerate(evaluations) if is_deferred(evaluation) and i < len(answers)]
+    with span("evaluate_batch", answers=len(pending)):
+        results = await evaluate_answers_batch(
+            interview_data['role'],
+            interview_data['experience'],
+            [(evaluations[i].get('question') or questions[i].get('text', ''), answers[i].get('text', '')) for i in pending]
+        )
+
+    scored = {}
+    for i, result in zip(pending, results):
+        evaluation = {key: value for key, value in evaluations[i].items() if key != "deferred"}
+        evaluation.update({
+            "score": result.get("score"),
+            "reason": result.get("reason"),
+            "confidence": result.get("confidence"),
+            "red_flag": result.get("red_flag")
+        })
+        evaluations[i] = scored[i] = evaluation
+    header_updates = header_updates_for_evaluations(evaluations)
+    get_session_cache().invalidate(interview_id)
+    await get_repository().update_turn_evaluations(interview_id, scored, header_updates)
+    return {**interview_data, **header_updates, "evaluation": evaluations}
+
+
+def _build_feedback_input(interview_data: dict) -> tuple[dict, dict]:
+    """Returns (input for the feedback prompt, score fields of the response)."""
     # Only use real questions, answers, and evaluations
     questions = interview_data.get('questions', [])
     answers = interview_data.get('answers', [])
@@ -254,25 +663,132 @@ async def overall_feedback(request: Request, user_data: dict = Depends(get_curre
     else:
         avg_score = 0.0
 
-    raw_feedback_text = await asyncio.to_thread(generate_overall_feedback, feedback_input)
+    return feedback_input, {
+        "final_score": avg_score,
+        "per_question_scores": per_question_scores,
+        "questions": questions_array
+    }
+
+
+def _feedback_content_hash(feedback_input: dict) -> str:
+    # Covers role, experience and every question, answer and evaluation that goes into the prompt
+    return hashlib.sha256(json.dumps(feedback_input, sort_keys=True, default=str).encode("utf-8")).hexdigest()
 
+
+# Failure texts older versions stored as feedback; interviews holding one get regenerated
+_FAILED_FEEDBACK_TEXTS = {EXTRACT_FAILED_TEXT, "Failed to generate overall feedback due to an internal error."}
+
+
+def _stored_feedback(interview_data: dict, content_hash: str) -> str | None:
+    feedback_text = interview_data.get('overall_feedback')
+    if feedback_text and feedback_text not in _FAILED_FEEDBACK_TEXTS and interview_data.get('overall_feedback_hash') == content_hash:
+        record_cache("overall_feedback", True)
+        return interview_data['overall_feedback']
+    record_cache("overall_feedback", False)
+    return None
+
+
+async def _save_overall_feedback(interview_id: str, interview_data: dict, feedback_text: str, content_hash: str) -> None:
+    repo = get_repository()
+    get_session_cache().invalidate(interview_id)
     # Mark interview as inactive and set ended_at if not already
     if interview_data.get('is_active', True):
-        await asyncio.to_thread(interview_ref.update, {
+        await repo.update_interview(interview_id, {
             'is_active': False,
             'ended_at': datetime.utcnow(),
-            'overall_feedback': raw_feedback_text,
+            'overall_feedback': feedback_text,
+            'overall_feedback_hash': content_hash,
             'updated_at': firestore.SERVER_TIMESTAMP
         })
     else:
-        await asyncio.to_thread(interview_ref.update, {
-            'overall_feedback': raw_feedback_text,
+        await repo.update_interview(interview_id, {
+            'overall_feedback': feedback_text,
+            'overall_feedback_hash': content_hash,
             'updated_at': firestore.SERVER_TIMESTAMP
         })
+    await repo.record_completed_interview(interview_id)
+
+
+@router.post("/overall-feedback")
+async def overall_feedback(request: Request, user_data: dict = Depends(get_current_user_data)):
+    data = await request.json()
+    interview_id = data.get("interview_id")
+    interview_data = await _load_feedback_interview(interview_id, user_data['uid'])
+    feedback_input, scores = _build_feedback_input(interview_data)
+    content_hash = _feedback_content_hash(feedback_input)
+
+    raw_feedback_text = _stored_feedback(interview_data, content_hash)
+    if raw_feedback_text is None:
+        async def _generate_and_save():
+            feedback_text = await generate_overall_feedback(feedback_input)
+            await _save_overall_feedback(interview_id, interview_data, feedback_text, content_hash)
+            return feedback_text
+
+        raw_feedback_text = await _feedback_flights.do(f"{interview_id}:{content_hash}", _generate_and_save)
 
     return {
-        "final_score": avg_score,
-        "per_question_scores": per_question_scores,
+        "final_score": scores["final_score"],
+        "per_question_scores": scores["per_question_scores"],
         "overall_feedback": raw_feedback_text,
-        "questions": questions_array
-    }
\ No newline at end of file
+        "questions": scores["questions"]
+    }
+
+
+@router.post("/overall-feedback/stream")
+async def overall_feedback_stream(request: Request, user_data: dict = Depends(get_current_user_data)):
+    """
+    Streaming variant of /overall-feedback. Emits `scores` first, then `token` events with
+    the markdown report as it is generated, then `done` with the persisted text.
+    """
+    data = await request.json()
+    interview_id = data.get("interview_id")
+    interview_data = await _load_feedback_interview(interview_id, user_data['uid'])
+    feedback_input, scores = _build_feedback_input(interview_data)
+    content_hash = _feedback_content_hash(feedback_input)
+    flight_key = f"{interview_id}:{content_hash}"
+
+    async def events():
+        yield _sse("scores", scores)
+
+        # Already generated for this exact transcript, or being generated by another request
+        feedback_text = _stored_feedback(interview_data, content_hash)
+        if feedback_text is None and _feedback_flights.get(flight_key) is not None:
+            try:
+                feedback_text = await asyncio.shield(_feedback_flights.get(flight_key))
+            except Exception:
+                feedback_text = None
+        if feedback_text is not None:
+            yield _sse("token", feedback_text)
+            yield _sse("done", {"overall_feedback": feedback_text})
+            return
+
+        flight = _feedback_flights.claim(flight_key)
+        chunks = []
+        try:
+            async for text in stream_overall_feedback(feedback_input):
+                chunks.append(text)
+                yield _sse("token", text)
+
+            # Same text the non-streaming path would have stored
+            feedback_text = "".join(chunks).strip()
+            if not feedback_text:
+                raise GeminiResponseError("Gemini returned no overall feedback text.")
+            await _save_overall_feedback(interview_id, interview_data, feedback_text, content_hash)
+            if flight is not None:
+                flight.set_result(feedback_text)
+        except Exception as e:
+            print(f"[ERROR] Error in /overall-feedback/stream: {e}")
+            if flight is not None:
+                flight.set_exception(e)
+            if isinstance(e, GeminiError):
+                yield _sse("error", {"stage": "overall_feedback", "status": e.status_code, "detail": str(e)})
+            else:
+                yield _sse("error", {"stage": "overall_feedback", "detail": "Failed to generate overall feedback due to an internal error."})
+            return
+        finally:
+            if flight is not None:
+                # Client went away mid-stream; let waiters fall back to generating themselves
+                SingleFlight.abandon(flight)
+        yield _sse("done", {"overall_feedback": feedback_text})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
@@ -1,20 +1,38 @@
-from fastapi import APIRouter, HTTPException, Depends
-from firebase_admin import firestore
 import asyncio
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from auth import get_current_user_data
+from services.http_cache import cache_headers, etag_matches, interview_etag, not_modified
+from services.interview_turns import assemble_interview
+from services.repository import get_repository
+from services.session_cache import get_session_cache
 
 router = APIRouter(prefix="/recent-interviews", tags=["Recent Interviews"])
-db = firestore.client()
 
 @router.get("/{interview_id}")
-async def get_recent_interview_details(interview_id: str, user_data: dict = Depends(get_current_user_data)):
-    interview_ref = db.collection('interviews').document(interview_id)
-    interview_doc = await asyncio.to_thread(interview_ref.get)
-    if not interview_doc.exists:
+async def get_recent_interview_details(interview_id: str, request: Request, response: Response,
+                                       user_data: dict = Depends(get_current_user_data)):
+    await get_session_cache().flush(interview_id)
+    repo = get_repository()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Revalidation: the header alone decides, turn documents are only read when it changed
+        header = await repo.get_interview(interview_id)
+        turns = None
+    else:
+        header, turns = await asyncio.gather(repo.get_interview(interview_id), repo.get_turns(interview_id))
+    if header is None:
         raise HTTPException(status_code=404, detail="Interview not found.")
-    interview_data = interview_doc.to_dict()
-    if interview_data.get('user_uid') != user_data['uid']:
+    if header.get('user_uid') != user_data['uid']:
         raise HTTPException(status_code=403, detail="Unauthorized.")
+    etag = interview_etag(header, "recent-interview")
+    if etag_matches(if_none_match, etag):
+        return not_modified(header, etag)
+    if turns is None:
+        turns = await repo.get_turns(interview_id)
+    # Header and all turn documents, assembled into the questions/answers arrays
+    interview_data = assemble_interview(header, turns)
+    response.headers.update(cache_headers(header, etag))
     # Return only the relevant fields
     return {
         "role": interview_data.get('role'),
@@ -24,4 +42,4 @@ async def get_recent_interview_details(interview_id: str, user_data: dict = Depe
         "answers": interview_data.get('answers', []),
         "score": interview_data.get('score', None),
         "overall_feedback": interview_data.get('overall_feedback', None)
-    } 
\ No newline at end of file
+    }
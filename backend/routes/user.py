@@ -1,12 +1,14 @@
 # ai-interview-coach-backend/routes/user.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from firebase_admin import firestore
 # Corrected import path: assuming auth.py is one level up (in backend root)
 from auth import get_current_user_data # <--- CORRECTED IMPORT
-
-# Get Firestore client instance
-db = firestore.client()
+from services.http_cache import cache_headers, etag_matches, interview_etag, not_modified
+from services.interview_export import export_interviews, gzip_stream
+from services.repository import InvalidCursorError, get_repository
 
 router = APIRouter()
 
@@ -25,12 +27,10 @@ async def get_user_profile(user_data: dict = Depends(get_current_user_data)):
     current_user_uid = user_data['uid']
     user_email = user_data['email']
 
-    user_ref = db.collection('users').document(current_user_uid)
-    # Firestore get() is synchronous, no await needed here
-    user_doc = user_ref.get()
+    repo = get_repository()
+    profile_data = await repo.get_user(current_user_uid)
 
-    if user_doc.exists:
-        profile_data = user_doc.to_dict()
+    if profile_data is not None:
         if 'uid' not in profile_data:
             profile_data['uid'] = current_user_uid
         if 'email' not in profile_data:
@@ -40,31 +40,26 @@ async def get_user_profile(user_data: dict = Depends(get_current_user_data)):
         
         return UserProfile(**profile_data)
     else:
-        new_profile = {
-            "uid": current_user_uid,
-            "email": user_email,
-            "display_name": user_data.get('name'),
-            "created_at": firestore.SERVER_TIMESTAMP
-        }
-        # Firestore set() is synchronous, no await needed here
-        user_ref.set(new_profile)
+        await repo.create_user(current_user_uid, user_email, user_data.get('name'))
 
-        # Fetch the just-created document (synchronously) to get the server timestamp and return
-        created_doc = user_ref.get()
-        profile_data = created_doc.to_dict()
+        # Fetch the just-created document to get the server timestamp and return
+        profile_data = await repo.get_user(current_user_uid)
         if 'created_at' in profile_data and hasattr(profile_data['created_at'], 'isoformat'):
              profile_data['created_at'] = profile_data['created_at'].isoformat()
         return UserProfile(**profile_data)
 
 @router.get('/interview/{interview_id}')
-async def get_interview_by_id(interview_id: str, user_data: dict = Depends(get_current_user_data)):
-    interview_ref = db.collection('interviews').document(interview_id)
-    interview_doc = interview_ref.get()
-    if not interview_doc.exists:
+async def get_interview_by_id(interview_id: str, request: Request, response: Response,
+                              user_data: dict = Depends(get_current_user_data)):
+    interview = await get_repository().get_interview(interview_id)
+    if interview is None:
         raise HTTPException(status_code=404, detail='Interview not found')
-    interview = interview_doc.to_dict()
     if interview.get('user_uid') != user_data['uid']:
         raise HTTPException(status_code=403, detail='Not authorized to view this interview')
+    etag = interview_etag(interview, "interview")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(interview, etag)
+    response.headers.update(cache_headers(interview, etag))
     return {
         'id': interview_id,
         'role': interview.get('role'),
@@ -73,4 +68,24 @@ async def get_interview_by_id(interview_id: str, user_data: dict = Depends(get_c
         'is_active': interview.get('is_active'),
         'created_at': interview.get('created_at'),
         'ended_at': interview.get('ended_at'),
-    }
\ No newline at end of file
+    }
+
+@router.get('/interviews/export')
+async def export_interview_history(cursor: str | None = None,
+                                   limit: int | None = Query(None, ge=1),
+                                   compression: Literal["none", "gzip"] = "none",
+                                   user_data: dict = Depends(get_current_user_data)):
+    """
+    Streams the user's completed interviews, with turns, evaluations and feedback, as NDJSON.
+    Pass the `cursor` of the last line received to resume an interrupted export.
+    """
+    try:
+        lines = await export_interviews(get_repository(), user_data['uid'], cursor, limit)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail='Invalid cursor')
+    headers = {'Cache-Control': 'no-store'}
+    if compression == "gzip":
+        # Compressed here, page by page: CompressionMiddleware leaves streaming responses alone
+        lines = gzip_stream(lines)
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(lines, media_type='application/x-ndjson', headers=headers)
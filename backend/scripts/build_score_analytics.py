@@ -0,0 +1,47 @@
+# ai-interview-coach-backend/scripts/build_score_analytics.py
+# Recompute population-wide score distributions and publish the snapshot the dashboard
+# ranks users against (analytics_snapshots/score_percentiles). Meant to run on a schedule.
+#
+#   python -m scripts.build_score_analytics               # read, compute and publish
+#   python -m scripts.build_score_analytics --dry-run     # print the groups, write nothing
+#   python -m scripts.build_score_analytics --min-group-users 5
+import argparse
+import time
+
+from dotenv import load_dotenv
+
+from services.repository import get_db
+from services.score_analytics import MIN_GROUP_USERS, collect_score_columns, compute_score_snapshot, publish_score_snapshot
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish score percentiles per role and experience.")
+    parser.add_argument("--dry-run", action="store_true", help="Compute and print, but do not write the snapshot.")
+    parser.add_argument("--min-group-users", type=int, default=MIN_GROUP_USERS,
+                        help="Leave out groups with fewer users than this.")
+    args = parser.parse_args()
+    db = get_db()
+
+    start = time.perf_counter()
+    columns = collect_score_columns(db)
+    read_done = time.perf_counter()
+    snapshot = compute_score_snapshot(columns, min_group_users=args.min_group_users)
+    compute_done = time.perf_counter()
+
+    print(f"{snapshot['users']} users, {snapshot['interviews']} interviews, {snapshot['answers']} answers "
+          f"(read {read_done - start:.1f}s, compute {(compute_done - read_done) * 1000:.0f} ms)")
+    for label, group in sorted(snapshot["groups"].items()):
+        quantiles = group["quantiles"]
+        print(f"  {label:<48} users {group['users']:>6}  p25 {quantiles[25]:5.1f}  "
+              f"p50 {quantiles[50]:5.1f}  p75 {quantiles[75]:5.1f}  p90 {quantiles[90]:5.1f}")
+
+    if args.dry_run:
+        return
+    publish_score_snapshot(db, snapshot)
+    print(f"✅ Published {len(snapshot['groups'])} score groups")
+
+
+if __name__ == "__main__":
+    main()
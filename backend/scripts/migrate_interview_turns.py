@@ -0,0 +1,52 @@
+# ai-interview-coach-backend/scripts/migrate_interview_turns.py
+# Move interviews stored as questions/answers/evaluation arrays into the append-only
+# turns subcollection (see services/interview_turns.py). Safe to re-run: converted
+# interviews are skipped, and each interview is converted in its own transaction.
+#
+#   python -m scripts.migrate_interview_turns              # every interview
+#   python -m scripts.migrate_interview_turns --uid <UID>  # a single user's interviews
+#   python -m scripts.migrate_interview_turns --dry-run    # only count what would change
+import argparse
+
+from dotenv import load_dotenv
+
+from services.interview_turns import is_turn_schema, migrate_interview
+from services.repository import get_db
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate interviews to append-only turn storage.")
+    parser.add_argument("--uid", help="Only migrate this user's interviews.")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be migrated without writing.")
+    args = parser.parse_args()
+    db = get_db()
+
+    query = db.collection("interviews")
+    if args.uid:
+        query = query.where("user_uid", "==", args.uid)
+
+    migrated = skipped = failed = 0
+    for doc in query.select(["turn_schema"]).stream():
+        if is_turn_schema(doc.to_dict() or {}):
+            skipped += 1
+            continue
+        if args.dry_run:
+            migrated += 1
+            continue
+        try:
+            if migrate_interview(db, doc.id):
+                migrated += 1
+            else:
+                skipped += 1
+        except Exception as e:
+            failed += 1
+            print(f"[ERROR] {doc.id}: {e}")
+
+    action = "would migrate" if args.dry_run else "migrated"
+    print(f"✅ {action} {migrated}, already migrated {skipped}, failed {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# ai-interview-coach-backend/scripts/rebuild_dashboard_stats.py
+# Recompute the per-user dashboard stats documents from interview history.
+#
+#   python -m scripts.rebuild_dashboard_stats              # every user
+#   python -m scripts.rebuild_dashboard_stats --uid <UID>  # a single user
+import argparse
+
+from dotenv import load_dotenv
+
+from services.dashboard_stats import format_stats, rebuild_user_stats
+from services.repository import get_db
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild dashboard stats from interview history.")
+    parser.add_argument("--uid", help="Only rebuild this user's stats.")
+    args = parser.parse_args()
+    db = get_db()
+
+    if args.uid:
+        uids = [args.uid]
+    else:
+        uids = [doc.id for doc in db.collection("users").stream()]
+
+    for uid in uids:
+        stats = rebuild_user_stats(db, uid)
+        print(f"✅ {uid}: {format_stats(stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# ai-interview-coach-backend/services/dashboard_stats.py
+from bisect import bisect_left, bisect_right
+
+from services.firebase_app import firestore
+
+from services.interview_turns import is_turn_schema, numeric_score
+
+STATS_COLLECTION = "user_stats"
+# Population-wide score distributions, published by scripts/build_score_analytics.py
+ANALYTICS_COLLECTION = "analytics_snapshots"
+SCORE_SNAPSHOT_ID = "score_percentiles"
+
+
+def _score_summary(total_score, evaluated: int, scored: int) -> dict:
+    max_score = evaluated * 10
+    return {
+        "total_score": total_score,
+        "max_score": max_score,
+        "percentage": (total_score / max_score * 100) if max_score > 0 else 0.0,
+        "average_score": (total_score / scored) if scored else 0.0,
+    }
+
+
+def score_interview(evaluations: list[dict]) -> dict:
+    """Score summary for one interview, using the same rules the dashboard always used."""
+    total_score = 0
+    scored = 0
+    for eval_item in evaluations:
+        score_val = numeric_score(eval_item.get("score"))
+        if score_val is not None:
+            total_score += score_val
+            scored += 1
+    return _score_summary(total_score, len(evaluations), scored)
+
+
+def awaiting_scores(interview: dict) -> bool:
+    """Deferred-evaluation interviews are left out of stats until their answers are scored."""
+    return interview.get("pending_evaluations", 0) > 0
+
+
+def summarize_interview(interview: dict) -> dict:
+    """Compact summary stored on the interview document so listings never read the turn arrays."""
+    if is_turn_schema(interview):
+        # Turn-schema headers keep running totals, so no turn documents are read
+        turn_count = interview.get("turn_count", 0)
+        summary = _score_summary(interview.get("score_total", 0), turn_count, interview.get("scored_turns", 0))
+        summary["question_count"] = turn_count + (1 if interview.get("current_question") else 0)
+        summary["answer_count"] = turn_count
+        return summary
+    summary = score_interview(interview.get("evaluation", []))
+    summary["question_count"] = len(interview.get("questions", []))
+    summary["answer_count"] = len(interview.get("answers", []))
+    return summary
+
+
+def _empty_bucket() -> dict:
+    return {"total_interviews": 0, "total_score": 0, "total_max_score": 0, "best_percentage": 0.0}
+
+
+def _add_to_bucket(bucket: dict, summary: dict) -> None:
+    bucket["total_interviews"] += 1
+    bucket["total_score"] += summary["total_score"]
+    bucket["total_max_score"] += summary["max_score"]
+    bucket["best_percentage"] = max(bucket["best_percentage"], summary["percentage"])
+
+
+def empty_stats(uid: str) -> dict:
+    return {"uid": uid, **_empty_bucket(), "roles": {}}
+
+
+def apply_summary(stats: dict, role: str, summary: dict) -> None:
+    _add_to_bucket(stats, summary)
+    roles = stats.setdefault("roles", {})
+    _add_to_bucket(roles.setdefault(role or "Developer", _empty_bucket()), summary)
+
+
+def format_stats(stats: dict) -> dict:
+    """Dashboard-facing numbers (percentages rounded to one decimal)."""
+    total_max = stats.get("total_max_score", 0)
+    return {
+        "total_interviews": stats.get("total_interviews", 0),
+        "average_score": round(stats.get("total_score", 0) / total_max * 100, 1) if total_max > 0 else 0.0,
+        "best_score": round(stats.get("best_percentage", 0.0), 1),
+    }
+
+
+def record_completed_interview(db, interview_id: str) -> dict | None:
+    """
+    Fold a finished interview into its owner's stats document.
+    Runs in a transaction and flags the interview with `stats_recorded`, so calling it
+    from both /interview/end and /interview/overall-feedback counts the interview once.
+    """
+    interview_ref = db.collection("interviews").document(interview_id)
+
+    @firestore.transactional
+    def _record(transaction):
+        interview_doc = interview_ref.get(transaction=transaction)
+        if not interview_doc.exists:
+            return None
+        interview = interview_doc.to_dict()
+        if interview.get("stats_recorded") or interview.get("is_active", True) or awaiting_scores(interview):
+            return interview.get("score_summary")
+
+        uid = interview["user_uid"]
+        stats_ref = db.collection(STATS_COLLECTION).document(uid)
+        stats_doc = stats_ref.get(transaction=transaction)
+        summary = summarize_interview(interview)
+        if not stats_doc.exists:
+            # No record yet: it has to be built from the whole history, not just this interview.
+            # Built in this transaction, so a concurrent completion can't be counted twice or lost
+            _build_user_stats(transaction, db, uid)
+            return summary
+        stats = stats_doc.to_dict()
+
+        apply_summary(stats, interview.get("role"), summary)
+        stats["updated_at"] = firestore.SERVER_TIMESTAMP
+
+        transaction.set(stats_ref, stats)
+        transaction.update(interview_ref, {"stats_recorded": True, "score_summary": summary})
+        return summary
+
+    return _record(db.transaction())
+
+
+def _build_user_stats(transaction, db, uid: str) -> dict:
+    """Stats (and per-interview summaries) from the user's full history, written in `transaction`."""
+    stats = empty_stats(uid)
+    # Every read comes before the first write in a transaction
+    interviews = list(transaction.get(db.collection("interviews").where("user_uid", "==", uid)))
+    for interview in interviews:
+        i = interview.to_dict()
+        if i.get("is_active", True) or awaiting_scores(i):
+            continue
+        summary = summarize_interview(i)
+        apply_summary(stats, i.get("role"), summary)
+        transaction.update(interview.reference, {"stats_recorded": True, "score_summary": summary})
+
+    stats["updated_at"] = firestore.SERVER_TIMESTAMP
+    transaction.set(db.collection(STATS_COLLECTION).document(uid), stats)
+    return stats
+
+
+def rebuild_user_stats(db, uid: str) -> dict:
+    """
+    Recompute a user's stats document (and per-interview summaries) from their full history.
+    Transactional, like record_completed_interview: a completion recorded meanwhile makes it retry
+    instead of being overwritten.
+    """
+    @firestore.transactional
+    def _rebuild(transaction):
+        # Read the stats document so a concurrent increment conflicts with this rebuild
+        db.collection(STATS_COLLECTION).document(uid).get(transaction=transaction)
+        return _build_user_stats(transaction, db, uid)
+
+    return _rebuild(db.transaction())
+
+
+def get_user_stats(db, uid: str) -> dict:
+    stats_ref = db.collection(STATS_COLLECTION).document(uid)
+    stats_doc = stats_ref.get()
+    if stats_doc.exists:
+        return stats_doc.to_dict()
+
+    # First dashboard view since stats were introduced: build the record once from history,
+    # unless a concurrent request created it first
+    @firestore.transactional
+    def _create(transaction):
+        stats_doc = stats_ref.get(transaction=transaction)
+        if stats_doc.exists:
+            return stats_doc.to_dict()
+        return _build_user_stats(transaction, db, uid)
+
+    return _create(db.transaction())
+
+
+def get_score_snapshot(db) -> dict | None:
+    snapshot_doc = db.collection(ANALYTICS_COLLECTION).document(SCORE_SNAPSHOT_ID).get()
+    return snapshot_doc.to_dict() if snapshot_doc.exists else None
+
+
+def percentile_rank(quantiles: list[float], value: float) -> float:
+    """
+    Percentile of `value` within a distribution given by its evenly spaced quantiles
+    (quantiles[0] is the minimum, quantiles[-1] the maximum). Ties take the middle of the tied range.
+    """
+    step = 100 / (len(quantiles) - 1)
+    lo = bisect_left(quantiles, value)
+    hi = bisect_right(quantiles, value)
+    if lo != hi:
+        return (lo + hi - 1) / 2 * step
+    if lo == 0:
+        return 0.0
+    if lo == len(quantiles):
+        return 100.0
+    below, above = quantiles[lo - 1], quantiles[lo]
+    return (lo - 1 + (value - below) / (above - below)) * step
+
+
+def _bucket_percentage(bucket: dict) -> float | None:
+    total_max = bucket.get("total_max_score", 0)
+    return bucket.get("total_score", 0) / total_max * 100 if total_max > 0 else None
+
+
+def format_percentiles(stats: dict, snapshot: dict | None) -> dict | None:
+    """
+    Where the user's average score ranks among all users, overall and per role, e.g.
+    {"overall": 72, "roles": {"Backend Developer": 64}}. Groups with too few users are not in
+    the snapshot and are left out here.
+    """
+    if not snapshot:
+        return None
+    groups = snapshot.get("groups", {})
+    result = {"overall": None, "roles": {}, "snapshot_at": snapshot.get("generated_at")}
+
+    percentage = _bucket_percentage(stats)
+    if percentage is not None and "all" in groups:
+        result["overall"] = round(percentile_rank(groups["all"]["quantiles"], percentage))
+    for role, bucket in stats.get("roles", {}).items():
+        group = groups.get(f"role:{role}")
+        percentage = _bucket_percentage(bucket)
+        if group is not None and percentage is not None:
+            result["roles"][role] = round(percentile_rank(group["quantiles"], percentage))
+    return result
@@ -0,0 +1,167 @@
+# ai-interview-coach-backend/services/eval_cache.py
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from services.metrics import record_cache
+
+
+class MemoryLRUBackend:
+    blocking = False
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskBackend:
+    """SQLite-backed cache that survives restarts; rows from other rubric versions are purged on open."""
+    blocking = True
+
+    def __init__(self, path: str, rubric_version: str, max_entries: int = 50000):
+        self.path = path
+        self.rubric_version = rubric_version
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key TEXT PRIMARY KEY, rubric_version TEXT NOT NULL, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS evaluations_accessed ON evaluations (accessed_at)")
+            self._conn.execute("DELETE FROM evaluations WHERE rubric_version != ?", (rubric_version,))
+
+    def get(self, key: str) -> dict | None:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM evaluations WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE evaluations SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations (key, rubric_version, value, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, self.rubric_version, json.dumps(value), time.time()),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+            if count > self.max_entries:
+                overflow = count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM evaluations WHERE key IN "
+                    "(SELECT key FROM evaluations ORDER BY accessed_at ASC LIMIT ?)", (overflow,)
+                )
+                self.evictions += overflow
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+class EvaluationCache:
+    """
+    Content-addressed cache of answer evaluations.
+    The key hashes the rubric version with the normalized inputs, so changing the rubric or
+    the evaluation prompt makes every older entry unreachable without an explicit flush.
+    """
+
+    def __init__(self, backend, rubric_version: str):
+        self.backend = backend
+        self.rubric_version = rubric_version
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def make_key(self, role: str, experience: str, question: str, answer: str) -> str:
+        payload = json.dumps([
+            self.rubric_version,
+            _normalize(role).casefold(),
+            _normalize(experience).casefold(),
+            _normalize(question),
+            _normalize(answer),
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def get(self, key: str) -> dict | None:
+        value = await self._call(self.backend.get, key)
+        if value is None:
+            self.misses += 1
+            record_cache("evaluation", False)
+            return None
+        self.hits += 1
+        record_cache("evaluation", True)
+        return dict(value)
+
+    async def put(self, key: str, value: dict) -> None:
+        await self._call(self.backend.put, key, dict(value))
+        self.stores += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "rubric_version": self.rubric_version,
+            "size": len(self.backend),
+            "max_entries": self.backend.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.backend.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_eval_cache: EvaluationCache | None = None
+
+
+def get_eval_cache(rubric_version: str) -> EvaluationCache | None:
+    """Configured cache, or None when EVAL_CACHE_BACKEND=none."""
+    global _eval_cache
+    backend_name = os.getenv("EVAL_CACHE_BACKEND", "memory").lower()
+    if backend_name == "none":
+        return None
+    if _eval_cache is None or _eval_cache.rubric_version != rubric_version:
+        max_entries = int(os.getenv("EVAL_CACHE_MAX_ENTRIES", "5000"))
+        if backend_name == "disk":
+            backend = DiskBackend(os.getenv("EVAL_CACHE_PATH", "eval_cache.sqlite3"), rubric_version, max_entries)
+        else:
+            backend = MemoryLRUBackend(max_entries)
+        _eval_cache = EvaluationCache(backend, rubric_version)
+    return _eval_cache
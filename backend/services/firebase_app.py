@@ -0,0 +1,41 @@
+# ai-interview-coach-backend/services/firebase_app.py
+# firebase_admin and the Firestore client library take a noticeable part of a cold start to
+# import, so neither is imported until it is used: `ensure_firebase_app` imports the SDK on
+# first call, and modules use the `firestore` proxy below instead of importing
+# firebase_admin.firestore at module load.
+import importlib
+import os
+
+
+class _LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+firestore = _LazyModule("firebase_admin.firestore")
+
+
+def ensure_firebase_app():
+    """Initialize the Firebase Admin SDK on first use (only once)."""
+    import firebase_admin
+    from firebase_admin import credentials
+
+    if not firebase_admin._apps:
+        service_account_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY_PATH")
+        if not service_account_path or not os.path.exists(service_account_path):
+            raise FileNotFoundError(
+                f"Firebase service account key file not found at {service_account_path}. "
+                "Please ensure FIREBASE_SERVICE_ACCOUNT_KEY_PATH is set correctly in your .env file."
+            )
+        cred = credentials.Certificate(service_account_path)
+        firebase_admin.initialize_app(cred)
+        print("✅ Firebase Admin SDK initialized successfully.")
+    return firebase_admin.get_app()
@@ -0,0 +1,53 @@
+# ai-interview-coach-backend/services/http_cache.py
+# Conditional GET for interview reads. The ETag is a hash of the interview header document:
+# every change to an interview (a new turn, scored deferred evaluations, ending it, the overall
+# feedback) rewrites the header, so the hash changes with any change to the response. A request
+# whose If-None-Match still matches gets a 304 after the header read alone, without reading
+# turns or serializing the transcript.
+#
+# Finished interviews (inactive, overall feedback stored) no longer change and may be reused by
+# the browser for HTTP_CACHE_MAX_AGE_SECONDS without asking; anything else is revalidated on
+# every request. Responses are per-user, so they are always `private`.
+import hashlib
+import json
+import os
+
+from fastapi import Response
+
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", "3600"))
+
+
+def is_finished(interview: dict) -> bool:
+    return not interview.get("is_active", True) and bool(interview.get("overall_feedback"))
+
+
+def interview_etag(interview: dict, variant: str) -> str:
+    """
+    ETag for one response shape (`variant`) of an interview header document. Weak: the same
+    validator is sent for the identity, gzip and br encodings CompressionMiddleware produces,
+    and RFC 9110 only allows that for weak validators.
+    """
+    payload = json.dumps([variant, interview], sort_keys=True, default=str)
+    return 'W/"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def cache_headers(interview: dict, etag: str) -> dict:
+    if is_finished(interview):
+        cache_control = f"private, max-age={HTTP_CACHE_MAX_AGE}"
+    else:
+        cache_control = "private, no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(interview: dict, etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(interview, etag))
@@ -0,0 +1,107 @@
+# ai-interview-coach-backend/services/idempotency.py
+import copy
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+from services.single_flight import SingleFlight
+
+
+class IdempotencyKeyReusedError(Exception):
+    """Raised when an Idempotency-Key is sent again with a different request body."""
+    pass
+
+
+class IdempotencyStore:
+    """
+    Remembers the result of a request made with an Idempotency-Key for `ttl_seconds` and replays
+    it for retries. Retries that arrive while the first execution is still running wait for it
+    (via SingleFlight) instead of starting their own. Only successful results are stored, so a
+    failed request can be retried with the same key.
+    Scoped per process, like the other in-memory caches; /interview/start and /interview/answer
+    additionally store the key with the interview or turn they create, so their retries are safe
+    across instances too.
+    """
+
+    def __init__(self, ttl_seconds: int = 86400, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, str, object]]" = OrderedDict()
+        self._in_flight: dict[str, str] = {}
+        self._flights = SingleFlight()
+        self.replays = 0
+
+    @staticmethod
+    def _store_key(scope: str, key: str) -> str:
+        return hashlib.sha256(f"{scope}\n{key}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def fingerprint(payload) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _get(self, store_key: str) -> tuple[str, object] | None:
+        entry = self._entries.get(store_key)
+        if entry is None:
+            return None
+        expires_at, fingerprint, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[store_key]
+            return None
+        self._entries.move_to_end(store_key)
+        return fingerprint, result
+
+    def _put(self, store_key: str, fingerprint: str, result) -> None:
+        self._entries[store_key] = (time.monotonic() + self.ttl_seconds, fingerprint, copy.deepcopy(result))
+        self._entries.move_to_end(store_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def run(self, scope: str, key: str, payload, fn) -> tuple[object, bool]:
+        """Returns (result, replayed). `fn` runs at most once per (scope, key) while it succeeds."""
+        store_key = self._store_key(scope, key)
+        fingerprint = self.fingerprint(payload)
+
+        stored = self._get(store_key)
+        if stored is not None:
+            if stored[0] != fingerprint:
+                raise IdempotencyKeyReusedError("Idempotency-Key was already used with a different request.")
+            self.replays += 1
+            return copy.deepcopy(stored[1]), True
+
+        # No await between this check and SingleFlight registering the execution below
+        leader = self._flights.get(store_key) is None
+        if leader:
+            self._in_flight[store_key] = fingerprint
+        elif self._in_flight.get(store_key) != fingerprint:
+            raise IdempotencyKeyReusedError("Idempotency-Key is in use by a different request.")
+
+        async def _execute():
+            try:
+                result = await fn()
+                self._put(store_key, fingerprint, result)
+                return result
+            finally:
+                self._in_flight.pop(store_key, None)
+
+        result = await self._flights.do(store_key, _execute)
+        if not leader:
+            self.replays += 1
+        return copy.deepcopy(result), not leader
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "in_flight": len(self._in_flight), "replays": self.replays}
+
+
+_store: IdempotencyStore | None = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    global _store
+    if _store is None:
+        _store = IdempotencyStore(
+            ttl_seconds=int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400")),
+            max_entries=int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000")),
+        )
+    return _store
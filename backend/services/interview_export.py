@@ -0,0 +1,124 @@
+# ai-interview-coach-backend/services/interview_export.py
+# Streaming NDJSON export of a user's completed interviews, newest first.
+#
+# Every line is one JSON object:
+#   {"type": "interview", "cursor": "...", "interview": {..., "turns": [...]}}
+#   {"type": "end", "exported": n, "next_cursor": "..." | null}
+#   {"type": "error", "detail": "...", "cursor": "..." | null}
+#
+# `cursor` on an interview line resumes the export right after that interview, so a client
+# whose download broke off passes the last cursor it received. Interviews are read one page
+# (EXPORT_PAGE_SIZE) at a time and the next page is fetched while the current one is sent,
+# so memory use does not depend on the size of the history.
+import asyncio
+import json
+import os
+import zlib
+from datetime import datetime
+
+from services.interview_turns import is_turn_schema, split_legacy_interview
+from services.repository import InterviewRepository, encode_cursor
+
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "25"))
+
+EXPORT_FIELDS = (
+    "role", "experience", "num_questions", "evaluation_mode", "created_at", "ended_at",
+    "score_summary", "overall_feedback"
+)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def ndjson_line(obj: dict) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+
+def _export_turns(header: dict, turns: list[dict]) -> list[dict]:
+    if not is_turn_schema(header):
+        # Interviews never migrated to turn storage keep their arrays on the header
+        _, turns = split_legacy_interview(header)
+    return [
+        {
+            "index": turn["index"],
+            "question": turn.get("question"),
+            "answer": turn.get("answer"),
+            "evaluation": turn.get("evaluation")
+        }
+        for turn in turns
+    ]
+
+
+async def _export_interview(repo: InterviewRepository, interview_id: str) -> dict | None:
+    header, turns = await asyncio.gather(repo.get_interview(interview_id), repo.get_turns(interview_id))
+    if header is None:
+        return None
+    exported = {"id": interview_id, **{field: header.get(field) for field in EXPORT_FIELDS}}
+    exported["turns"] = _export_turns(header, turns)
+    return exported
+
+
+async def _fetch_page(repo: InterviewRepository, uid: str, size: int, cursor: str | None):
+    summaries, next_cursor = await repo.list_completed_interviews(uid, size, cursor)
+    interviews = await asyncio.gather(*(_export_interview(repo, s["id"]) for s in summaries))
+    return [i for i in interviews if i is not None], next_cursor
+
+
+async def export_interviews(repo: InterviewRepository, uid: str, cursor: str | None = None,
+                            limit: int | None = None):
+    """Returns an async iterator of NDJSON lines (bytes).
+
+    The first page is read before returning, so a bad cursor raises InvalidCursorError here
+    and the request can still fail with a 400 instead of a broken stream.
+    """
+    remaining = limit
+    page_size = min(EXPORT_PAGE_SIZE, remaining) if remaining else EXPORT_PAGE_SIZE
+    page = await _fetch_page(repo, uid, page_size, cursor)
+    return _stream_pages(repo, uid, page, remaining)
+
+
+async def _stream_pages(repo: InterviewRepository, uid: str, page, remaining: int | None):
+    exported = 0
+    last_cursor = None
+    next_task = None
+    try:
+        while True:
+            interviews, next_cursor = page
+            more = next_cursor is not None and (remaining is None or remaining > len(interviews))
+            if more:
+                if remaining is not None:
+                    remaining -= len(interviews)
+                size = min(EXPORT_PAGE_SIZE, remaining) if remaining is not None else EXPORT_PAGE_SIZE
+                next_task = asyncio.create_task(_fetch_page(repo, uid, size, next_cursor))
+            # One chunk per page: fewer writes, and gzip_stream flushes once per page
+            chunk = []
+            for interview in interviews:
+                chunk.append(ndjson_line({"type": "interview", "cursor": encode_cursor(interview["id"]), "interview": interview}))
+            if chunk:
+                yield b"".join(chunk)
+                exported += len(interviews)
+                last_cursor = encode_cursor(interviews[-1]["id"])
+            if not more:
+                yield ndjson_line({"type": "end", "exported": exported, "next_cursor": next_cursor})
+                return
+            page = await next_task
+            next_task = None
+    except Exception as e:
+        print(f"[ERROR] Interview export failed for {uid} after {exported} interview(s): {e}")
+        yield ndjson_line({"type": "error", "detail": "Export interrupted; resume from cursor.", "cursor": last_cursor})
+    finally:
+        if next_task is not None:
+            next_task.cancel()
+
+
+async def gzip_stream(lines):
+    """Gzip-encodes a byte stream, flushing after each chunk so pages still arrive as they are produced."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in lines:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
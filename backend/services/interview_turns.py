@@ -0,0 +1,197 @@
+# ai-interview-coach-backend/services/interview_turns.py
+# Append-only turn storage. An interview is a compact header document plus one immutable
+# document per answered turn in `interviews/{id}/turns/{index}`:
+#
+#   header: role, experience, num_questions, is_active, ..., turn_schema=2, turn_count,
+#           current_question (the question awaiting an answer), score_total, scored_turns
+#   turn:   index, question, answer, evaluation, created_at
+#
+# Answering writes one new turn document and a few header fields, so the write size no longer
+# grows with the interview. The turn is created with a must-not-exist precondition: of two
+# concurrent submissions for the same turn, exactly one succeeds.
+#
+# In deferred evaluation mode a turn is written with a placeholder evaluation (`deferred`,
+# no score) and the header counts it in `pending_evaluations`; `update_turn_evaluations`
+# later replaces the placeholders with the batch-scored evaluations in one write.
+#
+# Older documents keep questions/answers/evaluation arrays on the interview itself (no
+# turn_schema); `assemble_interview` passes them through unchanged and `migrate_interview`
+# (also run by scripts/migrate_interview_turns.py) converts them.
+from services.firebase_app import firestore
+
+TURN_SCHEMA = 2
+TURNS_COLLECTION = "turns"
+LEGACY_TURN_FIELDS = ("questions", "answers", "evaluation")
+
+
+class TurnConflictError(Exception):
+    """Raised when the turn being appended was already written by a concurrent request."""
+    pass
+
+
+def turn_doc_id(index: int) -> str:
+    # Zero-padded so document ids sort in turn order
+    return f"{index:04d}"
+
+
+def numeric_score(value) -> int | float | None:
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def is_turn_schema(interview: dict) -> bool:
+    return interview.get("turn_schema") == TURN_SCHEMA
+
+
+def new_interview_fields(first_question: dict) -> dict:
+    return {
+        "turn_schema": TURN_SCHEMA,
+        "turn_count": 0,
+        "current_question": first_question,
+        "score_total": 0,
+        "scored_turns": 0
+    }
+
+
+def build_turn(index: int, question: dict, answer: dict, evaluation: dict) -> dict:
+    return {
+        "index": index,
+        "question": question,
+        "answer": answer,
+        "evaluation": evaluation,
+        "created_at": firestore.SERVER_TIMESTAMP
+    }
+
+
+def is_deferred(evaluation: dict) -> bool:
+    return bool(evaluation.get("deferred"))
+
+
+def header_updates_for_turn(header: dict, turn: dict, next_question: dict | None) -> dict:
+    """Header fields written together with `turn`; explicit values are safe because of the create precondition."""
+    score = numeric_score(turn["evaluation"].get("score"))
+    updates = {
+        "turn_count": turn["index"] + 1,
+        "current_question": next_question,
+        "score_total": header.get("score_total", 0) + (score or 0),
+        "scored_turns": header.get("scored_turns", 0) + (1 if score is not None else 0),
+        "updated_at": firestore.SERVER_TIMESTAMP
+    }
+    if is_deferred(turn["evaluation"]):
+        updates["pending_evaluations"] = header.get("pending_evaluations", 0) + 1
+    return updates
+
+
+def header_updates_for_evaluations(evaluations: list[dict]) -> dict:
+    """Score counters recomputed from every turn's evaluation, e.g. after deferred ones were scored."""
+    scores = [numeric_score(evaluation.get("score")) for evaluation in evaluations]
+    return {
+        "score_total": sum(score for score in scores if score is not None),
+        "scored_turns": sum(1 for score in scores if score is not None),
+        "pending_evaluations": sum(1 for evaluation in evaluations if is_deferred(evaluation)),
+        "updated_at": firestore.SERVER_TIMESTAMP
+    }
+
+
+def assemble_interview(header: dict, turns: list[dict], offset: int = 0) -> dict:
+    """
+    Interview in the legacy array shape (questions / answers / evaluation) for readers.
+    `turns` must be the turns from index `offset` on; the arrays then start at that turn
+    and `turn_offset` records where.
+    """
+    if not is_turn_schema(header):
+        return header
+    interview = dict(header)
+    interview["questions"] = [turn["question"] for turn in turns]
+    interview["answers"] = [turn["answer"] for turn in turns]
+    interview["evaluation"] = [turn["evaluation"] for turn in turns]
+    if header.get("current_question"):
+        interview["questions"].append(header["current_question"])
+    interview["turn_offset"] = offset
+    return interview
+
+
+def split_legacy_interview(interview: dict) -> tuple[dict, list[dict]]:
+    """(header fields, turns) for a legacy array-shaped interview."""
+    questions = interview.get("questions", [])
+    answers = interview.get("answers", [])
+    evaluations = interview.get("evaluation", [])
+    turns = []
+    for i, answer in enumerate(answers):
+        evaluation = evaluations[i] if i < len(evaluations) else {}
+        question = questions[i] if i < len(questions) else {"text": evaluation.get("question", ""), "from_ai": True}
+        turns.append({
+            "index": i,
+            "question": question,
+            "answer": answer,
+            "evaluation": evaluation,
+            "created_at": answer.get("timestamp") or firestore.SERVER_TIMESTAMP
+        })
+    scores = [numeric_score(turn["evaluation"].get("score")) for turn in turns]
+    header = {
+        "turn_schema": TURN_SCHEMA,
+        "turn_count": len(turns),
+        "current_question": questions[len(answers)] if len(questions) > len(answers) else None,
+        "score_total": sum(score for score in scores if score is not None),
+        "scored_turns": sum(1 for score in scores if score is not None)
+    }
+    return header, turns
+
+
+# --- Firestore ---
+def _turns_ref(db, interview_id: str):
+    return db.collection("interviews").document(interview_id).collection(TURNS_COLLECTION)
+
+
+def get_turns(db, interview_id: str, since: int = 0) -> list[dict]:
+    query = _turns_ref(db, interview_id).order_by("index")
+    if since > 0:
+        query = query.where("index", ">=", since)
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def append_turn(db, interview_id: str, turn: dict, header_updates: dict) -> None:
+    from google.api_core.exceptions import AlreadyExists, Conflict
+
+    batch = db.batch()
+    batch.create(_turns_ref(db, interview_id).document(turn_doc_id(turn["index"])), turn)
+    batch.update(db.collection("interviews").document(interview_id), header_updates)
+    try:
+        batch.commit()
+    except (AlreadyExists, Conflict) as e:
+        raise TurnConflictError(f"Turn {turn['index']} of interview {interview_id} was already submitted.") from e
+
+
+def update_turn_evaluations(db, interview_id: str, evaluations: dict[int, dict], header_updates: dict) -> None:
+    """Replace the evaluation of the given turns and update the header in one batch."""
+    batch = db.batch()
+    for index, evaluation in evaluations.items():
+        batch.update(_turns_ref(db, interview_id).document(turn_doc_id(index)), {"evaluation": evaluation})
+    batch.update(db.collection("interviews").document(interview_id), header_updates)
+    batch.commit()
+
+
+def migrate_interview(db, interview_id: str) -> bool:
+    """Move a legacy interview's arrays into turn documents. Returns False if there was nothing to do."""
+    interview_ref = db.collection("interviews").document(interview_id)
+
+    @firestore.transactional
+    def _migrate(transaction):
+        doc = interview_ref.get(transaction=transaction)
+        if not doc.exists:
+            return False
+        interview = doc.to_dict()
+        if is_turn_schema(interview):
+            return False
+        header, turns = split_legacy_interview(interview)
+        for turn in turns:
+            transaction.set(_turns_ref(db, interview_id).document(turn_doc_id(turn["index"])), turn)
+        header.update({field: firestore.DELETE_FIELD for field in LEGACY_TURN_FIELDS})
+        transaction.update(interview_ref, header)
+        return True
+
+    return _migrate(db.transaction())
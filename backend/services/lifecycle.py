@@ -0,0 +1,69 @@
+# ai-interview-coach-backend/services/lifecycle.py
+# Startup and shutdown work for the FastAPI lifespan in main.py.
+#
+# Nothing heavy happens at import any more: the Firestore client, the Firebase Admin SDK,
+# the token verifier and the Gemini models are all created on first use. `warm_up` creates
+# them in the background right after the server starts accepting connections, so a cold
+# instance answers its health probe immediately and the first real request usually finds
+# everything ready. STARTUP_WARMUP=false leaves everything to first use.
+import asyncio
+import os
+import time
+
+from services.question_pool import close_first_question_pool, warm_first_question_pool
+from services.repository import get_repository, shutdown_db_executor
+from services.session_cache import get_session_cache
+from services.token_verifier import close_token_verifier, get_token_verifier
+from services.tracing import close_trace_exporter
+
+WARMUP_ENABLED = os.getenv("STARTUP_WARMUP", "true").lower() != "false"
+
+
+async def _warm_storage_and_auth() -> None:
+    await asyncio.to_thread(get_repository)
+    # Created on the loop (it owns asyncio state), after the repository has initialized the
+    # Firebase app the verifier may need for its project id
+    verifier = get_token_verifier()
+    key_set = getattr(verifier, "key_set", None)
+    if key_set is not None and hasattr(key_set, "refresh"):
+        # Signing certificates are fetched now rather than by the first authenticated request
+        await key_set.refresh()
+        key_set.start_background_refresh()
+
+
+def _warm_models() -> None:
+    from agents.interview_agent import warm_models
+    warm_models()
+
+
+async def warm_up() -> None:
+    start = time.perf_counter()
+    steps = [
+        ("storage and auth", _warm_storage_and_auth()),
+        ("models", asyncio.to_thread(_warm_models)),
+    ]
+    results = await asyncio.gather(*(step for _, step in steps), return_exceptions=True)
+    for (name, _), result in zip(steps, results):
+        if isinstance(result, Exception):
+            # Not fatal: the same client is created again on first use
+            print(f"[WARN] Startup warm-up of {name} failed: {result}")
+    print(f"✅ Startup warm-up finished in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+async def startup() -> asyncio.Task | None:
+    # Pre-generate first questions for the configured role/experience pairs in the background
+    warm_first_question_pool()
+    if not WARMUP_ENABLED:
+        return None
+    return asyncio.create_task(warm_up())
+
+
+async def shutdown(warmup_task: asyncio.Task | None) -> None:
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    # Write-behind turns must reach storage before the process exits
+    await get_session_cache().flush_all()
+    await close_first_question_pool()
+    await close_token_verifier()
+    await close_trace_exporter()
+    await asyncio.to_thread(shutdown_db_executor)
@@ -0,0 +1,203 @@
+# ai-interview-coach-backend/services/memory_repository.py
+# In-process stand-in for Firestore, selected with STORAGE_BACKEND=memory.
+# Same behaviour as FirestoreRepository (server timestamps, ordering, cursors, stats) with an
+# optional artificial latency, so the full API can run and be load-tested without Google services.
+import asyncio
+import copy
+import uuid
+from datetime import datetime, timezone
+
+from services.firebase_app import firestore
+
+from services.dashboard_stats import apply_summary, awaiting_scores, empty_stats, summarize_interview
+from services.interview_turns import (
+    LEGACY_TURN_FIELDS,
+    TurnConflictError,
+    is_turn_schema,
+    split_legacy_interview,
+)
+from services.repository import (
+    INTERVIEW_SUMMARY_FIELDS,
+    InterviewExistsError,
+    InterviewRepository,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _resolve_sentinels(data: dict) -> dict:
+    now = datetime.now(timezone.utc)
+    return {key: (now if value is firestore.SERVER_TIMESTAMP else value) for key, value in data.items()}
+
+
+class InMemoryRepository(InterviewRepository):
+
+    def __init__(self, latency_ms: float = 0):
+        self.latency = latency_ms / 1000
+        self.users: dict[str, dict] = {}
+        self.interviews: dict[str, dict] = {}
+        self.turns: dict[str, list[dict]] = {}
+        self.user_stats: dict[str, dict] = {}
+        self.score_snapshot: dict | None = None
+        self.reads = 0
+        self.writes = 0
+
+    async def _round_trip(self, writes: int = 0) -> None:
+        if writes:
+            self.writes += writes
+        else:
+            self.reads += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    # --- users ---
+    async def get_user(self, uid: str) -> dict | None:
+        await self._round_trip()
+        user = self.users.get(uid)
+        return copy.deepcopy(user) if user is not None else None
+
+    async def create_user(self, uid: str, email: str | None, display_name: str | None) -> None:
+        await self._round_trip(writes=1)
+        self.users[uid] = _resolve_sentinels({
+            "uid": uid,
+            "email": email,
+            "display_name": display_name,
+            "created_at": firestore.SERVER_TIMESTAMP
+        })
+
+    # --- interviews ---
+    async def get_interview(self, interview_id: str) -> dict | None:
+        await self._round_trip()
+        interview = self.interviews.get(interview_id)
+        if interview is None:
+            return None
+        data = copy.deepcopy(interview)
+        data["id"] = interview_id
+        return data
+
+    async def add_interview(self, interview_data: dict) -> str:
+        await self._round_trip(writes=1)
+        interview_id = uuid.uuid4().hex[:20]
+        self.interviews[interview_id] = copy.deepcopy(_resolve_sentinels(interview_data))
+        return interview_id
+
+    async def create_interview(self, interview_id: str, interview_data: dict) -> None:
+        await self._round_trip(writes=1)
+        if interview_id in self.interviews:
+            raise InterviewExistsError(f"Interview {interview_id} already exists.")
+        self.interviews[interview_id] = copy.deepcopy(_resolve_sentinels(interview_data))
+
+    async def update_interview(self, interview_id: str, updates: dict) -> None:
+        await self._round_trip(writes=1)
+        if interview_id not in self.interviews:
+            raise KeyError(f"No document to update: interviews/{interview_id}")
+        self.interviews[interview_id].update(copy.deepcopy(_resolve_sentinels(updates)))
+
+    async def get_turns(self, interview_id: str, since: int = 0) -> list[dict]:
+        await self._round_trip()
+        return copy.deepcopy(self.turns.get(interview_id, [])[since:])
+
+    async def append_turn(self, interview_id: str, turn: dict, header_updates: dict) -> None:
+        # Same precondition as the Firestore batch: the turn document must not exist yet
+        await self._round_trip(writes=2)
+        if interview_id not in self.interviews:
+            raise KeyError(f"No document to update: interviews/{interview_id}")
+        turns = self.turns.setdefault(interview_id, [])
+        if turn["index"] < len(turns):
+            raise TurnConflictError(f"Turn {turn['index']} of interview {interview_id} was already submitted.")
+        turns.append(copy.deepcopy(_resolve_sentinels(turn)))
+        self.interviews[interview_id].update(copy.deepcopy(_resolve_sentinels(header_updates)))
+
+    async def update_turn_evaluations(self, interview_id: str, evaluations: dict[int, dict], header_updates: dict) -> None:
+        await self._round_trip(writes=len(evaluations) + 1)
+        if interview_id not in self.interviews:
+            raise KeyError(f"No document to update: interviews/{interview_id}")
+        turns = self.turns.get(interview_id, [])
+        for index, evaluation in evaluations.items():
+            turns[index]["evaluation"] = copy.deepcopy(evaluation)
+        self.interviews[interview_id].update(copy.deepcopy(_resolve_sentinels(header_updates)))
+
+    async def migrate_interview(self, interview_id: str) -> bool:
+        await self._round_trip(writes=1)
+        interview = self.interviews.get(interview_id)
+        if interview is None or is_turn_schema(interview):
+            return False
+        header, turns = split_legacy_interview(interview)
+        self.turns[interview_id] = [copy.deepcopy(_resolve_sentinels(turn)) for turn in turns]
+        for field in LEGACY_TURN_FIELDS:
+            interview.pop(field, None)
+        interview.update(header)
+        return True
+
+    async def list_completed_interviews(self, uid: str, limit: int, cursor: str | None = None) -> tuple[list[dict], str | None]:
+        await self._round_trip()
+        completed = [
+            (interview_id, interview) for interview_id, interview in self.interviews.items()
+            if interview.get("user_uid") == uid and interview.get("is_active") is False
+        ]
+        # Same order as the Firestore query: created_at desc, then document id desc
+        completed.sort(key=lambda item: (item[1].get("created_at"), item[0]), reverse=True)
+        start = 0
+        if cursor:
+            cursor_id = decode_cursor(cursor)
+            ids = [interview_id for interview_id, _ in completed]
+            if cursor_id not in ids:
+                raise InvalidCursorError("Invalid pagination cursor.")
+            start = ids.index(cursor_id) + 1
+        page = completed[start:start + limit + 1]
+        items = [
+            {"id": interview_id, **{f: copy.deepcopy(i[f]) for f in INTERVIEW_SUMMARY_FIELDS if f in i}}
+            for interview_id, i in page
+        ]
+        next_cursor = encode_cursor(items[limit - 1]["id"]) if len(items) > limit else None
+        return items[:limit], next_cursor
+
+    async def list_active_interview_ids(self, uid: str) -> list[str]:
+        await self._round_trip()
+        return [
+            interview_id for interview_id, interview in self.interviews.items()
+            if interview.get("user_uid") == uid and interview.get("is_active") is True
+        ]
+
+    # --- dashboard stats ---
+    def _rebuild_user_stats(self, uid: str) -> dict:
+        stats = empty_stats(uid)
+        for interview in self.interviews.values():
+            if interview.get("user_uid") != uid or interview.get("is_active", True) or awaiting_scores(interview):
+                continue
+            summary = summarize_interview(interview)
+            apply_summary(stats, interview.get("role"), summary)
+            interview["stats_recorded"] = True
+            interview["score_summary"] = summary
+        self.user_stats[uid] = stats
+        return stats
+
+    async def record_completed_interview(self, interview_id: str) -> dict | None:
+        # No awaits between the read and the write, so this is atomic on the event loop
+        await self._round_trip(writes=2)
+        interview = self.interviews.get(interview_id)
+        if interview is None:
+            return None
+        if interview.get("stats_recorded") or interview.get("is_active", True) or awaiting_scores(interview):
+            return copy.deepcopy(interview.get("score_summary"))
+        uid = interview["user_uid"]
+        if uid not in self.user_stats:
+            self._rebuild_user_stats(uid)
+            return copy.deepcopy(interview.get("score_summary"))
+        summary = summarize_interview(interview)
+        apply_summary(self.user_stats[uid], interview.get("role"), summary)
+        interview["stats_recorded"] = True
+        interview["score_summary"] = summary
+        return copy.deepcopy(summary)
+
+    async def get_user_stats(self, uid: str) -> dict:
+        await self._round_trip()
+        stats = self.user_stats.get(uid)
+        if stats is None:
+            stats = self._rebuild_user_stats(uid)
+        return copy.deepcopy(stats)
+
+    async def get_score_snapshot(self) -> dict | None:
+        await self._round_trip()
+        return copy.deepcopy(self.score_snapshot)
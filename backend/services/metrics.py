@@ -0,0 +1,114 @@
+# ai-interview-coach-backend/services/metrics.py
+# Prometheus metrics for the API, Gemini calls, Firestore and the in-process caches.
+# Exposed at /metrics by main.py; all metrics live in the default registry.
+import functools
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# Latency buckets in seconds: Firestore/auth sit at the low end, Gemini at the high end
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 90)
+_SIZE_BUCKETS = (16, 64, 256, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status.", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ["method", "route"],
+    buckets=_LATENCY_BUCKETS
+)
+# By method only: the route template is not known until routing has happened
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being handled.", ["method"])
+
+LLM_LATENCY = Histogram(
+    "llm_call_duration_seconds", "Latency of interview_agent calls, including retries.", ["function", "outcome"],
+    buckets=_LATENCY_BUCKETS
+)
+LLM_IN_FLIGHT = Gauge("llm_calls_in_flight", "Gemini requests currently holding a concurrency slot.")
+LLM_PROMPT_CHARS = Histogram(
+    "llm_prompt_chars", "Prompt size in characters (history included).", ["function"], buckets=_SIZE_BUCKETS
+)
+LLM_PROMPT_TOKENS = Histogram(
+    "llm_prompt_tokens_estimated", "Estimated prompt tokens (~4 chars/token).", ["function"], buckets=_SIZE_BUCKETS
+)
+LLM_RESPONSE_CHARS = Histogram(
+    "llm_response_chars", "Response size in characters.", ["function"], buckets=_SIZE_BUCKETS
+)
+EVAL_PARSE_FAILURES = Counter(
+    "evaluation_parse_failures_total", "Gemini evaluations that were not valid JSON."
+)
+
+FIRESTORE_LATENCY = Histogram(
+    "firestore_operation_duration_seconds", "Firestore call latency, including executor queueing.",
+    ["operation", "kind"], buckets=_LATENCY_BUCKETS
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by cache and result (hit|miss).", ["cache", "result"]
+)
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def observe_firestore(kind: str):
+    """Decorator for async repository methods; the method name is the operation label."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                FIRESTORE_LATENCY.labels(fn.__name__, kind).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def record_llm_io(function: str, prompt_chars: int, response_text: str | None = None) -> None:
+    LLM_PROMPT_CHARS.labels(function).observe(prompt_chars)
+    LLM_PROMPT_TOKENS.labels(function).observe((prompt_chars + 3) // 4)
+    if response_text is not None:
+        LLM_RESPONSE_CHARS.labels(function).observe(len(response_text))
+
+
+def observe_llm_call(function: str):
+    """Decorator for async interview_agent functions: latency by outcome (ok|error)."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                LLM_LATENCY.labels(function, outcome).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def observe_llm_stream(function: str):
+    """Decorator for streaming agent functions: time until the stream is exhausted, plus response size."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            chars = 0
+            try:
+                async for text in fn(*args, **kwargs):
+                    chars += len(text)
+                    yield text
+                outcome = "ok"
+            finally:
+                LLM_LATENCY.labels(function, outcome).observe(time.perf_counter() - start)
+                if outcome == "ok":
+                    LLM_RESPONSE_CHARS.labels(function).observe(chars)
+        return wrapper
+    return decorator
+
+
+def render_metrics() -> tuple[bytes, str]:
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,215 @@
+# ai-interview-coach-backend/services/question_pool.py
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict, deque
+
+from services.metrics import record_cache
+
+
+def normalize_key(role: str, experience: str) -> tuple[str, str]:
+    return (" ".join(role.lower().split()), " ".join(experience.lower().split()))
+
+
+def _question_hash(question: str) -> str:
+    return hashlib.sha1(" ".join(question.lower().split()).encode("utf-8")).hexdigest()
+
+
+class FirstQuestionPool:
+    """
+    Warm pool of pre-generated first questions per normalized (role, experience).
+    `take` never waits on Gemini: it hands out a pooled question or returns None so
+    the caller falls back to a live call. Consumed or missing pools are refilled by a
+    single background worker that generates one question at a time with a pause in
+    between, so refills never compete with live traffic for more than one call.
+
+    Only configured warm keys and pairs that miss twice within the TTL get a pool: roles and
+    experience levels are free text, and most pairs are asked for once, so pre-generating
+    `depth` questions for each of them would mostly pay for questions that expire unused.
+    """
+
+    def __init__(self, generate, depth: int = 3, ttl: float = 3600, max_repeats: int = 1,
+                 refill_delay: float = 0.2, max_keys: int = 200, max_users: int = 10000):
+        self.generate = generate
+        self.depth = depth
+        self.ttl = ttl
+        self.max_repeats = max_repeats
+        self.refill_delay = refill_delay
+        self.max_keys = max_keys
+        self.max_users = max_users
+        # key -> deque of (question, created_at); OrderedDict for LRU over keys
+        self._pools: "OrderedDict[tuple, deque]" = OrderedDict()
+        # key -> (role, experience) as first seen, used for generation
+        self._labels: dict[tuple, tuple[str, str]] = {}
+        self._warm_keys: set[tuple] = set()
+        # key -> time of its last miss, for keys without a pool yet
+        self._last_miss: dict[tuple, float] = {}
+        # uid -> {question hash: times served}
+        self._served: "OrderedDict[str, dict]" = OrderedDict()
+        self._queue: asyncio.Queue | None = None
+        self._queued: set = set()
+        self._worker: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.depth > 0
+
+    def _pool_for(self, role: str, experience: str) -> tuple[tuple, deque]:
+        key = normalize_key(role, experience)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = deque()
+            self._pools[key] = pool
+            self._labels[key] = (role.strip(), experience.strip())
+            while len(self._pools) > self.max_keys:
+                old_key, _ = self._pools.popitem(last=False)
+                self._labels.pop(old_key, None)
+                self._last_miss.pop(old_key, None)
+        self._pools.move_to_end(key)
+        return key, pool
+
+    def _drop_expired(self, pool: deque) -> None:
+        cutoff = time.time() - self.ttl
+        while pool and pool[0][1] < cutoff:
+            pool.popleft()
+
+    def _times_served(self, uid: str, question: str) -> int:
+        return self._served.get(uid, {}).get(_question_hash(question), 0)
+
+    def record_served(self, uid: str, question: str) -> None:
+        served = self._served.setdefault(uid, {})
+        qhash = _question_hash(question)
+        served[qhash] = served.get(qhash, 0) + 1
+        self._served.move_to_end(uid)
+        while len(self._served) > self.max_users:
+            self._served.popitem(last=False)
+
+    def take(self, uid: str, role: str, experience: str) -> str | None:
+        if not self.enabled:
+            return None
+        key, pool = self._pool_for(role, experience)
+        self._drop_expired(pool)
+        question = None
+        for entry in pool:
+            if self._times_served(uid, entry[0]) < self.max_repeats:
+                question = entry[0]
+                pool.remove(entry)
+                break
+        if self._should_refill(key, hit=question is not None):
+            self.schedule_refill(key)
+        if question is None:
+            self.misses += 1
+            record_cache("first_question_pool", False)
+            return None
+        self.hits += 1
+        record_cache("first_question_pool", True)
+        self.record_served(uid, question)
+        return question
+
+    def _should_refill(self, key: tuple, hit: bool) -> bool:
+        if hit or key in self._warm_keys:
+            return True
+        now = time.time()
+        last_miss = self._last_miss.get(key)
+        self._last_miss[key] = now
+        return last_miss is not None and now - last_miss <= self.ttl
+
+    def schedule_refill(self, key: tuple) -> None:
+        if key in self._queued:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._refill_loop())
+        self._queued.add(key)
+        self._queue.put_nowait(key)
+
+    def warm(self, pairs: list[tuple[str, str]]) -> None:
+        for role, experience in pairs:
+            key, _ = self._pool_for(role, experience)
+            self._warm_keys.add(key)
+            self.schedule_refill(key)
+
+    async def _refill_loop(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                await self._refill(key)
+            except Exception as e:
+                print(f"[ERROR] First-question pool refill failed for {key}: {e}")
+            finally:
+                self._queued.discard(key)
+
+    async def _refill(self, key: tuple) -> None:
+        while True:
+            pool = self._pools.get(key)
+            if pool is None:
+                return  # evicted while queued
+            self._drop_expired(pool)
+            if len(pool) >= self.depth:
+                return
+            role, experience = self._labels[key]
+            question = await self.generate(role, experience)
+            if not question or question.startswith("Failed to"):
+                return
+            if all(_question_hash(q) != _question_hash(question) for q, _ in pool):
+                pool.append((question, time.time()))
+            # Yield to live requests between generations
+            await asyncio.sleep(self.refill_delay)
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "keys": len(self._pools),
+            "pooled": sum(len(p) for p in self._pools.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def _parse_warm_keys(raw: str) -> list[tuple[str, str]]:
+    # "Backend Developer|1-3 years;Frontend Developer|Fresher"
+    pairs = []
+    for item in raw.split(";"):
+        if "|" in item:
+            role, experience = item.split("|", 1)
+            if role.strip() and experience.strip():
+                pairs.append((role.strip(), experience.strip()))
+    return pairs
+
+
+_first_question_pool: FirstQuestionPool | None = None
+
+
+def get_first_question_pool() -> FirstQuestionPool:
+    global _first_question_pool
+    if _first_question_pool is None:
+        from agents.interview_agent import generate_first_question
+        _first_question_pool = FirstQuestionPool(
+            generate_first_question,
+            depth=int(os.getenv("FIRST_QUESTION_POOL_DEPTH", "3")),
+            ttl=float(os.getenv("FIRST_QUESTION_POOL_TTL_SECONDS", "3600")),
+            max_repeats=int(os.getenv("FIRST_QUESTION_POOL_MAX_REPEATS", "1")),
+            refill_delay=float(os.getenv("FIRST_QUESTION_POOL_REFILL_DELAY_MS", "200")) / 1000,
+        )
+    return _first_question_pool
+
+
+async def close_first_question_pool() -> None:
+    if _first_question_pool is not None:
+        await _first_question_pool.close()
+
+
+def warm_first_question_pool() -> None:
+    pool = get_first_question_pool()
+    if pool.enabled:
+        pool.warm(_parse_warm_keys(os.getenv("FIRST_QUESTION_POOL_WARM_KEYS", "")))
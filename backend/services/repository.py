@@ -0,0 +1,302 @@
+# ai-interview-coach-backend/services/repository.py
+import asyncio
+import base64
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+from services.dashboard_stats import get_score_snapshot, get_user_stats, record_completed_interview
+from services.interview_turns import (
+    append_turn,
+    assemble_interview,
+    get_turns,
+    migrate_interview,
+    update_turn_evaluations
+)
+from services.firebase_app import ensure_firebase_app, firestore
+from services.metrics import observe_firestore
+from services.tracing import traced
+
+SCORE_SNAPSHOT_TTL = int(os.getenv("SCORE_SNAPSHOT_TTL_SECONDS", "600"))
+
+# Shared Firestore client and executor for the whole app
+_db = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_db():
+    global _db
+    if _db is None:
+        ensure_firebase_app()
+        _db = firestore.client()
+    return _db
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Dedicated, bounded pool: slow Firestore round trips queue here instead of
+    # exhausting the default executor that the rest of the app relies on.
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("FIRESTORE_MAX_WORKERS", "16")),
+            thread_name_prefix="firestore",
+        )
+    return _executor
+
+
+def shutdown_db_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+async def run_db(fn, *args, **kwargs):
+    """Run a blocking Firestore call on the Firestore executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(fn, *args, **kwargs))
+
+
+# Fields needed to render an interview in a listing; turn arrays are never transferred
+INTERVIEW_SUMMARY_FIELDS = ["role", "experience", "created_at", "ended_at", "score_summary"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded."""
+    pass
+
+
+class InterviewExistsError(Exception):
+    """Raised when an interview is created under an id that is already taken."""
+    pass
+
+
+def encode_cursor(interview_id: str) -> str:
+    raw = json.dumps({"id": interview_id}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["id"]
+    except Exception as e:
+        raise InvalidCursorError("Invalid pagination cursor.") from e
+
+
+def _with_id(doc) -> dict:
+    data = doc.to_dict()
+    data["id"] = doc.id
+    return data
+
+
+class InterviewRepository(ABC):
+    """Async data access for users, interviews and dashboard stats; selected by STORAGE_BACKEND."""
+
+    @abstractmethod
+    async def get_user(self, uid: str) -> dict | None: ...
+
+    @abstractmethod
+    async def create_user(self, uid: str, email: str | None, display_name: str | None) -> None: ...
+
+    @abstractmethod
+    async def get_interview(self, interview_id: str) -> dict | None: ...
+
+    @abstractmethod
+    async def add_interview(self, interview_data: dict) -> str: ...
+
+    # Creates the interview under a chosen id; raises InterviewExistsError if it is taken
+    @abstractmethod
+    async def create_interview(self, interview_id: str, interview_data: dict) -> None: ...
+
+    @abstractmethod
+    async def update_interview(self, interview_id: str, updates: dict) -> None: ...
+
+    @abstractmethod
+    async def get_turns(self, interview_id: str, since: int = 0) -> list[dict]: ...
+
+    @abstractmethod
+    async def append_turn(self, interview_id: str, turn: dict, header_updates: dict) -> None:
+        """Create turn `turn["index"]` and update the header atomically; TurnConflictError if it exists."""
+
+    @abstractmethod
+    async def update_turn_evaluations(self, interview_id: str, evaluations: dict[int, dict], header_updates: dict) -> None:
+        """Replace the evaluations of existing turns (by index) and update the header atomically."""
+
+    @abstractmethod
+    async def migrate_interview(self, interview_id: str) -> bool: ...
+
+    async def get_interview_with_turns(self, interview_id: str) -> dict | None:
+        """Header and every turn, assembled into the questions/answers/evaluation shape."""
+        interview, turns = await asyncio.gather(self.get_interview(interview_id), self.get_turns(interview_id))
+        return assemble_interview(interview, turns) if interview is not None else None
+
+    @abstractmethod
+    async def list_completed_interviews(self, uid: str, limit: int, cursor: str | None = None) -> tuple[list[dict], str | None]: ...
+
+    @abstractmethod
+    async def list_active_interview_ids(self, uid: str) -> list[str]: ...
+
+    @abstractmethod
+    async def record_completed_interview(self, interview_id: str) -> dict | None: ...
+
+    @abstractmethod
+    async def get_user_stats(self, uid: str) -> dict: ...
+
+    @abstractmethod
+    async def get_score_snapshot(self) -> dict | None: ...
+
+
+class FirestoreRepository(InterviewRepository):
+    """Firestore implementation; blocking client calls run on the Firestore executor."""
+
+    def __init__(self, db):
+        self.db = db
+        self._score_snapshot: tuple[float, dict | None] | None = None
+
+    # --- users ---
+    @traced("firestore.get_user")
+    @observe_firestore("read")
+    async def get_user(self, uid: str) -> dict | None:
+        doc = await run_db(self.db.collection("users").document(uid).get)
+        return doc.to_dict() if doc.exists else None
+
+    @traced("firestore.create_user")
+    @observe_firestore("write")
+    async def create_user(self, uid: str, email: str | None, display_name: str | None) -> None:
+        await run_db(self.db.collection("users").document(uid).set, {
+            "uid": uid,
+            "email": email,
+            "display_name": display_name,
+            "created_at": firestore.SERVER_TIMESTAMP
+        })
+
+    # --- interviews ---
+    @traced("firestore.get_interview")
+    @observe_firestore("read")
+    async def get_interview(self, interview_id: str) -> dict | None:
+        doc = await run_db(self.db.collection("interviews").document(interview_id).get)
+        return _with_id(doc) if doc.exists else None
+
+    @traced("firestore.add_interview")
+    @observe_firestore("write")
+    async def add_interview(self, interview_data: dict) -> str:
+        _, doc_ref = await run_db(self.db.collection("interviews").add, interview_data)
+        return doc_ref.id
+
+    @traced("firestore.create_interview")
+    @observe_firestore("write")
+    async def create_interview(self, interview_id: str, interview_data: dict) -> None:
+        from google.api_core.exceptions import AlreadyExists, Conflict
+
+        try:
+            await run_db(self.db.collection("interviews").document(interview_id).create, interview_data)
+        except (AlreadyExists, Conflict) as e:
+            raise InterviewExistsError(f"Interview {interview_id} already exists.") from e
+
+    @traced("firestore.update_interview")
+    @observe_firestore("write")
+    async def update_interview(self, interview_id: str, updates: dict) -> None:
+        await run_db(self.db.collection("interviews").document(interview_id).update, updates)
+
+    @traced("firestore.get_turns")
+    @observe_firestore("read")
+    async def get_turns(self, interview_id: str, since: int = 0) -> list[dict]:
+        return await run_db(get_turns, self.db, interview_id, since)
+
+    @traced("firestore.append_turn")
+    @observe_firestore("write")
+    async def append_turn(self, interview_id: str, turn: dict, header_updates: dict) -> None:
+        await run_db(append_turn, self.db, interview_id, turn, header_updates)
+
+    @traced("firestore.update_turn_evaluations")
+    @observe_firestore("write")
+    async def update_turn_evaluations(self, interview_id: str, evaluations: dict[int, dict], header_updates: dict) -> None:
+        await run_db(update_turn_evaluations, self.db, interview_id, evaluations, header_updates)
+
+    @traced("firestore.migrate_interview")
+    @observe_firestore("write")
+    async def migrate_interview(self, interview_id: str) -> bool:
+        return await run_db(migrate_interview, self.db, interview_id)
+
+    @traced("firestore.list_completed_interviews")
+    @observe_firestore("read")
+    async def list_completed_interviews(self, uid: str, limit: int, cursor: str | None = None) -> tuple[list[dict], str | None]:
+        """
+        One page of a user's finished interviews, newest first, projected to the summary fields.
+        Needs the composite index from firestore.indexes.json.
+        """
+        collection = self.db.collection("interviews")
+        query = collection \
+            .where("user_uid", "==", uid) \
+            .where("is_active", "==", False) \
+            .order_by("created_at", direction=firestore.Query.DESCENDING) \
+            .select(INTERVIEW_SUMMARY_FIELDS) \
+            .limit(limit + 1)
+
+        def _page():
+            page_query = query
+            if cursor:
+                cursor_doc = collection.document(decode_cursor(cursor)).get(field_paths=["created_at"])
+                if not cursor_doc.exists:
+                    raise InvalidCursorError("Invalid pagination cursor.")
+                page_query = page_query.start_after(cursor_doc)
+            return [_with_id(doc) for doc in page_query.stream()]
+
+        items = await run_db(_page)
+        next_cursor = encode_cursor(items[limit - 1]["id"]) if len(items) > limit else None
+        return items[:limit], next_cursor
+
+    @traced("firestore.list_active_interview_ids")
+    @observe_firestore("read")
+    async def list_active_interview_ids(self, uid: str) -> list[str]:
+        query = self.db.collection("interviews") \
+            .where("user_uid", "==", uid) \
+            .where("is_active", "==", True)
+        return await run_db(lambda: [doc.id for doc in query.stream()])
+
+    # --- dashboard stats ---
+    @traced("firestore.record_completed_interview")
+    @observe_firestore("write")
+    async def record_completed_interview(self, interview_id: str) -> dict | None:
+        return await run_db(record_completed_interview, self.db, interview_id)
+
+    @traced("firestore.get_user_stats")
+    @observe_firestore("read")
+    async def get_user_stats(self, uid: str) -> dict:
+        return await run_db(get_user_stats, self.db, uid)
+
+    async def get_score_snapshot(self) -> dict | None:
+        # Rewritten by an offline job a few times a day: one read per process per TTL is plenty
+        cached = self._score_snapshot
+        if cached is not None and time.monotonic() - cached[0] < SCORE_SNAPSHOT_TTL:
+            return cached[1]
+        snapshot = await self._read_score_snapshot()
+        self._score_snapshot = (time.monotonic(), snapshot)
+        return snapshot
+
+    @traced("firestore.get_score_snapshot")
+    @observe_firestore("read")
+    async def _read_score_snapshot(self) -> dict | None:
+        return await run_db(get_score_snapshot, self.db)
+
+
+_repository: InterviewRepository | None = None
+
+
+def get_repository() -> InterviewRepository:
+    global _repository
+    if _repository is None:
+        backend = os.getenv("STORAGE_BACKEND", "firestore").lower()
+        if backend == "memory":
+            from services.memory_repository import InMemoryRepository
+            _repository = InMemoryRepository(latency_ms=float(os.getenv("MEMORY_STORAGE_LATENCY_MS", "0")))
+        elif backend == "firestore":
+            _repository = FirestoreRepository(get_db())
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND '{backend}' (expected 'firestore' or 'memory').")
+    return _repository
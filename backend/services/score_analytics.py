@@ -0,0 +1,208 @@
+# ai-interview-coach-backend/services/score_analytics.py
+# Population-wide score distributions for the dashboard's percentile ranking.
+#
+# Completed interviews and their answer scores are read once into flat NumPy columns (one
+# entry per interview, one per answer) and every group (all users, per role, per experience,
+# per role and experience) is aggregated in the same vectorized pass with bincount/lexsort,
+# instead of a Python loop per document or per group. The result is one compact snapshot
+# document (analytics_snapshots/score_percentiles) that the dashboard reads and caches.
+#
+# A user's score within a group is their average percentage over that group's interviews,
+# total score / max score the way the dashboard computes average_score, so the dashboard can
+# place its own per-user numbers in the published quantiles. Only used by the offline job in
+# scripts/build_score_analytics.py; the API never imports NumPy.
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from services.dashboard_stats import ANALYTICS_COLLECTION, SCORE_SNAPSHOT_ID, awaiting_scores
+from services.firebase_app import firestore
+from services.interview_turns import is_turn_schema, numeric_score
+
+SNAPSHOT_VERSION = 1
+QUANTILE_POINTS = 101  # 0th..100th percentile
+PERCENTAGE_BINS = 10   # 0-10%, ..., 90-100%
+SCORE_BINS = 11        # answer scores 0..10
+MIN_GROUP_USERS = int(os.getenv("ANALYTICS_MIN_GROUP_USERS", "10"))
+MAX_GROUPS = int(os.getenv("ANALYTICS_MAX_GROUPS", "200"))
+
+INTERVIEW_FIELDS = ["user_uid", "role", "experience", "turn_schema", "evaluation", "pending_evaluations"]
+
+
+@dataclass
+class ScoreColumns:
+    """Columnar score data: interview columns are indexed by interview row, answer columns by answer."""
+    users: list[str]
+    roles: list[str]
+    experiences: list[str]
+    interview_user: np.ndarray        # int32 code into users
+    interview_role: np.ndarray        # int32 code into roles
+    interview_experience: np.ndarray  # int32 code into experiences
+    answer_interview: np.ndarray      # int32 interview row
+    answer_score: np.ndarray          # float64, NaN when the answer has no numeric score
+
+
+def _code(labels: dict[str, int], label: str) -> int:
+    return labels.setdefault(label, len(labels))
+
+
+def collect_score_columns(db) -> ScoreColumns:
+    """Bulk-read every completed interview and answer score into columns."""
+    users, roles, experiences = {}, {}, {}
+    rows: dict[str, int] = {}
+    interview_user, interview_role, interview_experience = [], [], []
+    answer_interview, answer_score = [], []
+
+    interviews = db.collection("interviews") \
+        .where("is_active", "==", False) \
+        .select(INTERVIEW_FIELDS) \
+        .stream()
+    for doc in interviews:
+        interview = doc.to_dict()
+        if awaiting_scores(interview) or not interview.get("user_uid"):
+            continue
+        row = len(rows)
+        rows[doc.id] = row
+        interview_user.append(_code(users, interview["user_uid"]))
+        interview_role.append(_code(roles, interview.get("role") or "Developer"))
+        interview_experience.append(_code(experiences, interview.get("experience") or "Unknown"))
+        if not is_turn_schema(interview):
+            for evaluation in interview.get("evaluation", []):
+                score = numeric_score(evaluation.get("score"))
+                answer_interview.append(row)
+                answer_score.append(np.nan if score is None else score)
+
+    # Turn-schema answers live in the turns subcollections; one collection-group scan reads them all
+    turns = db.collection_group("turns").select(["evaluation.score"]).stream()
+    for doc in turns:
+        row = rows.get(doc.reference.parent.parent.id)
+        if row is None:
+            # Active or still-unscored interview
+            continue
+        score = numeric_score((doc.to_dict().get("evaluation") or {}).get("score"))
+        answer_interview.append(row)
+        answer_score.append(np.nan if score is None else score)
+
+    return ScoreColumns(
+        users=list(users),
+        roles=list(roles),
+        experiences=list(experiences),
+        interview_user=np.asarray(interview_user, dtype=np.int32),
+        interview_role=np.asarray(interview_role, dtype=np.int32),
+        interview_experience=np.asarray(interview_experience, dtype=np.int32),
+        answer_interview=np.asarray(answer_interview, dtype=np.int32),
+        answer_score=np.asarray(answer_score, dtype=np.float64),
+    )
+
+
+def grouped_quantiles(groups: np.ndarray, values: np.ndarray, n_groups: int, points: int = QUANTILE_POINTS) -> np.ndarray:
+    """
+    (n_groups, points) evenly spaced quantiles of `values` within each group, using the same linear
+    interpolation as np.percentile, for all groups at once. Rows of empty groups are NaN.
+    """
+    if len(values) == 0:
+        return np.full((n_groups, points), np.nan)
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    positions = starts[:, None] + np.maximum(counts[:, None] - 1, 0) * np.linspace(0, 1, points)[None, :]
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    empty = counts == 0
+    lower = np.minimum(lower, len(sorted_values) - 1)
+    upper = np.minimum(upper, len(sorted_values) - 1)
+    fraction = positions - lower
+    result = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    result[empty] = np.nan
+    return result
+
+
+def _grouped_histogram(groups: np.ndarray, bins: np.ndarray, n_groups: int, n_bins: int) -> np.ndarray:
+    return np.bincount(groups * n_bins + bins, minlength=n_groups * n_bins).reshape(n_groups, n_bins)
+
+
+def group_distributions(columns: ScoreColumns, interview_group: np.ndarray, labels: list[str]) -> dict:
+    """Distribution of user average percentages (and of answer scores) for each group label."""
+    n_groups = len(labels)
+    n_interviews = len(interview_group)
+    scored = ~np.isnan(columns.answer_score)
+
+    # Interview totals with the dashboard's rules: every answer counts 10 towards the maximum,
+    # only numeric scores count towards the total
+    interview_total = np.bincount(columns.answer_interview[scored], weights=columns.answer_score[scored],
+                                  minlength=n_interviews)
+    interview_max = np.bincount(columns.answer_interview, minlength=n_interviews) * 10.0
+
+    # One value per (user, group): that user's average percentage within the group
+    pair = columns.interview_user.astype(np.int64) * n_groups + interview_group
+    pairs, pair_of_interview = np.unique(pair, return_inverse=True)
+    pair_total = np.bincount(pair_of_interview, weights=interview_total, minlength=len(pairs))
+    pair_max = np.bincount(pair_of_interview, weights=interview_max, minlength=len(pairs))
+    has_max = pair_max > 0
+    user_group = (pairs[has_max] % n_groups).astype(np.int64)
+    user_percentage = pair_total[has_max] / pair_max[has_max] * 100
+
+    users = np.bincount(user_group, minlength=n_groups)
+    interviews = np.bincount(interview_group, minlength=n_groups)
+    answer_group = interview_group[columns.answer_interview].astype(np.int64)
+    answers = np.bincount(answer_group, minlength=n_groups)
+    mean_percentage = np.bincount(user_group, weights=user_percentage, minlength=n_groups) / np.maximum(users, 1)
+    quantiles = grouped_quantiles(user_group, user_percentage, n_groups)
+    percentage_bins = np.minimum((user_percentage // (100 / PERCENTAGE_BINS)).astype(np.int64), PERCENTAGE_BINS - 1)
+    percentage_histogram = _grouped_histogram(user_group, percentage_bins, n_groups, PERCENTAGE_BINS)
+    score_bins = np.clip(np.rint(columns.answer_score[scored]), 0, SCORE_BINS - 1).astype(np.int64)
+    score_histogram = _grouped_histogram(answer_group[scored], score_bins, n_groups, SCORE_BINS)
+
+    return {
+        label: {
+            "users": int(users[g]),
+            "interviews": int(interviews[g]),
+            "answers": int(answers[g]),
+            "mean_percentage": round(float(mean_percentage[g]), 2),
+            "quantiles": np.round(quantiles[g], 2).tolist(),
+            "percentage_histogram": percentage_histogram[g].tolist(),
+            "score_histogram": score_histogram[g].tolist(),
+        }
+        for g, label in enumerate(labels)
+        if users[g] > 0
+    }
+
+
+def compute_score_snapshot(columns: ScoreColumns, min_group_users: int = MIN_GROUP_USERS,
+                           max_groups: int = MAX_GROUPS) -> dict:
+    n_interviews = len(columns.interview_user)
+    role_experience = columns.interview_role.astype(np.int64) * max(len(columns.experiences), 1) \
+        + columns.interview_experience
+    dimensions = [
+        (np.zeros(n_interviews, dtype=np.int64), ["all"]),
+        (columns.interview_role.astype(np.int64), [f"role:{r}" for r in columns.roles]),
+        (columns.interview_experience.astype(np.int64), [f"experience:{e}" for e in columns.experiences]),
+        (role_experience, [f"role_experience:{r}|{e}" for r in columns.roles for e in columns.experiences]),
+    ]
+    groups = {}
+    for interview_group, labels in dimensions:
+        groups.update(group_distributions(columns, interview_group, labels))
+
+    # Small groups would make percentiles noisy and single users identifiable
+    eligible = {label: group for label, group in groups.items() if group["users"] >= min_group_users}
+    if len(eligible) > max_groups:
+        largest = sorted(eligible, key=lambda label: (label != "all", -eligible[label]["users"]))[:max_groups]
+        eligible = {label: eligible[label] for label in largest}
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "users": len(columns.users),
+        "interviews": n_interviews,
+        "answers": len(columns.answer_score),
+        "min_group_users": min_group_users,
+        "groups": eligible,
+    }
+
+
+def publish_score_snapshot(db, snapshot: dict) -> None:
+    db.collection(ANALYTICS_COLLECTION).document(SCORE_SNAPSHOT_ID).set({
+        **snapshot,
+        "generated_at": firestore.SERVER_TIMESTAMP,
+    })
@@ -0,0 +1,219 @@
+# ai-interview-coach-backend/services/session_cache.py
+import asyncio
+import copy
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from services.firebase_app import firestore
+
+from services.interview_turns import TurnConflictError, assemble_interview
+from services.metrics import record_cache
+
+
+def _resolve_sentinels(updates: dict) -> dict:
+    now = datetime.now(timezone.utc)
+    return {key: (now if value is firestore.SERVER_TIMESTAMP else value) for key, value in updates.items()}
+
+
+class SessionWriteError(Exception):
+    """Raised when turns a background write couldn't save are still unsaved; the client should retry."""
+    status_code = 503
+    retry_after = 2
+
+
+class ActiveSessionCache:
+    """
+    In-process cache of in-progress interviews: the header plus the turns the next-question
+    prompt needs, so /answer doesn't re-read what this process wrote a few seconds earlier.
+
+    Entries are keyed by interview id, only served to the owning uid, and bounded by TTL and
+    LRU size. Turn writes go through `commit_turn`: write-through by default, or write-behind
+    (SESSION_CACHE_WRITE_BEHIND=true) where one background writer per session applies them in
+    order. A failed background write keeps its turn and the ones queued after it; the next request
+    on that session retries them and fails with SessionWriteError while storage still refuses.
+    A session answered on another worker shows up as a TurnConflictError on write; callers then
+    `invalidate` and reload from storage.
+    """
+
+    def __init__(self, ttl_seconds: int = 1800, max_entries: int = 2000, write_behind: bool = False):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.write_behind = write_behind
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._writers: dict[str, asyncio.Task] = {}
+        self._pending: dict[str, list] = {}
+        self._failed: dict[str, Exception] = {}
+        self.hits = 0
+        self.misses = 0
+        self.write_failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, interview_id: str, uid: str) -> dict | None:
+        """The interview assembled from the cached header and turns, or None (fall back to storage)."""
+        entry = self._entries.get(interview_id)
+        if entry is not None and entry["expires_at"] <= time.monotonic() and not self._unsaved(interview_id):
+            del self._entries[interview_id]
+            entry = None
+        if entry is None or entry["uid"] != uid:
+            self.misses += 1
+            record_cache("session", False)
+            return None
+        self._entries.move_to_end(interview_id)
+        self.hits += 1
+        record_cache("session", True)
+        return assemble_interview(copy.deepcopy(entry["header"]), copy.deepcopy(entry["turns"]), entry["offset"])
+
+    def put(self, interview_id: str, header: dict, turns: list[dict], offset: int) -> None:
+        if not self.enabled or not header.get("is_active"):
+            return
+        self._entries[interview_id] = {
+            "uid": header.get("user_uid"),
+            "header": copy.deepcopy(header),
+            "turns": copy.deepcopy(turns),
+            "offset": offset,
+            "expires_at": time.monotonic() + self.ttl_seconds
+        }
+        self._entries.move_to_end(interview_id)
+        self._evict()
+
+    def _evict(self) -> None:
+        # Sessions with writes still queued are never evicted
+        for interview_id in list(self._entries):
+            if len(self._entries) <= self.max_entries:
+                break
+            if not self._unsaved(interview_id):
+                del self._entries[interview_id]
+
+    def _unsaved(self, interview_id: str) -> bool:
+        return interview_id in self._writers or interview_id in self._pending
+
+    def _apply_turn(self, interview_id: str, turn: dict, header_updates: dict, keep_from: int) -> None:
+        entry = self._entries.get(interview_id)
+        if entry is None:
+            return
+        entry["header"].update(copy.deepcopy(_resolve_sentinels(header_updates)))
+        entry["turns"].append(copy.deepcopy(_resolve_sentinels(turn)))
+        # Turns folded into the rolling summary are no longer needed for the prompt
+        entry["turns"] = [t for t in entry["turns"] if t["index"] >= keep_from]
+        entry["offset"] = max(entry["offset"], keep_from)
+        entry["expires_at"] = time.monotonic() + self.ttl_seconds
+
+    async def commit_turn(self, interview_id: str, turn: dict, header_updates: dict, keep_from: int, write) -> None:
+        """Persist a turn with `write()` (a coroutine function) and apply it to the cached session."""
+        if not self.write_behind or interview_id not in self._entries:
+            await write()
+            self._apply_turn(interview_id, turn, header_updates, keep_from)
+            return
+
+        # Never queue turn n+1 behind a turn that couldn't be saved
+        await self.recover(interview_id)
+        self._apply_turn(interview_id, turn, header_updates, keep_from)
+        self._pending.setdefault(interview_id, []).append(write)
+        self._start_writer(interview_id)
+
+    def _start_writer(self, interview_id: str) -> asyncio.Task:
+        writer = self._writers.get(interview_id)
+        if writer is not None and not writer.done():
+            return writer
+        task = asyncio.create_task(self._drain(interview_id))
+        self._writers[interview_id] = task
+
+        def _done(t):
+            if self._writers.get(interview_id) is t:
+                del self._writers[interview_id]
+        task.add_done_callback(_done)
+        return task
+
+    async def _drain(self, interview_id: str) -> None:
+        # Queued writes are applied in order and only dropped once stored; a failure stops the
+        # queue and leaves it (failed write first) for `recover`
+        pending = self._pending.get(interview_id, [])
+        while pending:
+            try:
+                await pending[0]()
+            except TurnConflictError as e:
+                # Another worker already holds these turns; nothing queued here can be written any more
+                self.write_failures += 1
+                print(f"[ERROR] Background turn write for {interview_id} conflicted, dropping {len(pending)} queued turn(s): {e}")
+                self._pending.pop(interview_id, None)
+                self._entries.pop(interview_id, None)
+                self._failed[interview_id] = e
+                return
+            except Exception as e:
+                self.write_failures += 1
+                print(f"[ERROR] Background turn write failed for {interview_id}, {len(pending)} turn(s) kept queued: {e}")
+                self._failed[interview_id] = e
+                return
+            pending.pop(0)
+        self._pending.pop(interview_id, None)
+
+    async def recover(self, interview_id: str) -> None:
+        """
+        Retry the writes a failed background write left queued. Raises SessionWriteError if they
+        still fail (the queue is kept for the next attempt), or the TurnConflictError once if another
+        worker wrote the session meanwhile (the cache entry is gone and the next request reloads).
+        """
+        error = self._failed.pop(interview_id, None)
+        if error is None:
+            return
+        if isinstance(error, TurnConflictError):
+            raise error
+        await asyncio.shield(self._start_writer(interview_id))
+        if interview_id in self._failed:
+            raise SessionWriteError(f"Earlier answers of interview {interview_id} are not saved yet.")
+
+    async def flush(self, interview_id: str) -> None:
+        """
+        Wait for queued writes of a session before reading it from storage. Raises SessionWriteError
+        when some turns still can't be saved; a conflict is left for the session's next answer to report.
+        """
+        writer = self._writers.get(interview_id)
+        if writer is not None:
+            await asyncio.gather(writer, return_exceptions=True)
+        if not isinstance(self._failed.get(interview_id), TurnConflictError):
+            await self.recover(interview_id)
+
+    async def flush_all(self) -> None:
+        if self._writers:
+            await asyncio.gather(*self._writers.values(), return_exceptions=True)
+        for interview_id in list(self._failed):
+            try:
+                await self.recover(interview_id)
+            except Exception as e:
+                print(f"[ERROR] Turns of {interview_id} were never saved: {e}")
+
+    def invalidate(self, interview_id: str) -> None:
+        self._entries.pop(interview_id, None)
+        if isinstance(self._failed.get(interview_id), TurnConflictError):
+            del self._failed[interview_id]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "pending_writes": sum(len(writes) for writes in self._pending.values()),
+            "failed_sessions": len(self._failed),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "write_failures": self.write_failures,
+        }
+
+
+_session_cache: ActiveSessionCache | None = None
+
+
+def get_session_cache() -> ActiveSessionCache:
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = ActiveSessionCache(
+            ttl_seconds=int(os.getenv("SESSION_CACHE_TTL_SECONDS", "1800")),
+            max_entries=int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "2000")),
+            write_behind=os.getenv("SESSION_CACHE_WRITE_BEHIND", "false").lower() == "true",
+        )
+    return _session_cache
@@ -0,0 +1,59 @@
+# ai-interview-coach-backend/services/single_flight.py
+import asyncio
+
+
+class FlightAbandonedError(Exception):
+    """Set on a claimed flight whose leader stopped before producing a result."""
+    pass
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one execution.
+    The shared work runs as its own task, so a caller disconnecting doesn't cancel it
+    for the others that are waiting on the same result.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+
+    def _register(self, key: str, future: asyncio.Future) -> None:
+        self._calls[key] = future
+
+        def _done(f):
+            if self._calls.get(key) is f:
+                del self._calls[key]
+            if not f.cancelled():
+                f.exception()  # mark retrieved; waiters get it re-raised
+        future.add_done_callback(_done)
+
+    async def do(self, key: str, fn):
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                future = asyncio.ensure_future(fn())
+                self._register(key, future)
+            try:
+                return await asyncio.shield(future)
+            except FlightAbandonedError:
+                # The leader gave up (e.g. its client disconnected); run it ourselves
+                continue
+
+    def get(self, key: str) -> asyncio.Future | None:
+        return self._calls.get(key)
+
+    def claim(self, key: str) -> asyncio.Future | None:
+        """
+        Become the leader for `key` without handing over a coroutine (e.g. a streaming producer).
+        Returns a future the leader must resolve, or None if another call already owns the key.
+        """
+        if key in self._calls:
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self._register(key, future)
+        return future
+
+    @staticmethod
+    def abandon(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_exception(FlightAbandonedError())
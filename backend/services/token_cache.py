@@ -0,0 +1,94 @@
+# ai-interview-coach-backend/services/token_cache.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from services.metrics import record_cache
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of decoded Firebase ID tokens.
+    Entries are keyed by a SHA-256 digest of the raw token (the token itself is never stored)
+    and expire at the token's own `exp` claim, minus a small clock-skew margin.
+    """
+
+    def __init__(self, max_size: int = 10000, skew_seconds: int = 30):
+        self.max_size = max_size
+        self.skew_seconds = skew_seconds
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                record_cache("token", False)
+                return None
+            expires_at, decoded_token = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                record_cache("token", False)
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            record_cache("token", True)
+            # Hand out a copy so callers can't mutate the cached claims
+            return dict(decoded_token)
+
+    def put(self, token: str, decoded_token: dict) -> None:
+        exp = decoded_token.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        expires_at = exp - self.skew_seconds
+        if expires_at <= time.time() or self.max_size <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(decoded_token))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+_token_cache: TokenCache | None = None
+
+
+def get_token_cache() -> TokenCache:
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(
+            max_size=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000")),
+            skew_seconds=int(os.getenv("TOKEN_CACHE_SKEW_SECONDS", "30")),
+        )
+    return _token_cache
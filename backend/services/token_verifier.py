@@ -0,0 +1,249 @@
+# ai-interview-coach-backend/services/token_verifier.py
+import asyncio
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import httpx
+import jwt
+from cryptography.x509 import load_pem_x509_certificate
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+
+
+class InvalidIdTokenError(Exception):
+    """Raised when a Firebase ID token fails verification."""
+    pass
+
+
+def _load_public_keys(certs: dict) -> dict:
+    # Google publishes {kid: PEM certificate}; we only need the public key of each
+    return {
+        kid: load_pem_x509_certificate(pem.encode("utf-8")).public_key()
+        for kid, pem in certs.items()
+    }
+
+
+class StaticKeySet:
+    """
+    Fixed key set, used as a local stand-in for Google's certificates
+    (e.g. a JSON file of {kid: PEM certificate} generated for tests or local runs).
+    """
+
+    def __init__(self, certs: dict):
+        self._keys = _load_public_keys(certs)
+
+    @classmethod
+    def from_file(cls, path: str) -> "StaticKeySet":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    async def get_key(self, kid: str):
+        return self._keys.get(kid)
+
+    def start_background_refresh(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class GoogleCertKeySet:
+    """
+    In-memory copy of Google's securetoken signing certificates.
+    The set is refreshed in the background shortly before the max-age from the
+    Cache-Control header runs out, so request handlers never wait on the fetch
+    except for the very first load or an unknown `kid` (key rotation).
+    """
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL, refresh_margin: int = 300,
+                 min_refetch_interval: int = 30, timeout: float = 5.0):
+        self.url = url
+        self.refresh_margin = refresh_margin
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+        self._keys: dict = {}
+        self._expires_at = 0.0
+        self._last_fetch = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    @staticmethod
+    def _max_age(cache_control: str) -> int:
+        match = re.search(r"max-age=(\d+)", cache_control or "")
+        return int(match.group(1)) if match else 3600
+
+    async def refresh(self) -> None:
+        seen_fetch = self._last_fetch
+        async with self._lock:
+            if self._last_fetch != seen_fetch:
+                # Another caller fetched while this one waited for the lock (cold cache or a burst of
+                # tokens with a new kid): use its keys instead of queueing one fetch per request
+                return
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.url)
+            response.raise_for_status()
+            keys = _load_public_keys(response.json())
+            now = time.time()
+            self._keys = keys
+            self._expires_at = now + self._max_age(response.headers.get("cache-control", ""))
+            self._last_fetch = now
+            print(f"✅ Loaded {len(keys)} Firebase signing keys (valid for {int(self._expires_at - now)}s).")
+
+    async def get_key(self, kid: str):
+        now = time.time()
+        if not self._keys or now >= self._expires_at:
+            await self.refresh()
+        elif kid not in self._keys and now - self._last_fetch >= self.min_refetch_interval:
+            # Unknown kid usually means Google rotated its keys before our copy expired
+            await self.refresh()
+        self.start_background_refresh()
+        return self._keys.get(kid)
+
+    def start_background_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = max(self._expires_at - time.time() - self.refresh_margin, 1)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"[ERROR] Firebase signing key refresh failed: {e}")
+                # Keep serving the current keys and retry shortly
+                await asyncio.sleep(min(60, self.refresh_margin))
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+
+class FirebaseTokenVerifier:
+    """
+    Async verification of Firebase ID tokens, following the checks documented for
+    third-party JWT libraries. The RSA signature check runs on a small dedicated
+    thread pool so it never blocks the event loop.
+    """
+
+    def __init__(self, project_id: str, key_set, max_workers: int = 4, leeway: int = 5):
+        self.project_id = project_id
+        self.key_set = key_set
+        self.leeway = leeway
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="token-verify")
+
+    async def verify(self, token: str) -> dict:
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise InvalidIdTokenError(f"Malformed ID token: {e}") from e
+        if header.get("alg") != "RS256":
+            raise InvalidIdTokenError("ID token has incorrect algorithm.")
+        kid = header.get("kid")
+        if not kid:
+            raise InvalidIdTokenError("ID token has no 'kid' claim.")
+
+        key = await self.key_set.get_key(kid)
+        if key is None:
+            raise InvalidIdTokenError("ID token was signed with an unknown key.")
+
+        decode = partial(
+            jwt.decode,
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=self.project_id,
+            issuer=f"https://securetoken.google.com/{self.project_id}",
+            leeway=self.leeway,
+            options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+        )
+        try:
+            claims = await asyncio.get_running_loop().run_in_executor(self._executor, decode)
+        except jwt.PyJWTError as e:
+            raise InvalidIdTokenError(str(e)) from e
+
+        sub = claims.get("sub")
+        if not isinstance(sub, str) or not sub or len(sub) > 128:
+            raise InvalidIdTokenError("ID token has an invalid 'sub' claim.")
+        auth_time = claims.get("auth_time")
+        if auth_time is not None and auth_time > time.time() + self.leeway:
+            raise InvalidIdTokenError("ID token has an 'auth_time' in the future.")
+        # Same shape as firebase_admin.auth.verify_id_token
+        claims["uid"] = sub
+        return claims
+
+    async def close(self) -> None:
+        await self.key_set.close()
+        self._executor.shutdown(wait=False)
+
+
+class LocalTokenVerifier:
+    """
+    Development/load-test verifier selected with AUTH_BACKEND=local. The bearer token
+    is taken at face value as "<uid>" or "<uid>:<email>"; nothing is checked.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        print("[WARN] AUTH_BACKEND=local: ID tokens are NOT verified. Never use this in production.")
+
+    async def verify(self, token: str) -> dict:
+        uid, _, email = token.partition(":")
+        if not uid or len(uid) > 128:
+            raise InvalidIdTokenError("Local token must be '<uid>' or '<uid>:<email>'.")
+        now = int(time.time())
+        return {
+            "uid": uid,
+            "sub": uid,
+            "email": email or f"{uid}@local.test",
+            "iat": now,
+            "exp": now + self.ttl_seconds,
+        }
+
+    async def close(self) -> None:
+        pass
+
+
+_token_verifier: FirebaseTokenVerifier | LocalTokenVerifier | None = None
+
+
+def _resolve_project_id() -> str:
+    project_id = os.getenv("FIREBASE_PROJECT_ID")
+    if project_id:
+        return project_id
+    from services.firebase_app import ensure_firebase_app
+    return ensure_firebase_app().project_id
+
+
+def get_token_verifier() -> FirebaseTokenVerifier | LocalTokenVerifier:
+    global _token_verifier
+    if _token_verifier is None:
+        backend = os.getenv("AUTH_BACKEND", "firebase").lower()
+        if backend == "local":
+            _token_verifier = LocalTokenVerifier()
+            return _token_verifier
+        if backend != "firebase":
+            raise ValueError(f"Unknown AUTH_BACKEND '{backend}' (expected 'firebase' or 'local').")
+        standin_path = os.getenv("FIREBASE_STANDIN_CERTS_PATH")
+        if standin_path:
+            key_set = StaticKeySet.from_file(standin_path)
+        else:
+            key_set = GoogleCertKeySet(url=os.getenv("FIREBASE_CERTS_URL", GOOGLE_CERTS_URL))
+        _token_verifier = FirebaseTokenVerifier(
+            project_id=_resolve_project_id(),
+            key_set=key_set,
+            max_workers=int(os.getenv("TOKEN_VERIFY_MAX_WORKERS", "4")),
+        )
+    return _token_verifier
+
+
+async def close_token_verifier() -> None:
+    global _token_verifier
+    if _token_verifier is not None:
+        await _token_verifier.close()
+        _token_verifier = None
@@ -0,0 +1,248 @@
+# ai-interview-coach-backend/services/tracing.py
+# Lightweight per-request tracing. The middleware in main.py opens a trace per request; code
+# opens nested spans with `span(...)` or `@traced(...)`. On completion the spans become a
+# Server-Timing header and are handed to the configured exporter:
+#
+#   TRACE_EXPORTER=log   one JSON line per request on stdout (default)
+#   TRACE_EXPORTER=file  JSON lines appended to TRACE_FILE_PATH
+#   TRACE_EXPORTER=otlp  OTLP/HTTP JSON to TRACE_OTLP_ENDPOINT (e.g. a local collector)
+#   TRACE_EXPORTER=none  header only
+#
+# TRACE_MIN_DURATION_MS exports only requests at least that slow. Spans that run after the
+# response headers are sent (the body of a streaming response) are not part of the trace.
+import asyncio
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+
+import httpx
+
+_current_trace: contextvars.ContextVar["Trace | None"] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("current_span", default=None)
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Span:
+    __slots__ = ("span_id", "parent_id", "name", "attrs", "start_ns", "_start", "duration_ms", "error")
+
+    def __init__(self, name: str, parent_id: str | None, attrs: dict):
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        self.duration_ms: float | None = None
+        self.error: str | None = None
+
+    def end(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self) -> dict:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            "attrs": self.attrs,
+            "error": self.error,
+        }
+
+
+class Trace:
+    def __init__(self, method: str, path: str):
+        self.trace_id = _new_id(16)
+        self.root = Span(f"{method} {path}", None, {"http.method": method, "http.path": path})
+        self.spans: list[Span] = []
+
+    def server_timing(self) -> str:
+        # Same-named spans (e.g. several Firestore reads) are summed into one entry
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            if span.duration_ms is not None:
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        entries = [f"{name};dur={dur:.1f}" for name, dur in totals.items()]
+        entries.append(f"total;dur={self.root.duration_ms:.1f}")
+        return ", ".join(entries)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            **self.root.to_dict(),
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+@contextlib.contextmanager
+def span(name: str, **attrs):
+    """Records a nested span in the current request's trace; a no-op outside a request."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get() or trace.root
+    current = Span(name, parent.span_id, attrs)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.end()
+        _current_span.reset(token)
+        trace.spans.append(current)
+
+
+def set_span_attrs(**attrs) -> None:
+    """Adds attributes to the innermost open span (or the request's root span); a no-op outside a request."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    (_current_span.get() or trace.root).attrs.update(attrs)
+
+
+def traced(name: str):
+    """Decorator form of `span` for async functions."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_trace(method: str, path: str) -> tuple[Trace, contextvars.Token]:
+    trace = Trace(method, path)
+    return trace, _current_trace.set(trace)
+
+
+def finish_trace(trace: Trace, token: contextvars.Token) -> None:
+    trace.root.end()
+    _current_trace.reset(token)
+
+
+# --- exporters ---
+class LogExporter:
+    def export(self, trace: Trace) -> None:
+        print(json.dumps({"trace": trace.to_dict()}, default=str))
+
+
+class FileExporter:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _write(self, line: str) -> None:
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_dict(), default=str)
+        # File I/O stays off the event loop
+        asyncio.get_running_loop().run_in_executor(None, self._write, line)
+
+
+class OTLPExporter:
+    """Posts each trace as OTLP/HTTP JSON to `{endpoint}/v1/traces`; failures are logged and dropped."""
+
+    def __init__(self, endpoint: str, service_name: str = "ai-interview-coach-backend", timeout: float = 2):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self._client = httpx.AsyncClient(timeout=timeout)
+        self._pending: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _otlp_span(trace_id: str, span: Span, root: bool) -> dict:
+        otlp = {
+            "traceId": trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 2 if root else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.start_ns + int((span.duration_ms or 0) * 1e6)),
+            "attributes": [{"key": k, "value": {"stringValue": str(v)}} for k, v in span.attrs.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            otlp["parentSpanId"] = span.parent_id
+        return otlp
+
+    def _payload(self, trace: Trace) -> dict:
+        spans = [self._otlp_span(trace.trace_id, trace.root, True)]
+        spans += [self._otlp_span(trace.trace_id, s, False) for s in trace.spans]
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+            "scopeSpans": [{"scope": {"name": "services.tracing"}, "spans": spans}],
+        }]}
+
+    async def _post(self, payload: dict) -> None:
+        try:
+            response = await self._client.post(self.url, json=payload)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"[WARN] OTLP trace export failed: {e}")
+
+    def export(self, trace: Trace) -> None:
+        task = asyncio.get_running_loop().create_task(self._post(self._payload(trace)))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def close(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self._client.aclose()
+
+
+class NullExporter:
+    def export(self, trace: Trace) -> None:
+        pass
+
+
+_exporter = None
+_min_duration_ms = 0.0
+
+
+def get_trace_exporter():
+    global _exporter, _min_duration_ms
+    if _exporter is None:
+        _min_duration_ms = float(os.getenv("TRACE_MIN_DURATION_MS", "0"))
+        kind = os.getenv("TRACE_EXPORTER", "log").lower()
+        if kind == "log":
+            _exporter = LogExporter()
+        elif kind == "file":
+            _exporter = FileExporter(os.getenv("TRACE_FILE_PATH", "traces.jsonl"))
+        elif kind == "otlp":
+            _exporter = OTLPExporter(os.getenv("TRACE_OTLP_ENDPOINT", "http://localhost:4318"))
+        elif kind == "none":
+            _exporter = NullExporter()
+        else:
+            raise ValueError(f"Unknown TRACE_EXPORTER '{kind}' (expected log, file, otlp or none).")
+    return _exporter
+
+
+async def close_trace_exporter() -> None:
+    # Sends traces still in flight (OTLP) before the process exits
+    global _exporter
+    if _exporter is not None and hasattr(_exporter, "close"):
+        await _exporter.close()
+    _exporter = None
+
+
+def export_trace(trace: Trace) -> None:
+    try:
+        exporter = get_trace_exporter()
+        if trace.root.duration_ms is not None and trace.root.duration_ms < _min_duration_ms:
+            return
+        exporter.export(trace)
+    except Exception as e:
+        print(f"[WARN] Trace export failed: {e}")
@@ -0,0 +1,13 @@
+# ai-interview-coach-backend/tests/conftest.py
+# Tests run against the in-process backends (in-memory storage, fake LLM, local auth), so no
+# Firebase project or Gemini key is needed. Run from backend/: python -m pytest -q
+import os
+import sys
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+os.environ.setdefault("LLM_BACKEND", "fake")
+os.environ.setdefault("AUTH_BACKEND", "local")
+os.environ.setdefault("TRACE_EXPORTER", "none")
+os.environ.setdefault("STARTUP_WARMUP", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
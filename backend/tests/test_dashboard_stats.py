@@ -0,0 +1,54 @@
+# ai-interview-coach-backend/tests/test_dashboard_stats.py
+# Per-user stats document: the first completion recorded for a user without one is built from the
+# whole history, and every interview is counted once.
+import asyncio
+
+from services.dashboard_stats import format_stats
+from services.memory_repository import InMemoryRepository
+
+
+def _finished_interview(uid: str, role: str, scores: list[int]) -> dict:
+    return {
+        "user_uid": uid,
+        "role": role,
+        "is_active": False,
+        "questions": [{"text": f"Q{i}"} for i in range(len(scores))],
+        "answers": [{"text": f"A{i}"} for i in range(len(scores))],
+        "evaluation": [{"score": score} for score in scores],
+    }
+
+
+def test_missing_stats_are_rebuilt_from_history():
+    async def scenario():
+        repo = InMemoryRepository()
+        # Finished before the stats document existed, never recorded
+        await repo.add_interview(_finished_interview("u1", "Backend", [8, 6]))
+        await repo.add_interview(_finished_interview("u1", "Frontend", [10]))
+        latest = await repo.add_interview(_finished_interview("u1", "Backend", [4, 4]))
+
+        summary = await repo.record_completed_interview(latest)
+        # Recording again (both /end and /overall-feedback do) must not double count
+        await repo.record_completed_interview(latest)
+        return summary, await repo.get_user_stats("u1")
+
+    summary, stats = asyncio.run(scenario())
+    assert summary["total_score"] == 8
+    assert stats["total_interviews"] == 3
+    assert stats["total_score"] == 32
+    assert stats["total_max_score"] == 50
+    assert stats["roles"]["Backend"]["total_interviews"] == 2
+    assert format_stats(stats) == {"total_interviews": 3, "average_score": 64.0, "best_score": 100.0}
+
+
+def test_completion_is_added_to_existing_stats():
+    async def scenario():
+        repo = InMemoryRepository()
+        first = await repo.add_interview(_finished_interview("u2", "Backend", [5]))
+        await repo.record_completed_interview(first)
+        second = await repo.add_interview(_finished_interview("u2", "Backend", [9]))
+        await repo.record_completed_interview(second)
+        return await repo.get_user_stats("u2")
+
+    stats = asyncio.run(scenario())
+    assert stats["total_interviews"] == 2
+    assert stats["total_score"] == 14
@@ -0,0 +1,140 @@
+# ai-interview-coach-backend/tests/test_deferred_evaluation.py
+# Deferred evaluation mode: answers are scored in chunked batch calls when the overall feedback
+# is requested, with a per-answer fallback for whatever a batch response leaves out.
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from agents import fake_model
+from agents import interview_agent
+from agents.interview_agent import _batch_chunks, evaluate_answers_batch
+from routes import interview as interview_routes
+from services.repository import get_repository
+
+BATCH_MARKER = "OUTPUT (valid JSON array only"
+SINGLE_MARKER = "OUTPUT (valid JSON only"
+
+
+def _items(sizes: list[int]) -> list[dict]:
+    return [{"index": i, "question": "q" * size, "answer": ""} for i, size in enumerate(sizes)]
+
+
+def _answers(n: int) -> list[tuple[str, str]]:
+    # Unique, long enough to reach Gemini (the fake model) rather than the prescorer
+    return [(f"How would you design feature {i}?",
+             f"{uuid.uuid4().hex} I would start from the access patterns, pick the storage accordingly, "
+             f"add caching in front of the hot reads and measure before optimising further, step {i}.")
+            for i in range(n)]
+
+
+@pytest.fixture
+def model_prompts(monkeypatch):
+    """Prompts the fake model receives; no evaluation cache or prescorer in between."""
+    monkeypatch.setenv("EVAL_CACHE_BACKEND", "none")
+    monkeypatch.setenv("PRESCORER_ENABLED", "false")
+    prompts = []
+    fake_text = fake_model._fake_text
+
+    def recording_fake_text(prompt):
+        prompts.append(prompt)
+        return fake_text(prompt)
+
+    monkeypatch.setattr(fake_model, "_fake_text", recording_fake_text)
+    return prompts
+
+
+def test_chunks_are_bounded_by_item_count_and_size(monkeypatch):
+    monkeypatch.setattr(interview_agent, "BATCH_EVAL_MAX_ITEMS", 2)
+    monkeypatch.setattr(interview_agent, "BATCH_EVAL_MAX_CHARS", 100)
+    assert [len(chunk) for chunk in _batch_chunks(_items([10] * 5))] == [2, 2, 1]
+    # An item over the size limit still gets a chunk of its own
+    assert [[item["index"] for item in chunk] for chunk in _batch_chunks(_items([60, 50, 150, 10]))] \
+        == [[0], [1], [2], [3]]
+
+
+def test_batch_scores_all_answers_in_chunked_calls(monkeypatch, model_prompts):
+    monkeypatch.setattr(interview_agent, "BATCH_EVAL_MAX_ITEMS", 2)
+    answers = _answers(5)
+    results = asyncio.run(evaluate_answers_batch("Backend Developer", "2 years", answers))
+    assert results == [fake_model._fake_evaluation(answer) for _, answer in answers]
+    assert sum(BATCH_MARKER in prompt for prompt in model_prompts) == 3
+    assert not any(SINGLE_MARKER in prompt for prompt in model_prompts)
+
+
+def test_unparseable_chunk_falls_back_to_single_evaluations(monkeypatch, model_prompts):
+    monkeypatch.setattr(interview_agent, "BATCH_EVAL_MAX_ITEMS", 2)
+    fake_text = fake_model._fake_text
+
+    def broken_first_chunk(prompt):
+        # The chunk holding answer 0 comes back as prose instead of a JSON array
+        if BATCH_MARKER in prompt and '"index": 0' in prompt:
+            return "Here are the evaluations you asked for."
+        return fake_text(prompt)
+
+    monkeypatch.setattr(fake_model, "_fake_text", broken_first_chunk)
+    answers = _answers(3)
+    results = asyncio.run(evaluate_answers_batch("Backend Developer", "2 years", answers))
+    assert results == [fake_model._fake_evaluation(answer) for _, answer in answers]
+    single = [prompt for prompt in model_prompts if SINGLE_MARKER in prompt]
+    assert len(single) == 2
+    assert all(answers[0][1] in prompt or answers[1][1] in prompt for prompt in single)
+
+
+def test_answers_missing_from_a_batch_response_are_evaluated_one_by_one(monkeypatch, model_prompts):
+    fake_text = fake_model._fake_text
+
+    def drop_last_entry(prompt):
+        text = fake_text(prompt)
+        return json.dumps(json.loads(text)[:-1]) if BATCH_MARKER in prompt else text
+
+    monkeypatch.setattr(fake_model, "_fake_text", drop_last_entry)
+    answers = _answers(3)
+    results = asyncio.run(evaluate_answers_batch("Backend Developer", "2 years", answers))
+    assert results == [fake_model._fake_evaluation(answer) for _, answer in answers]
+    single = [prompt for prompt in model_prompts if SINGLE_MARKER in prompt]
+    assert len(single) == 1 and answers[2][1] in single[0]
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_deferred_scores_are_saved_before_the_overall_feedback(client, monkeypatch):
+    uid = f"deferred-{uuid.uuid4().hex[:8]}"
+    headers = {"Authorization": f"Bearer {uid}:{uid}@local.test"}
+    started = client.post("/interview/start", headers=headers, json={
+        "role": "Backend Developer", "experience": "2 years", "num_questions": 2, "evaluation_mode": "deferred"
+    }).json()
+    interview_id = started["interview_id"]
+    question = started["first_question"]
+    for _, answer in _answers(2):
+        response = client.post("/interview/answer", headers=headers, json={
+            "interview_id": interview_id, "question_text": question, "answer_text": answer
+        })
+        assert response.json()["evaluation_feedback"] is None
+        question = response.json()["next_question"]
+    repo = get_repository()
+    assert client.portal.call(repo.get_interview, interview_id)["pending_evaluations"] == 2
+
+    stored_when_generating = {}
+    generate_overall_feedback = interview_routes.generate_overall_feedback
+
+    async def feedback_after_checking_storage(feedback_input):
+        stored_when_generating["header"] = await repo.get_interview(interview_id)
+        stored_when_generating["turns"] = await repo.get_turns(interview_id)
+        return await generate_overall_feedback(feedback_input)
+
+    monkeypatch.setattr(interview_routes, "generate_overall_feedback", feedback_after_checking_storage)
+    response = client.post("/interview/overall-feedback", headers=headers, json={"interview_id": interview_id})
+    assert response.status_code == 200
+
+    assert stored_when_generating["header"]["pending_evaluations"] == 0
+    evaluations = [turn["evaluation"] for turn in stored_when_generating["turns"]]
+    assert all(isinstance(evaluation["score"], int) and "deferred" not in evaluation for evaluation in evaluations)
+    assert response.json()["per_question_scores"] == [evaluation["score"] for evaluation in evaluations]
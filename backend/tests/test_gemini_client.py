@@ -0,0 +1,171 @@
+# ai-interview-coach-backend/tests/test_gemini_client.py
+# ResilientGeminiClient and its circuit breaker: error mapping, retries, the failure threshold,
+# failing fast while open, the half-open trial (also when it is cancelled) and the backoff cap.
+import asyncio
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from agents import gemini_client
+from agents.gemini_client import (
+    CircuitBreaker,
+    GeminiQuotaExceededError,
+    GeminiTimeoutError,
+    GeminiUnavailableError,
+    ResilientGeminiClient,
+)
+
+
+def _client(threshold: int = 3, reset_timeout: float = 3600, max_retries: int = 0, timeout: float = 5) -> ResilientGeminiClient:
+    return ResilientGeminiClient(timeout=timeout, max_retries=max_retries, backoff_base=0,
+                                 breaker=CircuitBreaker(failure_threshold=threshold, reset_timeout=reset_timeout))
+
+
+class Calls:
+    """Call counter for a fake Gemini call that raises `error` (or returns "ok")."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.count = 0
+
+    async def __call__(self):
+        self.count += 1
+        if self.error is not None:
+            raise self.error
+        return "ok"
+
+
+@pytest.mark.parametrize("raised, expected, status", [
+    (google_exceptions.ResourceExhausted("quota"), GeminiQuotaExceededError, 429),
+    (google_exceptions.TooManyRequests("slow down"), GeminiQuotaExceededError, 429),
+    (google_exceptions.ServiceUnavailable("down"), GeminiUnavailableError, 503),
+    (google_exceptions.InternalServerError("boom"), GeminiUnavailableError, 503),
+])
+def test_api_errors_map_to_http_statuses(raised, expected, status):
+    client = _client()
+    with pytest.raises(expected) as excinfo:
+        asyncio.run(client._call(Calls(raised), None))
+    assert excinfo.value.status_code == status
+
+
+def test_quota_errors_carry_a_retry_after():
+    assert GeminiQuotaExceededError("quota").retry_after == 30
+
+
+def test_timeouts_map_to_504():
+    async def hang():
+        await asyncio.sleep(10)
+
+    with pytest.raises(GeminiTimeoutError) as excinfo:
+        asyncio.run(_client()._call(hang, 0.01))
+    assert excinfo.value.status_code == 504
+
+
+def test_retryable_errors_are_retried_and_count_once_towards_the_breaker():
+    client = _client(max_retries=2)
+    calls = Calls(google_exceptions.ServiceUnavailable("down"))
+    with pytest.raises(GeminiUnavailableError):
+        asyncio.run(client._call(calls, None))
+    assert calls.count == 3
+    assert client.breaker.failures == 1
+
+
+def test_other_errors_are_raised_unchanged_and_do_not_count():
+    client = _client()
+    with pytest.raises(ValueError):
+        asyncio.run(client._call(Calls(ValueError("bad request")), None))
+    assert client.breaker.failures == 0
+    assert client.breaker.state == "closed"
+
+
+def test_breaker_opens_at_the_threshold_and_then_fails_fast():
+    client = _client(threshold=3)
+    calls = Calls(google_exceptions.ServiceUnavailable("down"))
+    for _ in range(2):
+        with pytest.raises(GeminiUnavailableError):
+            asyncio.run(client._call(calls, None))
+        assert client.breaker.state == "closed"
+    with pytest.raises(GeminiUnavailableError):
+        asyncio.run(client._call(calls, None))
+    assert client.breaker.state == "open"
+
+    healthy = Calls()
+    with pytest.raises(GeminiUnavailableError, match="circuit open"):
+        asyncio.run(client._call(healthy, None))
+    assert healthy.count == 0
+
+
+def test_success_resets_the_failure_count():
+    client = _client(threshold=2)
+    with pytest.raises(GeminiUnavailableError):
+        asyncio.run(client._call(Calls(google_exceptions.ServiceUnavailable("down")), None))
+    assert asyncio.run(client._call(Calls(), None)) == "ok"
+    assert client.breaker.failures == 0
+
+
+def _open(client: ResilientGeminiClient) -> None:
+    for _ in range(client.breaker.failure_threshold):
+        with pytest.raises(GeminiUnavailableError):
+            asyncio.run(client._call(Calls(google_exceptions.ServiceUnavailable("down")), None))
+    # Past the reset timeout: the next call is the half-open trial
+    client.breaker.reset_timeout = 0
+    assert client.breaker.state == "half_open"
+
+
+def test_half_open_lets_one_trial_through_and_closes_on_success():
+    client = _client(threshold=1)
+    _open(client)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def trial():
+            await release.wait()
+            return "ok"
+
+        task = asyncio.create_task(client._call(trial, None))
+        await asyncio.sleep(0)
+        with pytest.raises(GeminiUnavailableError, match="half-open"):
+            await client._call(Calls(), None)
+        release.set()
+        return await task
+
+    assert asyncio.run(scenario()) == "ok"
+    assert client.breaker.state == "closed"
+
+
+def test_failed_trial_reopens_the_breaker():
+    client = _client(threshold=1)
+    _open(client)
+    with pytest.raises(GeminiUnavailableError):
+        asyncio.run(client._call(Calls(google_exceptions.ServiceUnavailable("down")), None))
+    client.breaker.reset_timeout = 3600
+    assert client.breaker.state == "open"
+
+
+def test_cancelled_trial_releases_the_half_open_slot():
+    client = _client(threshold=1)
+    _open(client)
+
+    async def scenario():
+        async def hang():
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(client._call(hang, None))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Without the release every later call would fail fast forever
+        return await client._call(Calls(), None)
+
+    assert asyncio.run(scenario()) == "ok"
+    assert client.breaker.state == "closed"
+
+
+def test_backoff_grows_exponentially_up_to_the_cap(monkeypatch):
+    client = ResilientGeminiClient(backoff_base=0.5, backoff_max=4)
+    monkeypatch.setattr(gemini_client.random, "uniform", lambda low, high: high)
+    assert [client._backoff(attempt) for attempt in range(6)] == [0.5, 1, 2, 4, 4, 4]
+    monkeypatch.undo()
+    assert all(0 <= client._backoff(10) <= 4 for _ in range(200))
@@ -0,0 +1,36 @@
+# ai-interview-coach-backend/tests/test_http_cache.py
+# Conditional GET on interview reads: the ETag is weak (shared by every content-coding) and a
+# matching If-None-Match, strong or weak, gets a 304.
+import uuid
+
+from fastapi.testclient import TestClient
+
+import main
+from services.http_cache import etag_matches, interview_etag
+
+
+def test_interview_etag_is_weak_and_matches_either_form():
+    etag = interview_etag({"is_active": False, "turn_count": 3}, "interview")
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches('"other", ' + etag, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_interview_read_revalidates_with_304():
+    uid = f"etag-{uuid.uuid4().hex[:8]}"
+    headers = {"Authorization": f"Bearer {uid}:{uid}@local.test", "Accept-Encoding": "gzip, br"}
+    with TestClient(main.app) as client:
+        started = client.post("/interview/start", headers=headers,
+                              json={"role": "Backend Developer", "experience": "2 years", "num_questions": 2})
+        interview_id = started.json()["interview_id"]
+
+        first = client.get(f"/user/interview/{interview_id}", headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+
+        second = client.get(f"/user/interview/{interview_id}", headers={**headers, "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
@@ -0,0 +1,115 @@
+# ai-interview-coach-backend/tests/test_idempotency.py
+# Idempotency-Key on /interview/start and /interview/answer: a retry replays the first response
+# (and leaves the interview or turn it created alone), also when the retry reaches an instance
+# whose in-process store never saw the key.
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from routes import interview as interview_routes
+from services import idempotency, session_cache
+from services.idempotency import IdempotencyStore
+from services.repository import get_repository
+from services.session_cache import ActiveSessionCache
+
+START_BODY = {"role": "Backend Developer", "experience": "2 years", "num_questions": 3}
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _headers(key: str) -> dict:
+    uid = f"idem-{uuid.uuid4().hex[:8]}"
+    return {"Authorization": f"Bearer {uid}:{uid}@local.test", "Idempotency-Key": key}
+
+
+def test_retry_on_another_instance_replays_start(client, monkeypatch):
+    headers = _headers("start-1")
+    first = client.post("/interview/start", headers=headers, json=START_BODY)
+    assert first.status_code == 200
+
+    # Another instance: empty in-process idempotency store
+    monkeypatch.setattr(idempotency, "_store", IdempotencyStore())
+    retry = client.post("/interview/start", headers=headers, json=START_BODY)
+    assert retry.status_code == 200
+    assert retry.headers.get("idempotent-replayed") == "true"
+    assert retry.json() == first.json()
+
+    interview = client.portal.call(get_repository().get_interview, first.json()["interview_id"])
+    assert interview["is_active"] is True
+
+
+def test_same_key_with_a_different_body_is_rejected(client, monkeypatch):
+    headers = _headers("start-2")
+    assert client.post("/interview/start", headers=headers, json=START_BODY).status_code == 200
+    monkeypatch.setattr(idempotency, "_store", IdempotencyStore())
+    response = client.post("/interview/start", headers=headers, json={**START_BODY, "num_questions": 5})
+    assert response.status_code == 422
+
+
+def test_new_key_starts_a_new_interview_and_ends_the_previous_one(client):
+    headers = _headers("start-3")
+    first = client.post("/interview/start", headers=headers, json=START_BODY).json()
+    second = client.post("/interview/start", headers={**headers, "Idempotency-Key": "start-4"}, json=START_BODY).json()
+    assert second["interview_id"] != first["interview_id"]
+    previous = client.portal.call(get_repository().get_interview, first["interview_id"])
+    assert previous["is_active"] is False
+
+
+def _answer_body(interview_id: str, question: str, answer: str = "I would add an index on the foreign key.") -> dict:
+    return {"interview_id": interview_id, "question_text": question, "answer_text": answer}
+
+
+def _another_instance(monkeypatch):
+    # Empty in-process idempotency store and session cache
+    monkeypatch.setattr(idempotency, "_store", IdempotencyStore())
+    monkeypatch.setattr(session_cache, "_session_cache", ActiveSessionCache())
+
+
+def test_answer_retry_on_another_instance_replays_the_saved_turn(client, monkeypatch):
+    headers = _headers("answer-start-1")
+    started = client.post("/interview/start", headers=headers, json=START_BODY).json()
+    body = _answer_body(started["interview_id"], started["first_question"])
+    first = client.post("/interview/answer", headers={**headers, "Idempotency-Key": "answer-1"}, json=body)
+    assert first.status_code == 200
+
+    _another_instance(monkeypatch)
+    retry = client.post("/interview/answer", headers={**headers, "Idempotency-Key": "answer-1"}, json=body)
+    assert retry.status_code == 200
+    assert retry.headers.get("idempotent-replayed") == "true"
+    # The replay carries the evaluation fields stored with the turn
+    expected = first.json()
+    expected["evaluation_feedback"].pop("prescored", None)
+    assert retry.json() == expected
+    assert len(client.portal.call(get_repository().get_turns, started["interview_id"])) == 1
+
+    reused = client.post("/interview/answer", headers={**headers, "Idempotency-Key": "answer-1"},
+                         json={**body, "answer_text": "Something else entirely."})
+    assert reused.status_code == 422
+
+
+def test_concurrent_answer_retry_replays_the_turn_that_won(client, monkeypatch):
+    headers = _headers("answer-start-2")
+    started = client.post("/interview/start", headers=headers, json=START_BODY).json()
+    body = _answer_body(started["interview_id"], started["first_question"])
+    monkeypatch.setattr(session_cache, "_session_cache", ActiveSessionCache(max_entries=0))
+    evaluate = interview_routes._evaluate
+
+    async def evaluate_while_the_first_attempt_saves(interview_data, data):
+        evaluation = await evaluate(interview_data, data)
+        # The first attempt, on another instance, saves the turn while this one is still evaluating
+        await interview_routes._save_turn(data.interview_id, interview_data, data, evaluation,
+                                          "What would you change first?", idempotency_key="answer-2")
+        return evaluation
+
+    monkeypatch.setattr(interview_routes, "_evaluate", evaluate_while_the_first_attempt_saves)
+    retry = client.post("/interview/answer", headers={**headers, "Idempotency-Key": "answer-2"}, json=body)
+    assert retry.status_code == 200
+    assert retry.headers.get("idempotent-replayed") == "true"
+    assert retry.json()["next_question"] == "What would you change first?"
+    assert len(client.portal.call(get_repository().get_turns, started["interview_id"])) == 1
@@ -0,0 +1,140 @@
+# ai-interview-coach-backend/tests/test_interview_streams.py
+# SSE endpoints against the fake streaming model (LLM_BACKEND=fake) and the in-memory repository.
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from agents import fake_model
+from agents.gemini_client import GeminiUnavailableError
+from agents.interview_agent import EXTRACT_FAILED_TEXT
+from routes import interview as interview_routes
+from services.repository import get_repository
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _auth() -> dict:
+    uid = f"stream-{uuid.uuid4().hex[:8]}"
+    return {"Authorization": f"Bearer {uid}:{uid}@local.test"}
+
+
+def _events(response) -> list[tuple[str, object]]:
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _start(client, headers, num_questions=2) -> dict:
+    response = client.post("/interview/start", headers=headers,
+                           json={"role": "Backend Developer", "experience": "2 years", "num_questions": num_questions})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _answer(client, headers, interview_id, question):
+    return client.post("/interview/answer/stream", headers=headers, json={
+        "interview_id": interview_id,
+        "question_text": question,
+        "answer_text": "I would put a token bucket per API key in Redis and reject requests with 429 once it is empty.",
+    })
+
+
+def test_answer_stream_emits_tokens_then_evaluation_then_done_and_persists_turn(client):
+    headers = _auth()
+    started = _start(client, headers)
+    interview_id = started["interview_id"]
+
+    response = _answer(client, headers, interview_id, started["first_question"])
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    names = [name for name, _ in events]
+    assert names[0] == "token"
+    assert names[-2:] == ["evaluation", "done"]
+    assert set(names[:-2]) == {"token"}
+    streamed = "".join(data for name, data in events if name == "token").strip()
+    assert events[-1][1]["next_question"] == streamed
+
+    turns = client.portal.call(get_repository().get_turns, interview_id)
+    assert len(turns) == 1
+    assert turns[0]["answer"]["text"].startswith("I would put a token bucket")
+    assert turns[0]["evaluation"]["score"] is not None
+
+
+def test_answer_stream_reports_model_failure(client, monkeypatch):
+    headers = _auth()
+    started = _start(client, headers)
+
+    async def failing_stream(*args, **kwargs):
+        raise GeminiUnavailableError("Gemini server error: unavailable")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(interview_routes, "stream_next_question", failing_stream)
+    events = _events(_answer(client, headers, started["interview_id"], started["first_question"]))
+    assert events[-1][0] == "error"
+    assert events[-1][1]["stage"] == "next_question"
+    assert events[-1][1]["status"] == 503
+    assert "done" not in [name for name, _ in events]
+    assert client.portal.call(get_repository().get_turns, started["interview_id"]) == []
+
+
+def test_answer_stream_without_text_saves_the_non_streaming_fallback(client, monkeypatch):
+    headers = _auth()
+    started = _start(client, headers)
+    fake_text = fake_model._fake_text
+    monkeypatch.setattr(fake_model, "_fake_text",
+                        lambda prompt: "" if "What is the next question?" in prompt else fake_text(prompt))
+
+    events = _events(_answer(client, headers, started["interview_id"], started["first_question"]))
+    assert "token" not in [name for name, _ in events]
+    assert events[-1] == ("done", {"message": "Answer submitted and next question generated successfully",
+                                   "next_question": EXTRACT_FAILED_TEXT})
+    stored = client.portal.call(get_repository().get_interview, started["interview_id"])
+    assert stored["current_question"]["text"] == EXTRACT_FAILED_TEXT
+
+
+def test_overall_feedback_stream_emits_scores_tokens_done_and_persists(client):
+    headers = _auth()
+    started = _start(client, headers, num_questions=1)
+    interview_id = started["interview_id"]
+    _answer(client, headers, interview_id, started["first_question"])
+
+    response = client.post("/interview/overall-feedback/stream", headers=headers, json={"interview_id": interview_id})
+    events = _events(response)
+    names = [name for name, _ in events]
+    assert names[0] == "scores"
+    assert names[-1] == "done"
+    assert set(names[1:-1]) == {"token"}
+    feedback = events[-1][1]["overall_feedback"]
+    assert feedback == "".join(data for name, data in events if name == "token").strip()
+
+    stored = client.portal.call(get_repository().get_interview, interview_id)
+    assert stored["overall_feedback"] == feedback
+    assert stored["is_active"] is False
+
+
+def test_overall_feedback_stream_reports_model_failure_without_persisting(client, monkeypatch):
+    headers = _auth()
+    started = _start(client, headers, num_questions=1)
+    interview_id = started["interview_id"]
+    _answer(client, headers, interview_id, started["first_question"])
+
+    async def failing_stream(*args, **kwargs):
+        raise GeminiUnavailableError("Gemini server error: unavailable")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(interview_routes, "stream_overall_feedback", failing_stream)
+    events = _events(client.post("/interview/overall-feedback/stream", headers=headers, json={"interview_id": interview_id}))
+    assert [name for name, _ in events] == ["scores", "error"]
+    assert events[-1][1]["status"] == 503
+    stored = client.portal.call(get_repository().get_interview, interview_id)
+    assert not stored.get("overall_feedback")
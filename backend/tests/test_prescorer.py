@@ -0,0 +1,40 @@
+# ai-interview-coach-backend/tests/test_prescorer.py
+# The labelled regression set for agents/prescorer.py (also used by benchmarks/bench_prescorer.py).
+# "expected" is the score the strict rubric gives, or null for answers that must reach the model;
+# "kind" is which local rule should claim the answer.
+import json
+import os
+
+import pytest
+
+from agents.prescorer import prescore_answer
+
+CASES_PATH = os.path.join(os.path.dirname(__file__), "prescorer_cases.json")
+
+with open(CASES_PATH, "r", encoding="utf-8") as f:
+    CASES = json.load(f)
+
+RED_FLAG_KINDS = {
+    "No answer provided.": "non_answer",
+    "Answer copied from the question.": "copied",
+    "Gibberish answer.": "gibberish",
+    "Answer is too short.": "too_short",
+}
+
+
+@pytest.mark.parametrize("case", CASES, ids=[c["answer"][:40] or "<empty>" for c in CASES])
+def test_prescore_matches_labelled_case(case):
+    result = prescore_answer(case["question"], case["answer"])
+    if case["expected"] is None:
+        assert result is None
+        return
+    assert result is not None
+    assert result["score"] == case["expected"]
+    assert result["prescored"] is True
+    assert RED_FLAG_KINDS[result["red_flag"]] == case["kind"]
+
+
+def test_set_covers_every_rule_and_non_latin_answers():
+    kinds = {c["kind"] for c in CASES}
+    assert {"non_answer", "copied", "gibberish", "too_short", None} <= kinds
+    assert any(not c["answer"].isascii() and c["expected"] is None for c in CASES)
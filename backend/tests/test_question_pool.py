@@ -0,0 +1,66 @@
+# ai-interview-coach-backend/tests/test_question_pool.py
+# Refill policy of the first-question warm pool: configured keys are kept filled, free-text pairs
+# only get a pool once they miss twice within the TTL.
+import asyncio
+
+from services.question_pool import FirstQuestionPool
+
+
+def _pool():
+    calls = []
+
+    async def generate(role, experience):
+        calls.append((role, experience))
+        return f"Question {len(calls)} for {role}?"
+
+    return FirstQuestionPool(generate, depth=3, refill_delay=0), calls
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_single_free_text_miss_does_not_generate():
+    async def scenario():
+        pool, calls = _pool()
+        assert pool.take("u1", "Quantum Basket Weaver", "2 years") is None
+        await _settle()
+        await pool.close()
+        return calls
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_second_miss_within_ttl_fills_the_pool():
+    async def scenario():
+        pool, calls = _pool()
+        pool.take("u1", "Data Engineer", "Senior")
+        pool.take("u2", "data engineer", "senior")
+        await _settle()
+        question = pool.take("u3", "Data Engineer", "Senior")
+        await _settle()
+        await pool.close()
+        return question, calls
+
+    question, calls = asyncio.run(scenario())
+    assert question is not None
+    # Filled to depth, then topped up again after the hit
+    assert len(calls) == 4
+
+
+def test_warm_keys_are_filled_and_refilled():
+    async def scenario():
+        pool, calls = _pool()
+        pool.warm([("Backend Developer", "1-3 years")])
+        await _settle()
+        filled = len(calls)
+        question = pool.take("u1", "Backend Developer", "1-3 years")
+        await _settle()
+        await pool.close()
+        return filled, question, calls
+
+    filled, question, calls = asyncio.run(scenario())
+    assert filled == 3
+    assert question is not None
+    assert len(calls) == 4
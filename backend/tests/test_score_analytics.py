@@ -0,0 +1,92 @@
+# ai-interview-coach-backend/tests/test_score_analytics.py
+# Vectorized score analytics against plain NumPy, the dashboard's percentile lookup, and the
+# snapshot's group filtering.
+import numpy as np
+import pytest
+
+from services.dashboard_stats import percentile_rank
+from services.score_analytics import ScoreColumns, compute_score_snapshot, grouped_quantiles
+
+
+def test_grouped_quantiles_match_np_percentile():
+    rng = np.random.default_rng(7)
+    points = np.linspace(0, 100, 101)
+    for _ in range(50):
+        n_groups = int(rng.integers(1, 8))
+        size = int(rng.integers(0, 60))
+        groups = rng.integers(0, n_groups, size)
+        # Rounded values give ties within groups
+        values = np.round(rng.uniform(0, 100, size), int(rng.integers(0, 3)))
+        result = grouped_quantiles(groups, values, n_groups)
+        assert result.shape == (n_groups, 101)
+        for g in range(n_groups):
+            members = values[groups == g]
+            if len(members) == 0:
+                assert np.isnan(result[g]).all()
+            else:
+                np.testing.assert_allclose(result[g], np.percentile(members, points), atol=1e-9)
+
+
+def test_percentile_rank_interpolates_between_quantiles():
+    quantiles = list(np.linspace(0, 100, 101))
+    assert percentile_rank(quantiles, 37.5) == pytest.approx(37.5)
+    assert percentile_rank(quantiles, 50) == pytest.approx(50)
+
+
+def test_percentile_rank_endpoints():
+    quantiles = list(np.linspace(20, 80, 101))
+    assert percentile_rank(quantiles, 5) == 0.0
+    assert percentile_rank(quantiles, 20) == 0.0
+    assert percentile_rank(quantiles, 80) == 100.0
+    assert percentile_rank(quantiles, 95) == 100.0
+
+
+def test_percentile_rank_ties_take_the_middle_of_the_tied_range():
+    # Half of the users scored 0, the rest spread up to 100
+    quantiles = [0.0] * 51 + list(np.linspace(2, 100, 50))
+    assert percentile_rank(quantiles, 0.0) == pytest.approx(25.0)
+    assert percentile_rank([70.0] * 101, 70.0) == pytest.approx(50.0)
+    assert percentile_rank([70.0] * 101, 69.0) == 0.0
+    assert percentile_rank([70.0] * 101, 71.0) == 100.0
+
+
+def _columns(users_per_pair: dict[tuple[int, int], int]) -> ScoreColumns:
+    # One interview with two answers per user
+    interview_user, interview_role, interview_experience = [], [], []
+    for (role, experience), count in users_per_pair.items():
+        for _ in range(count):
+            interview_user.append(len(interview_user))
+            interview_role.append(role)
+            interview_experience.append(experience)
+    n = len(interview_user)
+    return ScoreColumns(
+        users=[f"u{i}" for i in range(n)],
+        roles=["Backend", "Frontend", "Data"],
+        experiences=["Junior", "Senior"],
+        interview_user=np.asarray(interview_user, dtype=np.int32),
+        interview_role=np.asarray(interview_role, dtype=np.int32),
+        interview_experience=np.asarray(interview_experience, dtype=np.int32),
+        answer_interview=np.repeat(np.arange(n, dtype=np.int32), 2),
+        answer_score=np.tile(np.array([4.0, 8.0]), n),
+    )
+
+
+def test_snapshot_leaves_out_groups_below_the_minimum_size():
+    snapshot = compute_score_snapshot(_columns({(0, 0): 12, (1, 1): 3, (2, 0): 10}), min_group_users=10)
+    groups = snapshot["groups"]
+    assert set(groups) == {
+        "all", "role:Backend", "role:Data", "experience:Junior",
+        "role_experience:Backend|Junior", "role_experience:Data|Junior",
+    }
+    assert groups["all"]["users"] == 25
+    assert groups["experience:Junior"]["users"] == 22
+    assert all(group["users"] >= 10 for group in groups.values())
+    assert groups["all"]["quantiles"][50] == 60.0
+    assert (snapshot["users"], snapshot["interviews"], snapshot["answers"]) == (25, 25, 50)
+
+
+def test_snapshot_keeps_all_and_the_largest_groups_under_the_cap():
+    snapshot = compute_score_snapshot(_columns({(0, 0): 12, (1, 1): 3, (2, 0): 10}), min_group_users=1, max_groups=3)
+    groups = snapshot["groups"]
+    assert list(groups) == ["all", "experience:Junior", "role:Backend"]
+    assert [group["users"] for group in groups.values()] == [25, 22, 12]
@@ -0,0 +1,187 @@
+# ai-interview-coach-backend/tests/test_session_cache.py
+# Active-session cache: TTL and LRU bounds, the owner check, a stale cached session reloaded
+# after a turn conflict, and write-behind writes that fail and are retried by the next request.
+import asyncio
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services import session_cache as session_cache_module
+from services.interview_turns import TURN_SCHEMA, TurnConflictError
+from services.repository import get_repository
+from services.session_cache import ActiveSessionCache, SessionWriteError
+
+
+def _header(uid: str = "owner", turn_count: int = 0) -> dict:
+    return {"user_uid": uid, "is_active": True, "turn_schema": TURN_SCHEMA, "turn_count": turn_count,
+            "current_question": {"text": f"Question {turn_count}", "from_ai": True}}
+
+
+def _turn(index: int) -> dict:
+    return {"index": index, "question": {"text": f"Question {index}"}, "answer": {"text": f"Answer {index}"},
+            "evaluation": {"score": 7}}
+
+
+def test_get_serves_only_the_owner():
+    cache = ActiveSessionCache()
+    cache.put("i1", _header("owner"), [], 0)
+    assert cache.get("i1", "someone-else") is None
+    assert cache.get("i1", "owner")["questions"] == [{"text": "Question 0", "from_ai": True}]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_inactive_sessions_are_not_cached():
+    cache = ActiveSessionCache()
+    cache.put("i1", {**_header(), "is_active": False}, [], 0)
+    assert cache.get("i1", "owner") is None
+
+
+def test_expired_entries_are_dropped():
+    cache = ActiveSessionCache(ttl_seconds=0)
+    cache.put("i1", _header(), [], 0)
+    assert cache.get("i1", "owner") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ActiveSessionCache(max_entries=2)
+    cache.put("i1", _header(), [], 0)
+    cache.put("i2", _header(), [], 0)
+    cache.get("i1", "owner")
+    cache.put("i3", _header(), [], 0)
+    assert cache.get("i2", "owner") is None
+    assert cache.get("i1", "owner") is not None
+    assert cache.get("i3", "owner") is not None
+
+
+def test_failed_background_write_keeps_queued_turns_until_a_retry_succeeds():
+    async def scenario():
+        cache = ActiveSessionCache(write_behind=True)
+        cache.put("i1", _header(), [], 0)
+        stored, storage_down = [], True
+
+        def writer(index):
+            async def write():
+                if storage_down:
+                    raise RuntimeError("storage unavailable")
+                stored.append(index)
+            return write
+
+        await cache.commit_turn("i1", _turn(0), {"turn_count": 1}, 0, writer(0))
+        await asyncio.sleep(0)
+        # The session can't take another turn while the first one is unsaved
+        with pytest.raises(SessionWriteError):
+            await cache.commit_turn("i1", _turn(1), {"turn_count": 2}, 0, writer(1))
+        with pytest.raises(SessionWriteError):
+            await cache.flush("i1")
+        assert cache.stats()["pending_writes"] == 1
+        assert cache.stats()["write_failures"] == 3
+        # Unsaved sessions outlive their TTL
+        cache.ttl_seconds = 0
+        cache._entries["i1"]["expires_at"] = 0
+        assert cache.get("i1", "owner")["turn_count"] == 1
+
+        storage_down = False
+        await cache.recover("i1")
+        await cache.commit_turn("i1", _turn(1), {"turn_count": 2}, 0, writer(1))
+        await cache.flush("i1")
+        assert stored == [0, 1]
+        assert cache.stats()["pending_writes"] == 0
+        assert cache.stats()["failed_sessions"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_conflicting_background_write_is_reported_once_and_drops_the_session():
+    async def scenario():
+        cache = ActiveSessionCache(write_behind=True)
+        cache.put("i1", _header(), [], 0)
+
+        async def conflicting_write():
+            raise TurnConflictError("Turn 0 was already submitted.")
+
+        await cache.commit_turn("i1", _turn(0), {"turn_count": 1}, 0, conflicting_write)
+        await cache.flush("i1")
+        assert cache.get("i1", "owner") is None
+        with pytest.raises(TurnConflictError):
+            await cache.recover("i1")
+        await cache.recover("i1")
+        assert cache.stats()["failed_sessions"] == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def _auth() -> dict:
+    uid = f"cache-{uuid.uuid4().hex[:8]}"
+    return {"Authorization": f"Bearer {uid}:{uid}@local.test"}
+
+
+def _start(client, headers) -> dict:
+    response = client.post("/interview/start", headers=headers,
+                           json={"role": "Backend Developer", "experience": "2 years", "num_questions": 5})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _answer(client, headers, interview_id, question):
+    return client.post("/interview/answer", headers=headers, json={
+        "interview_id": interview_id,
+        "question_text": question,
+        "answer_text": "I would shard the queue by tenant and scale consumers on lag.",
+    })
+
+
+def test_stale_cached_session_is_reloaded_after_a_turn_conflict(client, monkeypatch):
+    headers = _auth()
+    started = _start(client, headers)
+    interview_id = started["interview_id"]
+    first = _answer(client, headers, interview_id, started["first_question"])
+    assert first.status_code == 200
+    stale_cache = session_cache_module.get_session_cache()
+
+    # Another worker, with its own cache, answers the next turn
+    monkeypatch.setattr(session_cache_module, "_session_cache", ActiveSessionCache())
+    assert _answer(client, headers, interview_id, first.json()["next_question"]).status_code == 200
+
+    # Back on this worker the cached session is one turn behind: the write conflicts, the
+    # session is reloaded from storage and the answer is saved as the following turn
+    monkeypatch.setattr(session_cache_module, "_session_cache", stale_cache)
+    response = _answer(client, headers, interview_id, first.json()["next_question"])
+    assert response.status_code == 200
+    turns = client.portal.call(get_repository().get_turns, interview_id)
+    assert [turn["index"] for turn in turns] == [0, 1, 2]
+
+
+def test_failed_write_behind_fails_the_next_answer_until_storage_recovers(client, monkeypatch):
+    monkeypatch.setattr(session_cache_module, "_session_cache", ActiveSessionCache(write_behind=True))
+    repo = get_repository()
+    append_turn = repo.append_turn
+
+    async def failing_append_turn(interview_id, turn, header_updates):
+        raise RuntimeError("storage unavailable")
+
+    headers = _auth()
+    started = _start(client, headers)
+    interview_id = started["interview_id"]
+    monkeypatch.setattr(repo, "append_turn", failing_append_turn)
+    first = _answer(client, headers, interview_id, started["first_question"])
+    assert first.status_code == 200
+
+    second = _answer(client, headers, interview_id, first.json()["next_question"])
+    assert second.status_code == 503
+    assert second.headers["retry-after"] == "2"
+
+    monkeypatch.setattr(repo, "append_turn", append_turn)
+    retry = _answer(client, headers, interview_id, first.json()["next_question"])
+    assert retry.status_code == 200
+    client.portal.call(session_cache_module.get_session_cache().flush, interview_id)
+    turns = client.portal.call(repo.get_turns, interview_id)
+    assert [turn["index"] for turn in turns] == [0, 1]
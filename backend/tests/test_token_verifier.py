@@ -0,0 +1,113 @@
+# ai-interview-coach-backend/tests/test_token_verifier.py
+# FirebaseTokenVerifier against a local stand-in key set (the FIREBASE_STANDIN_CERTS_PATH format),
+# and GoogleCertKeySet against a mocked certificate endpoint.
+import asyncio
+import datetime
+import json
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from services import token_verifier
+from services.token_verifier import FirebaseTokenVerifier, GoogleCertKeySet, InvalidIdTokenError, StaticKeySet
+
+PROJECT_ID = "demo-project"
+KID = "test-kid"
+
+
+def _make_key_and_cert():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.test")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = x509.CertificateBuilder() \
+        .subject_name(name) \
+        .issuer_name(name) \
+        .public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()) \
+        .not_valid_before(now - datetime.timedelta(days=1)) \
+        .not_valid_after(now + datetime.timedelta(days=1)) \
+        .sign(key, hashes.SHA256())
+    return key, cert.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+PRIVATE_KEY, CERT_PEM = _make_key_and_cert()
+
+
+def _token(kid: str = KID, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "user-123",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 3600,
+        "auth_time": now,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, PRIVATE_KEY, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture
+def verifier(tmp_path):
+    certs_path = tmp_path / "standin_certs.json"
+    certs_path.write_text(json.dumps({KID: CERT_PEM}), encoding="utf-8")
+    verifier = FirebaseTokenVerifier(PROJECT_ID, StaticKeySet.from_file(str(certs_path)))
+    yield verifier
+    asyncio.run(verifier.close())
+
+
+def test_valid_token(verifier):
+    claims = asyncio.run(verifier.verify(_token()))
+    assert claims["uid"] == "user-123"
+    assert claims["email"] == "user@example.com"
+
+
+def test_wrong_audience(verifier):
+    with pytest.raises(InvalidIdTokenError):
+        asyncio.run(verifier.verify(_token(aud="another-project")))
+
+
+def test_expired_token(verifier):
+    now = int(time.time())
+    with pytest.raises(InvalidIdTokenError):
+        asyncio.run(verifier.verify(_token(iat=now - 7200, exp=now - 3600, auth_time=now - 7200)))
+
+
+def test_unknown_kid(verifier):
+    with pytest.raises(InvalidIdTokenError, match="unknown key"):
+        asyncio.run(verifier.verify(_token(kid="rotated-kid")))
+
+
+def test_concurrent_cold_start_fetches_certificates_once(monkeypatch):
+    fetches = 0
+
+    async def handler(request):
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={KID: CERT_PEM}, headers={"Cache-Control": "public, max-age=3600"})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(token_verifier.httpx, "AsyncClient",
+                        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+
+    async def burst():
+        key_set = GoogleCertKeySet(url="https://certs.test/")
+        try:
+            keys = await asyncio.gather(*(key_set.get_key(KID) for _ in range(20)))
+            # A burst of tokens with a kid the fresh set does not have refetches at most once
+            await asyncio.gather(*(key_set.get_key("rotated-kid") for _ in range(20)))
+        finally:
+            await key_set.close()
+        return keys
+
+    keys = asyncio.run(burst())
+    assert all(key is not None for key in keys)
+    assert fetches == 1